@@ -1,6 +1,5 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jwt.exceptions import ExpiredSignatureError
 
 from app.api.dependencies.db import get_repository
 from app.database.repositories.tokens import TokensRepository
@@ -35,7 +34,7 @@ async def get_user_from_token(
 
         user = await users_repo.get_by_id(user_id=int(payload.sub))
 
-    except ExpiredSignatureError:
+    except jwt_service.errors.ExpiredSignatureError:
         raise AuthTokenExpiredException()
 
     except AuthTokenBlacklistedException:
@@ -3,11 +3,21 @@ from typing import Type, Callable
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.db import get_session
+from app.database.db import get_replica_session, get_session
 from app.database.repositories.base import BaseRepository
 
 
-def get_repository(Repo_type: Type[BaseRepository]) -> Callable:
+def get_repository(Repo_type: Type[BaseRepository], *, replica: bool = False) -> Callable:
+    """Dependency providing a repository on the session of the request.
+
+    With `replica`, the repository reads from the read replica, which may lag behind the primary.
+    Use it for GET routes only, not for writes nor for reads that must see a write just made.
+    """
+    if replica:
+        def get_replica_repo(replica_db: AsyncSession = Depends(get_replica_session)) -> BaseRepository:
+            return Repo_type(replica_db)
+        return get_replica_repo
+
     def get_repo(db: AsyncSession = Depends(get_session)) -> Type[BaseRepository]:
         return Repo_type(db)
     return get_repo
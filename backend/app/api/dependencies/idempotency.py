@@ -0,0 +1,11 @@
+from fastapi import Depends
+
+from app.api.dependencies.db import get_repository
+from app.database.repositories.idempotency_keys import IdempotencyKeysRepository
+from app.services.idempotency import IdempotencyService
+
+
+async def get_idempotency_service(
+        idempotency_repo: IdempotencyKeysRepository = Depends(get_repository(IdempotencyKeysRepository))
+) -> IdempotencyService:
+    return IdempotencyService(idempotency_repo)
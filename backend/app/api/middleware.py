@@ -0,0 +1,129 @@
+import json
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app import config, metrics
+from app.database.instrumentation import QueryStats, query_stats
+
+logger = logging.getLogger("app.requests")
+
+
+class QueryStatsMiddleware:
+    """Accounts the database statements of every HTTP request.
+
+    The totals known when the response starts are sent in a Server-Timing header. A structured
+    log line with the final totals, including statements of background tasks, is written when
+    the request is done. In debug mode, statements repeated `N_PLUS_ONE_THRESHOLD` times or more
+    within a request are logged as a likely N+1 query.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(track_shapes=config.DEBUG)
+        token = query_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", stats.server_timing())
+                headers.append("Server-Timing", f"app;dur={(time.perf_counter() - started) * 1000:.2f}")
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            query_stats.reset(token)
+            self.log(scope, status_code, time.perf_counter() - started, stats)
+
+    @staticmethod
+    def log(scope: Scope, status_code: int, duration: float, stats: QueryStats) -> None:
+        logger.info(json.dumps({
+            "event": "request",
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status_code,
+            "duration_ms": round(duration * 1000, 2),
+            "db_queries": stats.statements,
+            "db_duration_ms": round(stats.duration * 1000, 2),
+            "db_rows": stats.rows,
+        }))
+
+        for statement, count in stats.repeated_shapes(threshold=config.N_PLUS_ONE_THRESHOLD):
+            logger.warning(json.dumps({
+                "event": "n_plus_one",
+                "method": scope["method"],
+                "path": scope["path"],
+                "count": count,
+                "statement": statement,
+            }))
+
+
+class MetricsMiddleware:
+    """Records request latency by route, requests in flight and pending background tasks.
+
+    Latency is measured until the response is sent, before background tasks run. Requests are
+    labelled with the path template of the matched route, so path parameters do not create new
+    label values.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+        responded = False
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status_code, responded
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+            await send(message)
+
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                responded = True
+                self.observe(scope, status_code, started)
+                metrics.background_tasks_pending.inc()
+
+        metrics.http_requests_in_flight.inc()
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            metrics.http_requests_in_flight.dec()
+
+            if responded:
+                metrics.background_tasks_pending.dec()
+            else:
+                self.observe(scope, status_code, started)
+
+    @staticmethod
+    def observe(scope: Scope, status_code: int, started: float) -> None:
+        route = scope.get("route")
+        metrics.http_request_duration.observe(
+            time.perf_counter() - started,
+            method=scope["method"],
+            route=getattr(route, "path", "<unmatched>"),
+            status=str(status_code),
+        )
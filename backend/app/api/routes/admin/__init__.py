@@ -1,10 +1,14 @@
 from fastapi import APIRouter, Depends
 
 from app.api.dependencies.auth import role_required
+from app.api.routes.admin.audit import router as audit_router
 from app.api.routes.admin.clients import router as client_router
 from app.api.routes.admin.countries import router as countries_router
 from app.api.routes.admin.orders import router as orders_router
+from app.api.routes.admin.quotes import router as quotes_router
+from app.api.routes.admin.reports import router as reports_router
 from app.api.routes.admin.services import router as services_router
+from app.api.routes.admin.stats import router as stats_router
 from app.api.routes.admin.urgencies import router as urgencies_router
 from app.api.routes.admin.users import router as users_router
 from app.api.routes.admin.visa_types import router as visa_types_router
@@ -12,6 +16,15 @@ from app.models.users import User
 
 router = APIRouter()
 
+router.include_router(
+    router=audit_router,
+    dependencies=[
+        Depends(role_required(User.ROLE_ADMIN))
+    ],
+    prefix="/audit",
+    tags=["admin-audit"]
+)
+
 router.include_router(
     router=client_router,
     dependencies=[
@@ -39,6 +52,24 @@ router.include_router(
     tags=["admin-orders"]
 )
 
+router.include_router(
+    router=quotes_router,
+    dependencies=[
+        Depends(role_required(User.ROLE_ADMIN))
+    ],
+    prefix="/quotes",
+    tags=["admin-quotes"]
+)
+
+router.include_router(
+    router=reports_router,
+    dependencies=[
+        Depends(role_required(User.ROLE_ADMIN))
+    ],
+    prefix="/reports",
+    tags=["admin-reports"]
+)
+
 router.include_router(
     router=services_router,
     dependencies=[
@@ -48,6 +79,15 @@ router.include_router(
     tags=["admin-services"]
 )
 
+router.include_router(
+    router=stats_router,
+    dependencies=[
+        Depends(role_required(User.ROLE_ADMIN))
+    ],
+    prefix="/stats",
+    tags=["admin-stats"]
+)
+
 router.include_router(
     router=users_router,
     dependencies=[
@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies.db import get_repository
+from app.database.repositories.audit import AuditRepository
+from app.schemas.audit import LogEntryFilterSchema, LogEntryListResponseSchema
+from app.schemas.pagination import KeysetParamsSchema
+
+router = APIRouter()
+
+
+@router.get(
+    path="",
+    response_model=LogEntryListResponseSchema,
+    name="admin:audit-list"
+)
+async def audit_list(
+        query_filters: LogEntryFilterSchema = Depends(),
+        page_params: KeysetParamsSchema = Depends(),
+        audit_repo: AuditRepository = Depends(get_repository(AuditRepository, replica=True))
+):
+    """Retrieve log entries, newest first, based on filter criteria.
+
+    Pagination is keyset based: pass the `next_cursor` of a page as `cursor` to get the
+    next one. The last page has no `next_cursor`.
+
+    Args:
+        query_filters (LogEntryFilterSchema): The filters to apply to the entries.
+        page_params (KeysetParamsSchema): The cursor and the page size.
+        audit_repo (AuditRepository): The repository for accessing log entries.
+
+    Returns:
+        LogEntryListResponseSchema: A page of log entries and the cursor of the next one.
+
+    Raises:
+        InvalidCursorException: If the cursor is invalid.
+    """
+    return await audit_repo.get_list(query_filters=query_filters, cursor=page_params.cursor, size=page_params.size)
+
+
+@router.get(
+    path="/{model_type}/{target_id}",
+    response_model=LogEntryListResponseSchema,
+    name="admin:audit-target-list"
+)
+async def audit_target_list(
+        model_type: str,
+        target_id: int,
+        page_params: KeysetParamsSchema = Depends(),
+        audit_repo: AuditRepository = Depends(get_repository(AuditRepository, replica=True))
+):
+    """Retrieve the history of an object, newest first.
+
+    Args:
+        model_type (str): The model type of the object, e.g. "order".
+        target_id (int): The ID of the object.
+        page_params (KeysetParamsSchema): The cursor and the page size.
+        audit_repo (AuditRepository): The repository for accessing log entries.
+
+    Returns:
+        LogEntryListResponseSchema: A page of log entries and the cursor of the next one.
+
+    Raises:
+        InvalidCursorException: If the cursor is invalid.
+    """
+    return await audit_repo.get_list(
+        query_filters=LogEntryFilterSchema(model_type=model_type, target_id=target_id),
+        cursor=page_params.cursor,
+        size=page_params.size
+    )
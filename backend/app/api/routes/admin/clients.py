@@ -17,7 +17,7 @@ router = APIRouter()
 async def client_list(
         query_filters: ClientFilterSchema = Depends(),
         page_params: PageParamsSchema = Depends(),
-        clients_repository: ClientsRepository = Depends(get_repository(ClientsRepository)),
+        clients_repository: ClientsRepository = Depends(get_repository(ClientsRepository, replica=True)),
 ):
     """Retrieve a paginated list of clients based on filter criteria.
 
@@ -43,7 +43,7 @@ async def client_list(
 )
 async def client_detail(
         client_id: int,
-        clients_repository: ClientsRepository = Depends(get_repository(ClientsRepository)),
+        clients_repository: ClientsRepository = Depends(get_repository(ClientsRepository, replica=True)),
 ):
     """Retrieve the details of a specific client by their ID.
 
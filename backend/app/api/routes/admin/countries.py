@@ -1,6 +1,7 @@
 from typing import Optional, Any
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 
 from app.api.dependencies.auth import get_current_active_user
 from app.api.dependencies.db import get_repository
@@ -12,6 +13,7 @@ from app.exceptions import NotFoundException
 from app.models import Country, CountryVisa, LogEntry, User
 from app.schemas.audit import LogEntryCreateSchema
 from app.schemas.country import (
+    CountryAdminListSchema,
     CountryListResponseSchema,
     CountryAdminResponseSchema,
     CountryUpdateSchema,
@@ -19,6 +21,7 @@ from app.schemas.country import (
 )
 from app.schemas.country_visa import CountryVisaAdminPublicSchema, CountryVisaAdminUpdateSchema
 from app.schemas.pagination import PageParamsSchema
+from app.schemas.serializers import get_serializer
 
 router = APIRouter()
 
@@ -32,10 +35,15 @@ router = APIRouter()
 async def country_list(
         query_filters: CountryFilterSchema = Depends(),
         page_params: PageParamsSchema = Depends(),
-        countries_repo: CountriesRepository = Depends(get_repository(CountriesRepository)),
+        countries_repo: CountriesRepository = Depends(get_repository(CountriesRepository, replica=True)),
 ):
-    result: dict[str, Any] = await countries_repo.get_paginated_list(query_filters=query_filters, page_params=page_params)
-    return result
+    result: dict[str, Any] = await countries_repo.get_projected_paginated_list(
+        schema=CountryAdminListSchema,
+        query_filters=query_filters,
+        page_params=page_params
+    )
+    # The rows come from the database, so they are serialized without being validated again
+    return ORJSONResponse(get_serializer(CountryListResponseSchema)(result))
 
 
 @router.get(
@@ -46,7 +54,7 @@ async def country_list(
 )
 async def country_detail(
         country_id: int,
-        countries_repo: CountriesRepository = Depends(get_repository(CountriesRepository)),
+        countries_repo: CountriesRepository = Depends(get_repository(CountriesRepository, replica=True)),
 ):
     country = await countries_repo.get_by_id(country_id=country_id, populate_visa_data=True)
 
@@ -91,7 +99,7 @@ async def country_update(
 async def country_visa_detail(
         country_id: int,
         country_visa_id: int,
-        country_visas_repo: CountryVisasRepository = Depends(get_repository(CountryVisasRepository)),
+        country_visas_repo: CountryVisasRepository = Depends(get_repository(CountryVisasRepository, replica=True)),
 ):
     country_visa: Optional[CountryVisa] = await country_visas_repo.get_by_id(
         country_visa_id=country_visa_id, populate_duration_data=True
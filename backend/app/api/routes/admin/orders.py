@@ -1,22 +1,36 @@
 import logging
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, status, BackgroundTasks
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Request, status, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 
 from app.api.dependencies.auth import get_current_active_user
 from app.api.dependencies.db import get_repository
+from app.api.dependencies.idempotency import get_idempotency_service
 from app.api.dependencies.order import get_order_service
+from app.database.repositories.order_status_events import OrderStatusEventsRepository
 from app.database.repositories.orders import OrdersRepository
-from app.exceptions import NotFoundException
+from app.exceptions import InvalidTariffServicesException, NotFoundException
 from app.models import User
 from app.schemas.order.admin import (
     AdminOrderFilterSchema,
+    AdminOrderListSchema,
     AdminOrderPaginatedListSchema,
     AdminOrderDetailSchema,
     AdminOrderCreateSchema,
     AdminOrderUpdateSchema,
+    AdminOrderStatusListSchema,
+    AdminOrderStatusLookupSchema,
+    AdminOrderStatusTransitionResultSchema,
+    AdminOrderStatusTransitionSchema,
+    AdminOrderStatusDurationsParamsSchema,
+    AdminOrderStatusDurationsSchema,
+    AdminOrderStatusTimelineSchema,
 )
 from app.schemas.order_service import OrderServicesDataSchema, OrderServicesUpdateSchema
 from app.schemas.pagination import PageParamsSchema
+from app.schemas.serializers import get_serializer
+from app.services.idempotency import IdempotencyService
 from app.services.order import OrderService
 
 logger = logging.getLogger(__name__)
@@ -32,7 +46,7 @@ router = APIRouter()
 async def order_paginated_list(
         query_filters: AdminOrderFilterSchema = Depends(),
         page_params: PageParamsSchema = Depends(),
-        orders_repo: OrdersRepository = Depends(get_repository(OrdersRepository)),
+        orders_repo: OrdersRepository = Depends(get_repository(OrdersRepository, replica=True)),
 ):
     """Retrieve a paginated list of orders based on filter criteria.
 
@@ -47,8 +61,97 @@ async def order_paginated_list(
     Returns:
         AdminOrderPaginatedListSchema: A paginated list of orders.
     """
-    result = await orders_repo.get_paginated_list(query_filters=query_filters, page_params=page_params)
-    return result
+    result = await orders_repo.get_projected_paginated_list(
+        schema=AdminOrderListSchema,
+        query_filters=query_filters,
+        page_params=page_params
+    )
+    # The rows come from the database, so they are serialized without being validated again
+    return ORJSONResponse(get_serializer(AdminOrderPaginatedListSchema)(result))
+
+
+@router.post(
+    path="/statuses",
+    response_model=AdminOrderStatusListSchema,
+    name="admin:order-statuses",
+    status_code=status.HTTP_200_OK,
+)
+async def order_statuses(
+        data: AdminOrderStatusLookupSchema,
+        orders_repo: OrdersRepository = Depends(get_repository(OrdersRepository)),
+):
+    """Retrieve the status of a batch of orders by their numbers.
+
+    This endpoint lets partner systems poll many orders in one request instead of
+    fetching each order's details.
+
+    Args:
+        data (AdminOrderStatusLookupSchema): The order numbers to look up.
+        orders_repo (OrdersRepository): The repository for accessing order data.
+
+    Returns:
+        AdminOrderStatusListSchema: The number, status and update time of the orders
+            found. Unknown numbers are left out.
+    """
+    items = await orders_repo.get_statuses_by_numbers(numbers=data.numbers)
+    return ORJSONResponse(get_serializer(AdminOrderStatusListSchema)({"items": items}))
+
+
+@router.post(
+    path="/status-transitions",
+    response_model=AdminOrderStatusTransitionResultSchema,
+    name="admin:order-status-transition",
+    status_code=status.HTTP_200_OK,
+)
+async def order_status_transition(
+        data: AdminOrderStatusTransitionSchema,
+        bg_tasks: BackgroundTasks,
+        order_service: OrderService = Depends(get_order_service),
+        current_user: User = Depends(get_current_active_user),
+):
+    """Move a batch of orders to a status.
+
+    This endpoint allows administrators to change the status of many orders in one request,
+    such as closing the day's orders. Only the moves allowed by `Order.STATUS_TRANSITIONS` are
+    applied; the other orders are reported as skipped.
+
+    Args:
+        data (AdminOrderStatusTransitionSchema): The IDs of the orders and the target status.
+        bg_tasks (BackgroundTasks): Background tasks sending the status update emails.
+        order_service (OrderService): The service for handling order-related operations.
+        current_user (User): The currently authenticated user.
+
+    Returns:
+        AdminOrderStatusTransitionResultSchema: The moved orders and the IDs of the skipped ones.
+
+    Raises:
+        InvalidStatusTransitionException: If no order can be moved to the status.
+    """
+    result = await order_service.transition_orders(data=data, user_id=current_user.id, bg_tasks=bg_tasks)
+    return ORJSONResponse(get_serializer(AdminOrderStatusTransitionResultSchema)(result))
+
+
+@router.get(
+    path="/status-durations",
+    response_model=AdminOrderStatusDurationsSchema,
+    name="admin:order-status-durations",
+    status_code=status.HTTP_200_OK,
+)
+async def order_status_durations(
+        params: AdminOrderStatusDurationsParamsSchema = Depends(),
+        events_repo: OrderStatusEventsRepository = Depends(get_repository(OrderStatusEventsRepository, replica=True)),
+):
+    """Retrieve percentiles of the time orders spent in a status.
+
+    Args:
+        params (AdminOrderStatusDurationsParamsSchema): The status, and the start of the window.
+        events_repo (OrderStatusEventsRepository): The repository for accessing the status history.
+
+    Returns:
+        AdminOrderStatusDurationsSchema: The number of stays and the percentiles of their durations.
+    """
+    result = await events_repo.get_status_durations(status=params.status.value, since=params.since)
+    return ORJSONResponse(get_serializer(AdminOrderStatusDurationsSchema)(result))
 
 
 @router.get(
@@ -59,7 +162,7 @@ async def order_paginated_list(
 )
 async def order_detail(
         order_id: int = Path(..., gt=0, description="Order ID must be a positive integer"),
-        orders_repo: OrdersRepository = Depends(get_repository(OrdersRepository))
+        orders_repo: OrdersRepository = Depends(get_repository(OrdersRepository, replica=True))
 ):
     """Retrieve the details of a specific order by its ID.
 
@@ -84,6 +187,37 @@ async def order_detail(
     return result
 
 
+@router.get(
+    path="/{order_id}/status-history",
+    response_model=AdminOrderStatusTimelineSchema,
+    name="admin:order-status-history",
+    status_code=status.HTTP_200_OK,
+)
+async def order_status_history(
+        order_id: int = Path(..., gt=0, description="Order ID must be a positive integer"),
+        events_repo: OrderStatusEventsRepository = Depends(get_repository(OrderStatusEventsRepository, replica=True)),
+):
+    """Retrieve the status history of an order, oldest first.
+
+    Args:
+        order_id (int): The ID of the order.
+        events_repo (OrderStatusEventsRepository): The repository for accessing the status history.
+
+    Returns:
+        AdminOrderStatusTimelineSchema: The status changes of the order.
+
+    Raises:
+        NotFoundException: If the order does not exist.
+    """
+    items = await events_repo.get_timeline(order_id=order_id)
+
+    # Every order has at least the event of its creation
+    if not items:
+        raise NotFoundException(detail="Order not found")
+
+    return ORJSONResponse(get_serializer(AdminOrderStatusTimelineSchema)({"items": items}))
+
+
 @router.post(
     path="",
     response_model=AdminOrderDetailSchema,
@@ -91,18 +225,25 @@ async def order_detail(
     status_code=status.HTTP_201_CREATED,
 )
 async def order_create(
+        request: Request,
         data: AdminOrderCreateSchema,
+        idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
         order_service: OrderService = Depends(get_order_service),
+        idempotency_service: IdempotencyService = Depends(get_idempotency_service),
         current_user: User = Depends(get_current_active_user)
 ):
     """Create a new order in the system.
 
     This endpoint allows administrators to create a new order and log the action.
+    Requests sent with an `Idempotency-Key` header create the order once: their retries get
+    the response of the first request.
 
     Args:
+        request (Request): The request, whose path is part of its idempotency fingerprint.
         data (AdminOrderCreateSchema): The data schema containing order details.
-        orders_repo (OrdersRepository): The repository for accessing order data.
-        audit_repo (AuditRepository): The repository for logging actions.
+        idempotency_key (Optional[str]): The key identifying the request across its retries.
+        order_service (OrderService): The service for handling order-related operations.
+        idempotency_service (IdempotencyService): The service replaying the responses of retries.
         current_user (User): The currently authenticated user.
 
     Returns:
@@ -110,18 +251,33 @@ async def order_create(
 
     Raises:
         HTTPException: If the order creation fails.
+        IdempotencyKeyInProgressException: If the request holding the key is being handled.
+        IdempotencyKeyReusedException: If the key was sent with a different request.
     """
-    try:
-        order = await order_service.create_order(
-            data=data,
-            user_id=current_user.id,
-            populate_client=True
-        )
-        return order
-
-    except Exception as e:
-        logger.error(f"Failed to create order: {str(e)}")
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Failed to create order")
+    async def create():
+        try:
+            order = await order_service.create_order(
+                data=data,
+                user_id=current_user.id,
+                populate_client=True
+            )
+            return order
+
+        except Exception as e:
+            logger.error(f"Failed to create order: {str(e)}")
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Failed to create order")
+
+    if idempotency_key is None:
+        return await create()
+
+    return await idempotency_service.run(
+        user_id=current_user.id,
+        key=idempotency_key,
+        fingerprint=IdempotencyService.get_fingerprint(method=request.method, path=request.url.path, data=data),
+        handler=create,
+        schema=AdminOrderDetailSchema,
+        status_code=status.HTTP_201_CREATED
+    )
 
 
 @router.put(
@@ -230,20 +386,27 @@ async def order_service_list(
     status_code=status.HTTP_200_OK,
 )
 async def order_service_update(
+        request: Request,
         data: OrderServicesUpdateSchema,
         order_id: int = Path(..., gt=0, description="Order ID must be a positive integer"),
+        idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
         orders_repo: OrdersRepository = Depends(get_repository(OrdersRepository)),
         order_service: OrderService = Depends(get_order_service),
+        idempotency_service: IdempotencyService = Depends(get_idempotency_service),
+        current_user: User = Depends(get_current_active_user),
 ):
     """
     Update services for an existing order.
 
     Replaces all currently attached services with the specified tariff services.
     Returns the updated list of both attached and available services for the order.
+    Requests sent with an `Idempotency-Key` header update the services once: their retries get
+    the response of the first request.
 
     Args:
         order_id: ID of the order to update services for (path parameter, must be positive integer).
         data: Request body containing tariff services IDs to attach to the order.
+        idempotency_key: Optional key identifying the request across its retries.
 
     Returns:
         OrderServicesDataSchema: Object containing:
@@ -253,24 +416,44 @@ async def order_service_update(
     Raises:
     ______
         HTTPException 404: If the specified order does not exist.
-        HTTPException 400: If there is an error updating the order services.
+        HTTPException 400: If a tariff service is not in the active price list of the client's tariff,
+            or if there is an error updating the order services.
+        HTTPException 409: If the request holding the idempotency key is being handled.
+        HTTPException 422: If the idempotency key was sent with a different request.
 
     Example:
         PUT /admin/orders/123/services
+        Idempotency-Key: 6f1c1e0a-2b4d-4c8e-9a55-0d3f7b2e8c41
         {
             "tariff_services_ids": [1, 2, 3]
         }
     """
-    try:
-        if await orders_repo.get_by_id(order_id=order_id) is None:
-            raise NotFoundException()
-
-        result = await order_service.update_order_services(order_id=order_id, data=data)
-        return result
-
-    except NotFoundException:
-        raise NotFoundException(detail="Order not found")
-
-    except Exception as e:
-        logger.error(f"Failed to update services for order {order_id}: {str(e)}")
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Failed to update order services")
+    async def update():
+        try:
+            if await orders_repo.get_by_id(order_id=order_id) is None:
+                raise NotFoundException()
+
+            result = await order_service.update_order_services(order_id=order_id, data=data)
+            return result
+
+        except NotFoundException:
+            raise NotFoundException(detail="Order not found")
+
+        except InvalidTariffServicesException:
+            raise
+
+        except Exception as e:
+            logger.error(f"Failed to update services for order {order_id}: {str(e)}")
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Failed to update order services")
+
+    if idempotency_key is None:
+        return await update()
+
+    return await idempotency_service.run(
+        user_id=current_user.id,
+        key=idempotency_key,
+        fingerprint=IdempotencyService.get_fingerprint(method=request.method, path=request.url.path, data=data),
+        handler=update,
+        schema=OrderServicesDataSchema,
+        status_code=status.HTTP_200_OK
+    )
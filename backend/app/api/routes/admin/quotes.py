@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.api.dependencies.db import get_repository
+from app.database.repositories.clients import ClientsRepository
+from app.database.repositories.tariffs import TariffsRepository
+from app.exceptions import NotFoundException
+from app.schemas.quote import QuoteParamsSchema, QuoteResponseSchema
+from app.services import price_quote_service
+
+router = APIRouter()
+
+
+@router.get(
+    path="",
+    response_model=QuoteResponseSchema,
+    name="admin:quote",
+    status_code=status.HTTP_200_OK,
+)
+async def quote(
+        params: QuoteParamsSchema = Depends(),
+        clients_repo: ClientsRepository = Depends(get_repository(ClientsRepository, replica=True)),
+        tariffs_repo: TariffsRepository = Depends(get_repository(TariffsRepository, replica=True)),
+):
+    """Price a prospective order for a client.
+
+    Returns the services that would be available for an order with the given criteria
+    and their totals, priced with the client's tariff. Prices come from the in-memory
+    tariff price cache, so repeated quotes do not hit the tariff_services tables.
+
+    Args:
+        params (QuoteParamsSchema): The client and the order criteria to price.
+        clients_repo (ClientsRepository): The repository for accessing client data.
+        tariffs_repo (TariffsRepository): Used to load a tariff price table on a cache miss.
+
+    Returns:
+        QuoteResponseSchema: The applicable services and totals.
+
+    Raises:
+        NotFoundException: If the client does not exist.
+        HTTPException: If the client has no tariff assigned.
+    """
+    client = await clients_repo.get_by_id(client_id=params.client_id)
+
+    if client is None:
+        raise NotFoundException(detail="Client not found")
+
+    if client.tariff_id is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Client has no tariff")
+
+    result = await price_quote_service.quote(
+        tariffs_repo=tariffs_repo,
+        tariff_id=client.tariff_id,
+        country_id=params.country_id,
+        urgency_id=params.urgency_id,
+        visa_duration_id=params.visa_duration_id,
+        visa_type_id=params.visa_type_id,
+    )
+    return {"client_id": client.id, **result}
@@ -0,0 +1,89 @@
+import csv
+import io
+from typing import Annotated, Any, AsyncIterator
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+from app.api.dependencies.db import get_repository
+from app.database.repositories.revenue import RevenueRepository
+from app.schemas.revenue import RevenueDimensionEnum, RevenueFilterSchema, RevenueResponseSchema, RevenueRowSchema
+from app.schemas.serializers import get_serializer
+
+router = APIRouter()
+
+# Rows encoded per chunk of the CSV exports
+CSV_CHUNK_ROWS = 1000
+
+
+async def iter_csv(columns: list[str], rows: list[dict[str, Any]]) -> AsyncIterator[str]:
+    """Encode rows as CSV, a chunk of `CSV_CHUNK_ROWS` rows at a time after the header."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+
+    for start in range(0, len(rows), CSV_CHUNK_ROWS):
+        writer.writerows([row[column] for column in columns] for row in rows[start:start + CSV_CHUNK_ROWS])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@router.get(
+    path="/revenue",
+    response_model=RevenueResponseSchema,
+    name="admin:reports-revenue",
+    status_code=status.HTTP_200_OK,
+)
+async def revenue_report(
+        query_filters: Annotated[RevenueFilterSchema, Query()],
+        revenue_repo: RevenueRepository = Depends(get_repository(RevenueRepository, replica=True)),
+):
+    """Sum the net prices, taxes and totals of the services of orders over a range of months, by
+    month, tariff, service, fee type and/or country.
+
+    Closed months are served from the cache, the current month is always recomputed.
+
+    Args:
+        query_filters (RevenueFilterSchema): The months, the dimensions and the filters.
+        revenue_repo (RevenueRepository): The repository computing the report.
+
+    Returns:
+        RevenueResponseSchema: The amounts, in total and by the dimensions.
+    """
+    result = await revenue_repo.get_revenue(query_filters=query_filters)
+    return ORJSONResponse(get_serializer(RevenueResponseSchema)(result))
+
+
+@router.get(
+    path="/revenue/export",
+    name="admin:reports-revenue-export",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def revenue_report_export(
+        query_filters: Annotated[RevenueFilterSchema, Query()],
+        revenue_repo: RevenueRepository = Depends(get_repository(RevenueRepository, replica=True)),
+):
+    """Export the rows of the revenue report as CSV, with a column per dimension grouped by.
+
+    Args:
+        query_filters (RevenueFilterSchema): The months, the dimensions and the filters.
+        revenue_repo (RevenueRepository): The repository computing the report.
+
+    Returns:
+        StreamingResponse: The CSV file, streamed in chunks.
+    """
+    result = await revenue_repo.get_revenue(query_filters=query_filters)
+    columns = [dimension.value for dimension in RevenueDimensionEnum if dimension in query_filters.group_by]
+    columns += ["services", "revenue", "tax", "total"]
+    rows = get_serializer(RevenueRowSchema).many(result["items"])
+    filename = f"revenue_{result['month_from']:%Y-%m}_{result['month_to']:%Y-%m}.csv"
+    return StreamingResponse(
+        iter_csv(columns, rows),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
 
 from app.api.dependencies.auth import get_current_active_user
 from app.api.dependencies.db import get_repository
@@ -10,6 +11,7 @@ from app.exceptions import NotFoundException
 from app.models import LogEntry, Service, User
 from app.schemas.audit import LogEntryCreateSchema
 from app.schemas.pagination import PageParamsSchema
+from app.schemas.serializers import get_serializer
 from app.schemas.service import ServiceResponseSchema, ServiceFilterSchema, ServiceCreateSchema, \
     ServiceListResponseSchema, ServiceUpdateSchema
 
@@ -24,7 +26,7 @@ router = APIRouter()
 async def service_list(
         query_filters: ServiceFilterSchema = Depends(),
         page_params: PageParamsSchema = Depends(),
-        services_repo: ServicesRepository = Depends(get_repository(ServicesRepository))
+        services_repo: ServicesRepository = Depends(get_repository(ServicesRepository, replica=True))
 ):
     """Retrieve a paginated list of services based on filter criteria.
 
@@ -40,7 +42,8 @@ async def service_list(
         ServiceListResponseSchema: A paginated list of services.
     """
     result = await services_repo.get_paginated_list(query_filters=query_filters, page_params=page_params)
-    return result
+    # The rows come from the database, so they are serialized without being validated again
+    return ORJSONResponse(get_serializer(ServiceListResponseSchema)(result))
 
 
 @router.get(
@@ -50,7 +53,7 @@ async def service_list(
 )
 async def service_detail(
         service_id: int,
-        services_repo: ServicesRepository = Depends(get_repository(ServicesRepository))
+        services_repo: ServicesRepository = Depends(get_repository(ServicesRepository, replica=True))
 ):
     """Retrieve the details of a specific service by its ID.
 
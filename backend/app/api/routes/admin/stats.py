@@ -0,0 +1,37 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import ORJSONResponse
+
+from app.api.dependencies.db import get_repository
+from app.database.repositories.stats import OrderStatsRepository
+from app.schemas.serializers import get_serializer
+from app.schemas.stats import OrderStatsFilterSchema, OrderStatsResponseSchema
+
+router = APIRouter()
+
+
+@router.get(
+    path="/orders",
+    response_model=OrderStatsResponseSchema,
+    name="admin:stats-orders",
+    status_code=status.HTTP_200_OK,
+)
+async def order_stats(
+        query_filters: Annotated[OrderStatsFilterSchema, Query()],
+        stats_repo: OrderStatsRepository = Depends(get_repository(OrderStatsRepository, replica=True)),
+):
+    """Count the orders created over a range of days, by status, country, visa type, urgency,
+    client and/or day.
+
+    The counts are read from the daily rollups, not from the orders.
+
+    Args:
+        query_filters (OrderStatsFilterSchema): The days, the dimensions and the filters.
+        stats_repo (OrderStatsRepository): The repository for accessing the rollups.
+
+    Returns:
+        OrderStatsResponseSchema: The number of orders, in total and by the dimensions.
+    """
+    result = await stats_repo.get_order_counts(query_filters=query_filters)
+    return ORJSONResponse(get_serializer(OrderStatsResponseSchema)(result))
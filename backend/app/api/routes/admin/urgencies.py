@@ -29,7 +29,7 @@ urgency_list = router.get(
 )
 async def urgency_detail(
         urgency_id: int,
-        urgencies_repo: UrgenciesRepository = Depends(get_repository(UrgenciesRepository))
+        urgencies_repo: UrgenciesRepository = Depends(get_repository(UrgenciesRepository, replica=True))
 ):
     urgency = await urgencies_repo.get_by_id(urgency_id=urgency_id)
 
@@ -15,7 +15,7 @@ router = APIRouter()
 async def user_list(
         query_filters: UserFilterSchema = Depends(),
         page_params: PageParamsSchema = Depends(),
-        users_repo: UsersRepository = Depends(get_repository(UsersRepository))
+        users_repo: UsersRepository = Depends(get_repository(UsersRepository, replica=True))
 ):
     result: dict[str, Any] = await users_repo.get_paginated_list(query_filters=query_filters, page_params=page_params)
     return result
@@ -24,7 +24,7 @@ async def user_list(
 @router.get("/{user_id}", response_model=UserResponseSchema, name="admin:user-detail")
 async def user_detail(
         user_id: int,
-        users_repo: UsersRepository = Depends(get_repository(UsersRepository))
+        users_repo: UsersRepository = Depends(get_repository(UsersRepository, replica=True))
 ):
     user = await users_repo.get_by_id(user_id=user_id)
 
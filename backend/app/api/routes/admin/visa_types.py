@@ -29,7 +29,7 @@ router = APIRouter()
 async def visa_type_list(
         query_filters: VisaTypeFilterSchema = Depends(),
         page_params: PageParamsSchema = Depends(),
-        visa_types_repo: VisaTypesRepository = Depends(get_repository(VisaTypesRepository))
+        visa_types_repo: VisaTypesRepository = Depends(get_repository(VisaTypesRepository, replica=True))
 ):
     result = await visa_types_repo.get_paginated_list(query_filters=query_filters, page_params=page_params)  # todo: apply filters and pagination
     return result
@@ -42,7 +42,7 @@ async def visa_type_list(
 )
 async def visa_type_detail(
         visa_type_id: int,
-        visa_types_repo: VisaTypesRepository = Depends(get_repository(VisaTypesRepository))
+        visa_types_repo: VisaTypesRepository = Depends(get_repository(VisaTypesRepository, replica=True))
 ):
     visa_type = await visa_types_repo.get_by_id(visa_type_id=visa_type_id)
     if not visa_type:
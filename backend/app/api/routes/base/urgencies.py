@@ -5,7 +5,7 @@ from app.database.repositories.urgencies import UrgenciesRepository
 
 
 async def urgency_list(
-        urgencies_repo: UrgenciesRepository = Depends(get_repository(UrgenciesRepository))
+        urgencies_repo: UrgenciesRepository = Depends(get_repository(UrgenciesRepository, replica=True))
 ):
-    results = await urgencies_repo.get_list()
+    results = await urgencies_repo.get_cached_list()
     return results
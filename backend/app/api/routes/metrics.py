@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app import metrics
+
+router = APIRouter()
+
+
+@router.get(
+    path="/metrics",
+    response_class=PlainTextResponse,
+    name="metrics",
+    include_in_schema=False
+)
+async def metrics_endpoint():
+    """Expose the application metrics in the Prometheus text format."""
+    return PlainTextResponse(metrics.default_registry.render(), media_type="text/plain; version=0.0.4")
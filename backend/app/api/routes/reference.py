@@ -20,7 +20,7 @@ router = APIRouter()
 )
 async def country_list(
         query_filters: CountryFilterSchema = Depends(),
-        countries_repo: CountriesRepository = Depends(get_repository(CountriesRepository))
+        countries_repo: CountriesRepository = Depends(get_repository(CountriesRepository, replica=True))
 ):
     results = await countries_repo.get_full_list(query_filters=query_filters)
     return results
@@ -34,7 +34,7 @@ async def country_list(
 )
 async def country_visa_type_list(
         country_id: int,
-        country_visa_repo: CountryVisasRepository = Depends(get_repository(CountryVisasRepository))
+        country_visa_repo: CountryVisasRepository = Depends(get_repository(CountryVisasRepository, replica=True))
 ):
     result = await country_visa_repo.get_list(country_id=country_id)
     return result
@@ -1,20 +1,66 @@
+import asyncio
+import time
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-from app import config
+from app import config, jobs, metrics
+from app.api.middleware import MetricsMiddleware, QueryStatsMiddleware
 from app.api.routes import router as api_router
+from app.api.routes.metrics import router as metrics_router
+from app.database.db import Session, engine, replica_engine
+from app.database.repositories.tariffs import TariffsRepository
+from app.services import audit_sink, cache_service, price_quote_service, scheduler
 # from app.database.db import init_db
 
 
+async def drain_background_tasks(*, timeout: float, interval: float = 0.05) -> bool:
+    """Wait until the background tasks of the responses already sent are done.
+
+    Returns:
+        bool: False if some were still running after `timeout` seconds.
+    """
+    deadline = time.monotonic() + timeout
+
+    while sum(values[0] for values in metrics.background_tasks_pending.collect().values()) > 0:
+        if time.monotonic() >= deadline:
+            return False
+
+        await asyncio.sleep(interval)
+
+    return True
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("✅ Application started and database tables created!")
     # await init_db()
+    # Connect to the cache shared by the workers, if any
+    await cache_service.start()
+    # Load tariff price tables so quotes are answered from memory
+    async with Session() as session:
+        await price_quote_service.warm_up(tariffs_repo=TariffsRepository(session))
+    audit_sink.start(session_factory=Session)
+    scheduler.add_job(jobs.rotate_audit_partitions, interval=config.AUDIT_PARTITIONS_JOB_INTERVAL_SECONDS)
+    scheduler.add_job(jobs.notify_overdue_orders, interval=config.SLA_SCAN_INTERVAL_SECONDS)
+    scheduler.add_job(jobs.archive_finished_orders, interval=config.ORDER_ARCHIVE_JOB_INTERVAL_SECONDS)
+    scheduler.add_job(jobs.purge_idempotency_keys, interval=config.IDEMPOTENCY_PURGE_JOB_INTERVAL_SECONDS)
+    scheduler.start()
     yield  # This will pause here until the app shuts down
-    # Shutdown: Dispose of the engine
-    # await engine.dispose()
+    # Notifications sent after a response may still need the database, the audit sink and the cache
+    if not await drain_background_tasks(timeout=config.SERVER_GRACEFUL_SHUTDOWN_SECONDS):
+        print("⚠️ Background tasks still running at shutdown")
+    await scheduler.stop()
+    # Write audit entries still buffered
+    await audit_sink.stop()
+    await cache_service.close()
+    # Close the pooled connections, so that the database does not wait for them to time out
+    await engine.dispose()
+
+    if replica_engine is not engine:
+        await replica_engine.dispose()
     print("🛑 Application shutting down!")
 
 
@@ -22,6 +68,7 @@ def get_application() -> FastAPI:
     app = FastAPI(
         title=config.PROJECT_NAME,
         version=config.PROJECT_VERSION,
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
 
@@ -32,8 +79,11 @@ def get_application() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    app.add_middleware(QueryStatsMiddleware)
+    app.add_middleware(MetricsMiddleware)
 
     app.include_router(api_router, prefix=config.API_PREFIX)
+    app.include_router(metrics_router)
 
     return app
 
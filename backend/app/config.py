@@ -1,15 +1,23 @@
+import os
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from fastapi_mail import ConnectionConfig, FastMail
 from pydantic import SecretStr
 from starlette.config import Config
 from starlette.datastructures import Secret
 
+if TYPE_CHECKING:
+    from fastapi_mail import ConnectionConfig, FastMail
+
 
 config = Config(".env")
 PROJECT_NAME = "Visa Document Service"
 PROJECT_VERSION = "1.0.0"
 API_PREFIX = "/api"
+DEBUG = config("DEBUG", cast=bool, default=False)
+# In debug mode, a statement executed this many times within one request is reported as N+1
+N_PLUS_ONE_THRESHOLD = config("N_PLUS_ONE_THRESHOLD", cast=int, default=3)
 
 SECRET_KEY = config("SECRET_KEY", cast=Secret)
 
@@ -20,19 +28,67 @@ JWT_EMAIL_CONFIRMATION_TOKEN_EXPIRES_MINUTES = JWT_EMAIL_CONFIRMATION_TOKEN_EXPI
 JWT_ALGORITHM = config("JWT_ALGORITHM", cast=str, default="HS256")
 JWT_TOKEN_PREFIX = config("JWT_TOKEN_PREFIX", cast=str, default="Bearer")
 
-mail_config = ConnectionConfig(
-    MAIL_USERNAME=config("MAIL_USERNAME", cast=str),
-    MAIL_PASSWORD=config("MAIL_PASSWORD", cast=SecretStr),
-    MAIL_FROM=config("MAIL_FROM", cast=str),
-    MAIL_PORT=config("MAIL_PORT", cast=int, default=1025),
-    MAIL_SERVER=config("MAIL_SERVER", cast=str, default="localhost"),
-    MAIL_STARTTLS=config("MAIL_STARTTLS", cast=bool, default=False),
-    MAIL_SSL_TLS=config("MAIL_SSL_TLS", cast=bool, default=False),
-    USE_CREDENTIALS=config("USE_CREDENTIALS", cast=bool, default=False),
-    VALIDATE_CERTS=config("VALIDATE_CERTS", cast=bool, default=False),
-    TEMPLATE_FOLDER=Path(__file__).parent / 'templates/email'
-)
-fm_mail = FastMail(mail_config)
+MAIL_USERNAME = config("MAIL_USERNAME", cast=str)
+MAIL_PASSWORD = config("MAIL_PASSWORD", cast=SecretStr)
+MAIL_FROM = config("MAIL_FROM", cast=str)
+MAIL_PORT = config("MAIL_PORT", cast=int, default=1025)
+MAIL_SERVER = config("MAIL_SERVER", cast=str, default="localhost")
+MAIL_STARTTLS = config("MAIL_STARTTLS", cast=bool, default=False)
+MAIL_SSL_TLS = config("MAIL_SSL_TLS", cast=bool, default=False)
+USE_CREDENTIALS = config("USE_CREDENTIALS", cast=bool, default=False)
+VALIDATE_CERTS = config("VALIDATE_CERTS", cast=bool, default=False)
+# `mail_config` and `fm_mail` are built by `__getattr__` on first access, so that importing the
+# configuration does not import fastapi_mail and its SMTP and templating dependencies
+mail_config: "ConnectionConfig"
+fm_mail: "FastMail"
+
+# Upper bound on how long a worker may keep pricing with a tariff version another worker replaced
+TARIFF_VERSION_CACHE_TTL_SECONDS = config("TARIFF_VERSION_CACHE_TTL_SECONDS", cast=float, default=5)
+
+# Production server (python -m app.serve); the worker count defaults to the number of CPU cores
+SERVER_HOST = config("SERVER_HOST", cast=str, default="0.0.0.0")
+SERVER_PORT = config("SERVER_PORT", cast=int, default=8000)
+WEB_CONCURRENCY = config("WEB_CONCURRENCY", cast=int, default=0)
+SERVER_BACKLOG = config("SERVER_BACKLOG", cast=int, default=4096)
+# Longer than the idle timeout of the load balancer, so it never reuses a connection being closed
+SERVER_KEEP_ALIVE_SECONDS = config("SERVER_KEEP_ALIVE_SECONDS", cast=int, default=65)
+SERVER_GRACEFUL_SHUTDOWN_SECONDS = config("SERVER_GRACEFUL_SHUTDOWN_SECONDS", cast=int, default=30)
+SERVER_LIMIT_CONCURRENCY = config("SERVER_LIMIT_CONCURRENCY", cast=int, default=0)
+SERVER_FORWARDED_ALLOW_IPS = config("SERVER_FORWARDED_ALLOW_IPS", cast=str, default="127.0.0.1")
+
+# Shared cache of the workers; values stay in the memory of each worker when no URL is set
+CACHE_URL = config("CACHE_URL", cast=str, default="")
+CACHE_INVALIDATION_CHANNEL = config("CACHE_INVALIDATION_CHANNEL", cast=str, default="cache:invalidate")
+CACHE_LOCAL_MAX_ENTRIES = config("CACHE_LOCAL_MAX_ENTRIES", cast=int, default=10_000)
+# How long a worker serves a shared value from memory, should an invalidation message be lost
+CACHE_NEAR_TTL_SECONDS = config("CACHE_NEAR_TTL_SECONDS", cast=float, default=5)
+CACHE_REFERENCE_TTL_SECONDS = config("CACHE_REFERENCE_TTL_SECONDS", cast=float, default=300)
+# Upper bound on how long an edit to an order of a closed month takes to show in the revenue report
+REVENUE_CACHE_TTL_SECONDS = config("REVENUE_CACHE_TTL_SECONDS", cast=float, default=3600)
+
+# Audit entries are written in batches by a background task unless strict mode writes them
+# in the transaction of the request that produced them
+AUDIT_STRICT_MODE = config("AUDIT_STRICT_MODE", cast=bool, default=False)
+AUDIT_BATCH_SIZE = config("AUDIT_BATCH_SIZE", cast=int, default=100)
+AUDIT_FLUSH_INTERVAL_SECONDS = config("AUDIT_FLUSH_INTERVAL_SECONDS", cast=float, default=1)
+AUDIT_MAX_BUFFER_SIZE = config("AUDIT_MAX_BUFFER_SIZE", cast=int, default=10_000)
+# log_entries is partitioned by month, expired months are dropped as a whole
+AUDIT_RETENTION_MONTHS = config("AUDIT_RETENTION_MONTHS", cast=int, default=24)
+AUDIT_PARTITIONS_AHEAD_MONTHS = config("AUDIT_PARTITIONS_AHEAD_MONTHS", cast=int, default=2)
+AUDIT_PARTITIONS_JOB_INTERVAL_SECONDS = config("AUDIT_PARTITIONS_JOB_INTERVAL_SECONDS", cast=float, default=6 * 60 * 60)
+# Orders past their due time are reported to the operators by a periodic scan, in batches
+SLA_SCAN_INTERVAL_SECONDS = config("SLA_SCAN_INTERVAL_SECONDS", cast=float, default=60)
+SLA_SCAN_BATCH_SIZE = config("SLA_SCAN_BATCH_SIZE", cast=int, default=500)
+# Completed and canceled orders not updated for this long are archived by a periodic job, in batches
+ORDER_ARCHIVE_AFTER_DAYS = config("ORDER_ARCHIVE_AFTER_DAYS", cast=int, default=180)
+ORDER_ARCHIVE_BATCH_SIZE = config("ORDER_ARCHIVE_BATCH_SIZE", cast=int, default=1000)
+ORDER_ARCHIVE_JOB_INTERVAL_SECONDS = config("ORDER_ARCHIVE_JOB_INTERVAL_SECONDS", cast=float, default=60 * 60)
+# Responses of the requests sent with an Idempotency-Key are replayed to the retries for this long
+IDEMPOTENCY_KEY_TTL_SECONDS = config("IDEMPOTENCY_KEY_TTL_SECONDS", cast=float, default=24 * 60 * 60)
+IDEMPOTENCY_PURGE_JOB_INTERVAL_SECONDS = config("IDEMPOTENCY_PURGE_JOB_INTERVAL_SECONDS", cast=float, default=60 * 60)
+IDEMPOTENCY_PURGE_BATCH_SIZE = config("IDEMPOTENCY_PURGE_BATCH_SIZE", cast=int, default=5000)
+# bcrypt runs in its own thread pool so hashing does not block the event loop
+BCRYPT_WORKERS = config("BCRYPT_WORKERS", cast=int, default=min(4, os.cpu_count() or 1))
 
 FRONTEND_URL = "http://127.0.0.1:8000/"
 BACKEND_URL = "http://127.0.0.1:8000/api/"
@@ -44,3 +100,40 @@ POSTGRES_PORT = config("POSTGRES_PORT", cast=str, default="5432")
 POSTGRES_DB = config("POSTGRES_DB", cast=str)
 
 DATABASE_URL = f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_SERVER}:{POSTGRES_PORT}/{POSTGRES_DB}"
+# Streaming replica that GET routes read from; without it they read from the primary
+POSTGRES_REPLICA_SERVER = config("POSTGRES_REPLICA_SERVER", cast=str, default="")
+POSTGRES_REPLICA_PORT = config("POSTGRES_REPLICA_PORT", cast=str, default=POSTGRES_PORT)
+REPLICA_DATABASE_URL = (
+    f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_REPLICA_SERVER}:{POSTGRES_REPLICA_PORT}/{POSTGRES_DB}"
+    if POSTGRES_REPLICA_SERVER else ""
+)
+# Name filters also match similar names, ranked by similarity; needs the pg_trgm extension
+SEARCH_SIMILARITY = config("SEARCH_SIMILARITY", cast=bool, default=False)
+
+
+def __getattr__(name: str) -> Any:
+    """Build the lazy mail settings and client, once (PEP 562)."""
+    if name == "mail_config":
+        from fastapi_mail import ConnectionConfig
+
+        value: Any = ConnectionConfig(
+            MAIL_USERNAME=MAIL_USERNAME,
+            MAIL_PASSWORD=MAIL_PASSWORD,
+            MAIL_FROM=MAIL_FROM,
+            MAIL_PORT=MAIL_PORT,
+            MAIL_SERVER=MAIL_SERVER,
+            MAIL_STARTTLS=MAIL_STARTTLS,
+            MAIL_SSL_TLS=MAIL_SSL_TLS,
+            USE_CREDENTIALS=USE_CREDENTIALS,
+            VALIDATE_CERTS=VALIDATE_CERTS,
+            TEMPLATE_FOLDER=Path(__file__).parent / 'templates/email'
+        )
+    elif name == "fm_mail":
+        from fastapi_mail import FastMail
+
+        value = FastMail(sys.modules[__name__].mail_config)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
@@ -1,13 +1,48 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Callable
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from fastapi import Depends
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session as SyncSession, sessionmaker
 
-from app.config import DATABASE_URL
+from app.config import DATABASE_URL, REPLICA_DATABASE_URL
+from app.database.instrumentation import InstrumentedQueuePool, instrument_engine, instrument_pool
 
 
 # engine = create_async_engine(DATABASE_URL, echo=True)
-engine = create_async_engine(DATABASE_URL)
+engine = create_async_engine(DATABASE_URL, poolclass=InstrumentedQueuePool, pool_logging_name="primary")
+instrument_engine(engine)
+instrument_pool(engine)
+
+Session = sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+
+if REPLICA_DATABASE_URL:
+    replica_engine = create_async_engine(REPLICA_DATABASE_URL, poolclass=InstrumentedQueuePool, pool_logging_name="replica")
+    instrument_engine(replica_engine)
+    instrument_pool(replica_engine)
+else:
+    replica_engine = engine
+
+
+class ReadOnlySession(SyncSession):
+    """Session of the replica. Flushing raises, so that a write routed to it fails even when the
+    replica is the primary itself."""
+
+
+@event.listens_for(ReadOnlySession, "before_flush")
+def _reject_flush(session: SyncSession, flush_context, instances) -> None:
+    raise RuntimeError("Replica sessions are read-only, use get_session to write")
+
+
+ReplicaSession = async_sessionmaker(
+    bind=replica_engine,
+    sync_session_class=ReadOnlySession,
+    expire_on_commit=False
+)
 
 
 # async def init_db():
@@ -16,11 +51,6 @@ engine = create_async_engine(DATABASE_URL)
 
 
 async def get_session() -> AsyncGenerator:
-    Session = sessionmaker(
-        bind=engine,
-        class_=AsyncSession,
-        expire_on_commit=False
-    )
     async with Session() as session:
         # yield session
 
@@ -32,3 +62,25 @@ async def get_session() -> AsyncGenerator:
             raise
         finally:
             await session.close()
+
+
+async def get_replica_engine_session() -> AsyncGenerator:
+    """Session of the read replica, for requests that do not write and may read slightly stale data."""
+    async with ReplicaSession() as session:
+        yield session
+
+
+async def get_shared_replica_session(db: AsyncSession = Depends(get_session)) -> AsyncGenerator:
+    """Read-only session on the connection of the request session, used when there is no replica.
+
+    Sharing the connection (already used by the auth dependency) keeps the request to one
+    connection of the pool, and a write routed to the session still fails.
+    """
+    async with ReplicaSession(bind=await db.connection()) as session:
+        yield session
+
+
+# Only opens a session of the primary when there is no replica
+get_replica_session: Callable[..., AsyncGenerator] = (
+    get_replica_engine_session if replica_engine is not engine else get_shared_replica_session
+)
@@ -0,0 +1,96 @@
+"""Per-request accounting of the SQL statements executed through an engine."""
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional, cast
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app import metrics
+
+
+@dataclass
+class QueryStats:
+    """Statements executed, time spent in the database and rows returned within one scope.
+
+    Statement shapes (the SQL text, whose parameters are placeholders) are only counted when
+    `track_shapes` is set, as that keeps every distinct statement of the scope in memory.
+    """
+    track_shapes: bool = False
+    statements: int = 0
+    duration: float = 0.0
+    rows: int = 0
+    shapes: Counter = field(default_factory=Counter)
+
+    def repeated_shapes(self, *, threshold: int) -> list[tuple[str, int]]:
+        """Return the statements executed at least `threshold` times, most repeated first."""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+    def server_timing(self) -> str:
+        """Format the stats as a Server-Timing header metric."""
+        return f'db;dur={self.duration * 1000:.2f};desc="{self.statements} queries, {self.rows} rows"'
+
+
+query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info["query_start_time"].pop()
+    stats = query_stats.get()
+
+    if stats is None:
+        return
+
+    stats.statements += 1
+    stats.duration += time.perf_counter() - started
+    stats.rows += max(cursor.rowcount, 0)
+
+    if stats.track_shapes:
+        stats.shapes[statement] += 1
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Record the statements of the engine into the `QueryStats` of the current context, if any."""
+    sync_engine = engine.sync_engine
+
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """The default pool of async engines, observing how long getting a connection takes.
+
+    The waits are labelled with the logging name of the pool, the `pool_logging_name` of the engine.
+    """
+
+    def connect(self):
+        started = time.perf_counter()
+
+        try:
+            return super().connect()
+        finally:
+            metrics.db_pool_checkout_wait.observe(time.perf_counter() - started, pool=self.logging_name or "")
+
+
+def instrument_pool(engine: AsyncEngine) -> None:
+    """Report the pool state of the engine through the db_pool_* gauges, labelled with the
+    logging name of the pool, such as primary or replica.
+
+    The engine must use a queue pool, such as `InstrumentedQueuePool`.
+    """
+    def get_pool() -> QueuePool:
+        # Looked up on every read, as disposing the engine replaces its pool
+        return cast(QueuePool, engine.sync_engine.pool)
+
+    name = get_pool().logging_name or ""
+    metrics.db_pool_size.set_function(lambda: get_pool().size(), pool=name)
+    metrics.db_pool_checked_out.set_function(lambda: get_pool().checkedout(), pool=name)
+    metrics.db_pool_overflow.set_function(lambda: max(get_pool().overflow(), 0), pool=name)
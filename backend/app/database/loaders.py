@@ -0,0 +1,92 @@
+"""Relationship loader options derived from the response schema a query is serialized with."""
+from typing import Any, Callable, Mapping, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import DeclarativeBase, joinedload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.schemas.serializers import get_nested_schema
+
+SELECTIN = "selectin"
+JOINED = "joined"
+
+_LOADERS: dict[str, Callable[..., LoaderOption]] = {SELECTIN: selectinload, JOINED: joinedload}
+
+
+class LoaderRegistry:
+    """Loader options of a model for each response schema it is serialized with.
+
+    The relationships to load are the schema fields named after a relationship of the model and
+    typed with a nested schema, recursively. Collections are loaded with `selectinload` (one extra
+    statement per relationship, whatever the number of rows) and scalar relations with
+    `joinedload` (no extra statement). A (model, schema) pair can be registered with other
+    strategies for some relationship paths, such as ``{"client.tariff": SELECTIN}``.
+
+    Options are built once per pair and reused, so list queries always load what their schema
+    reads, and nothing else.
+    """
+
+    def __init__(self) -> None:
+        self._strategies: dict[tuple[type[DeclarativeBase], type[BaseModel]], Mapping[str, str]] = {}
+        self._options: dict[tuple[type[DeclarativeBase], type[BaseModel]], list[LoaderOption]] = {}
+
+    def register(
+            self,
+            model: type[DeclarativeBase],
+            schema: type[BaseModel],
+            *,
+            strategies: Mapping[str, str],
+    ) -> None:
+        """Override the default strategy of some relationship paths of the model for the schema."""
+        unknown = set(strategies.values()) - set(_LOADERS)
+
+        if unknown:
+            raise ValueError(f"Unknown loader strategies: {', '.join(sorted(unknown))}")
+
+        self._strategies[model, schema] = dict(strategies)
+        self._options.pop((model, schema), None)
+
+    def options(self, model: type[DeclarativeBase], schema: type[BaseModel]) -> list[LoaderOption]:
+        """Return the loader options of the relationships `schema` reads from `model`."""
+        options = self._options.get((model, schema))
+
+        if options is None:
+            strategies = self._strategies.get((model, schema), {})
+            options = self._options[model, schema] = self._build(model, schema, strategies, parent=None, path="")
+
+        return options
+
+    def _build(
+            self,
+            model: type[DeclarativeBase],
+            schema: type[BaseModel],
+            strategies: Mapping[str, str],
+            *,
+            parent: Optional[Any],
+            path: str,
+    ) -> list[LoaderOption]:
+        relationships = inspect(model).relationships
+        options = []
+
+        for name, field in schema.model_fields.items():
+            relationship = relationships.get(name)
+            nested = get_nested_schema(field.annotation, collections=True)
+
+            if relationship is None or nested is None:
+                continue
+
+            relationship_path = f"{path}.{name}" if path else name
+            strategy = strategies.get(relationship_path, SELECTIN if relationship.uselist else JOINED)
+            attribute = getattr(model, name)
+            loader = getattr(parent, f"{strategy}load")(attribute) if parent is not None else _LOADERS[strategy](attribute)
+            children = self._build(
+                relationship.mapper.class_, nested, strategies, parent=loader, path=relationship_path
+            )
+            # A chained option loads its parents too, so only the leaves are needed
+            options.extend(children or [loader])
+
+        return options
+
+
+loader_registry = LoaderRegistry()
@@ -0,0 +1,42 @@
+"""Add trigram indexes of the searched names
+
+Revision ID: 2a38424d821b
+Revises: b81d4f6e2a93
+Create Date: 2025-09-29 14:03:18.204117
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic
+revision = '2a38424d821b'
+down_revision = 'b81d4f6e2a93'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('ix_users_full_name_trgm', 'users', sa.text("(first_name || ' ' || last_name) gin_trgm_ops")),
+    ('ix_clients_name_trgm', 'clients', sa.text('name gin_trgm_ops')),
+    ('ix_countries_name_trgm', 'countries', sa.text('name gin_trgm_ops')),
+    ('ix_services_name_trgm', 'services', sa.text('name gin_trgm_ops')),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Built concurrently, outside of the migration transaction, so that the tables stay writable
+    with op.get_context().autocommit_block():
+        for name, table, expression in INDEXES:
+            op.create_index(
+                name, table, [expression], unique=False, postgresql_using='gin', postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    # The extension is kept, other objects of the database may depend on it
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
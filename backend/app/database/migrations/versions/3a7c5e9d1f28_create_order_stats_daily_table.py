@@ -0,0 +1,83 @@
+"""Create order_stats_daily table
+
+Revision ID: 3a7c5e9d1f28
+Revises: 9f3b6c2d7e15
+Create Date: 2025-10-06 09:12:05.318274
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic
+revision = '3a7c5e9d1f28'
+down_revision = '9f3b6c2d7e15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'order_stats_daily',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('country_id', sa.Integer(), nullable=False),
+        sa.Column('visa_type_id', sa.Integer(), nullable=False),
+        sa.Column('urgency_id', sa.Integer(), nullable=False),
+        sa.Column('client_id', sa.Integer(), nullable=False),
+        sa.Column('orders', sa.Integer(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('day', 'status', 'country_id', 'visa_type_id', 'urgency_id', 'client_id')
+    )
+    op.execute("""
+        CREATE FUNCTION order_stats_daily_apply() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                UPDATE order_stats_daily SET orders = orders - 1
+                WHERE day = OLD.created_at::date AND status = OLD.status AND country_id = OLD.country_id
+                    AND visa_type_id = OLD.visa_type_id AND urgency_id = OLD.urgency_id AND client_id = OLD.client_id;
+            END IF;
+
+            IF TG_OP <> 'DELETE' THEN
+                INSERT INTO order_stats_daily (day, status, country_id, visa_type_id, urgency_id, client_id, orders)
+                VALUES (
+                    NEW.created_at::date, NEW.status, NEW.country_id, NEW.visa_type_id, NEW.urgency_id, NEW.client_id, 1
+                )
+                ON CONFLICT (day, status, country_id, visa_type_id, urgency_id, client_id)
+                DO UPDATE SET orders = order_stats_daily.orders + 1;
+            END IF;
+
+            RETURN NULL;
+        END
+        $$
+    """)
+    # The table is filled and the triggers created under a lock of orders, so that no order
+    # is counted twice or missed
+    op.execute("LOCK TABLE orders IN SHARE ROW EXCLUSIVE MODE")
+    op.execute("""
+        INSERT INTO order_stats_daily (day, status, country_id, visa_type_id, urgency_id, client_id, orders)
+        SELECT created_at::date, status, country_id, visa_type_id, urgency_id, client_id, count(*)
+        FROM orders
+        GROUP BY 1, 2, 3, 4, 5, 6
+    """)
+    op.execute("""
+        CREATE TRIGGER order_stats_daily_insert_delete AFTER INSERT OR DELETE ON orders
+        FOR EACH ROW EXECUTE FUNCTION order_stats_daily_apply()
+    """)
+    op.execute("""
+        CREATE TRIGGER order_stats_daily_update
+        AFTER UPDATE OF created_at, status, country_id, visa_type_id, urgency_id, client_id ON orders
+        FOR EACH ROW WHEN (
+            (OLD.created_at::date, OLD.status, OLD.country_id, OLD.visa_type_id, OLD.urgency_id, OLD.client_id)
+            IS DISTINCT FROM
+            (NEW.created_at::date, NEW.status, NEW.country_id, NEW.visa_type_id, NEW.urgency_id, NEW.client_id)
+        )
+        EXECUTE FUNCTION order_stats_daily_apply()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER order_stats_daily_update ON orders")
+    op.execute("DROP TRIGGER order_stats_daily_insert_delete ON orders")
+    op.execute("DROP FUNCTION order_stats_daily_apply()")
+    op.drop_table('order_stats_daily')
@@ -0,0 +1,82 @@
+"""Add urgency processing windows and order due times
+
+Revision ID: 4e8a1c6b2d93
+Revises: 7b4d2e8f0a61
+Create Date: 2025-10-09 14:27:38.172650
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic
+revision = '4e8a1c6b2d93'
+down_revision = '7b4d2e8f0a61'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('urgencies', sa.Column('processing_hours', sa.Integer(), nullable=True))
+    op.add_column('orders', sa.Column('due_at', sa.DateTime(), nullable=True))
+    op.add_column('orders', sa.Column('overdue_notified_at', sa.DateTime(), nullable=True))
+    # No urgency has a processing window yet, so no order has a due time to backfill
+    op.execute("""
+        CREATE FUNCTION orders_set_due_at() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.due_at := NEW.created_at + make_interval(
+                hours => (SELECT processing_hours FROM urgencies WHERE id = NEW.urgency_id)
+            );
+            NEW.overdue_notified_at := NULL;
+            RETURN NEW;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER orders_due_at_insert BEFORE INSERT ON orders
+        FOR EACH ROW EXECUTE FUNCTION orders_set_due_at()
+    """)
+    op.execute("""
+        CREATE TRIGGER orders_due_at_update BEFORE UPDATE OF created_at, urgency_id ON orders
+        FOR EACH ROW WHEN ((OLD.created_at, OLD.urgency_id) IS DISTINCT FROM (NEW.created_at, NEW.urgency_id))
+        EXECUTE FUNCTION orders_set_due_at()
+    """)
+    op.execute("""
+        CREATE FUNCTION urgencies_reschedule_orders() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE orders
+            SET due_at = created_at + make_interval(hours => NEW.processing_hours), overdue_notified_at = NULL
+            WHERE urgency_id = NEW.id AND status IN ('draft', 'new', 'in_progress');
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER urgencies_reschedule_orders AFTER UPDATE OF processing_hours ON urgencies
+        FOR EACH ROW WHEN (OLD.processing_hours IS DISTINCT FROM NEW.processing_hours)
+        EXECUTE FUNCTION urgencies_reschedule_orders()
+    """)
+
+    # Built concurrently, outside of the migration transaction, so that orders stay writable
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_orders_due_at_pending', 'orders', ['due_at'],
+            postgresql_where=sa.text("status IN ('draft', 'new', 'in_progress') AND overdue_notified_at IS NULL"),
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_orders_due_at_pending', table_name='orders', postgresql_concurrently=True, if_exists=True)
+
+    op.execute("DROP TRIGGER urgencies_reschedule_orders ON urgencies")
+    op.execute("DROP FUNCTION urgencies_reschedule_orders()")
+    op.execute("DROP TRIGGER orders_due_at_update ON orders")
+    op.execute("DROP TRIGGER orders_due_at_insert ON orders")
+    op.execute("DROP FUNCTION orders_set_due_at()")
+    op.drop_column('orders', 'overdue_notified_at')
+    op.drop_column('orders', 'due_at')
+    op.drop_column('urgencies', 'processing_hours')
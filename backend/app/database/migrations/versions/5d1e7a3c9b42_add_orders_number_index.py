@@ -0,0 +1,29 @@
+"""Add unique covering index of orders.number
+
+Revision ID: 5d1e7a3c9b42
+Revises: c8c0caf5011b
+Create Date: 2025-10-02 11:18:27.540913
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic
+revision = '5d1e7a3c9b42'
+down_revision = 'c8c0caf5011b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Built concurrently, outside of the migration transaction, so that orders stay writable
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_orders_number', 'orders', ['number'], unique=True, postgresql_include=['status', 'updated_at'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_orders_number', table_name='orders', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,42 @@
+"""Add the indexes of the order archival
+
+Revision ID: 6c1f9a3e5b70
+Revises: 4e8a1c6b2d93
+Create Date: 2025-10-14 10:42:17.508311
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic
+revision = '6c1f9a3e5b70'
+down_revision = '4e8a1c6b2d93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Built concurrently, outside of the migration transaction, so that orders stay writable
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_orders_hot_id', 'orders', ['id'],
+            postgresql_where=sa.text("archived_at IS NULL"),
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_orders_hot_client_id', 'orders', ['client_id', 'id'],
+            postgresql_where=sa.text("archived_at IS NULL"),
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_orders_finished_updated_at', 'orders', ['updated_at'],
+            postgresql_where=sa.text("status IN ('completed', 'canceled') AND archived_at IS NULL"),
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name in ('ix_orders_finished_updated_at', 'ix_orders_hot_client_id', 'ix_orders_hot_id'):
+            op.drop_index(index_name, table_name='orders', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,36 @@
+"""Add indexes of orders.created_at and order_services.order_id
+
+Revision ID: 7b4d2e8f0a61
+Revises: 3a7c5e9d1f28
+Create Date: 2025-10-08 10:41:52.906137
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic
+revision = '7b4d2e8f0a61'
+down_revision = '3a7c5e9d1f28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Built concurrently, outside of the migration transaction, so that orders stay writable
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_orders_created_at', 'orders', ['created_at'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_order_services_order_id', 'order_services', ['order_id'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_order_services_order_id', table_name='order_services', postgresql_concurrently=True, if_exists=True
+        )
+        op.drop_index('ix_orders_created_at', table_name='orders', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,67 @@
+"""Create order_status_events table
+
+Revision ID: 9f3b6c2d7e15
+Revises: 5d1e7a3c9b42
+Create Date: 2025-10-03 10:27:44.913502
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic
+revision = '9f3b6c2d7e15'
+down_revision = '5d1e7a3c9b42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'order_status_events',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('old_status', sa.String(), nullable=True),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['order_id'], ['orders.id'], name='order_status_events_order_id_fkey', ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("""
+        CREATE FUNCTION order_status_events_append() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO order_status_events (order_id, old_status, status, created_at)
+            VALUES (NEW.id, CASE WHEN TG_OP = 'UPDATE' THEN OLD.status END, NEW.status, now());
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER order_status_events_insert AFTER INSERT ON orders
+        FOR EACH ROW EXECUTE FUNCTION order_status_events_append()
+    """)
+    op.execute("""
+        CREATE TRIGGER order_status_events_update AFTER UPDATE OF status ON orders
+        FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status) EXECUTE FUNCTION order_status_events_append()
+    """)
+    # The history of existing orders starts with their current status, as of their last update
+    op.execute("""
+        INSERT INTO order_status_events (order_id, status, created_at)
+        SELECT id, status, coalesce(updated_at, created_at, now()) FROM orders ORDER BY id
+    """)
+    op.create_index(
+        'ix_order_status_events_order_id_created_at', 'order_status_events', ['order_id', 'created_at'], unique=False
+    )
+    op.create_index('ix_order_status_events_created_at', 'order_status_events', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER order_status_events_update ON orders")
+    op.execute("DROP TRIGGER order_status_events_insert ON orders")
+    op.execute("DROP FUNCTION order_status_events_append()")
+    op.drop_index('ix_order_status_events_created_at', table_name='order_status_events')
+    op.drop_index('ix_order_status_events_order_id_created_at', table_name='order_status_events')
+    op.drop_table('order_status_events')
@@ -0,0 +1,81 @@
+"""Partition log_entries by month
+
+Revision ID: b81d4f6e2a93
+Revises: 3e5a9c1f7d20
+Create Date: 2025-09-24 10:12:45.561027
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic
+revision = 'b81d4f6e2a93'
+down_revision = '3e5a9c1f7d20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE log_entries RENAME TO log_entries_old")
+    op.execute("ALTER TABLE log_entries_old RENAME CONSTRAINT log_entries_pkey TO log_entries_old_pkey")
+    op.execute("""
+        CREATE TABLE log_entries (
+            user_id INTEGER REFERENCES users (id),
+            action VARCHAR NOT NULL,
+            model_type VARCHAR(30),
+            target_id INTEGER,
+            created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now() NOT NULL,
+            id INTEGER NOT NULL DEFAULT nextval('log_entries_id_seq'),
+            CONSTRAINT log_entries_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute("ALTER SEQUENCE log_entries_id_seq OWNED BY log_entries.id")
+    op.execute("CREATE TABLE log_entries_default PARTITION OF log_entries DEFAULT")
+    # Monthly partitions from the oldest entry up to two months ahead
+    op.execute("""
+        DO $$
+        DECLARE
+            month DATE := date_trunc('month', COALESCE((SELECT min(created_at) FROM log_entries_old), now()));
+        BEGIN
+            WHILE month <= date_trunc('month', now()) + interval '2 month' LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF log_entries FOR VALUES FROM (%L) TO (%L)',
+                    to_char(month, '"log_entries_y"YYYY"m"MM'),
+                    month,
+                    month + interval '1 month'
+                );
+                month := month + interval '1 month';
+            END LOOP;
+        END
+        $$
+    """)
+    op.execute(
+        "INSERT INTO log_entries (user_id, action, model_type, target_id, created_at, id) "
+        "SELECT user_id, action, model_type, target_id, created_at, id FROM log_entries_old"
+    )
+    op.execute("DROP TABLE log_entries_old")
+    op.create_index('ix_log_entries_created_at', 'log_entries', ['created_at'], unique=False)
+    op.create_index('ix_log_entries_model_type_target_id_created_at', 'log_entries', ['model_type', 'target_id', 'created_at'], unique=False)
+    op.create_index('ix_log_entries_user_id_created_at', 'log_entries', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE log_entries RENAME TO log_entries_partitioned")
+    op.execute("ALTER TABLE log_entries_partitioned RENAME CONSTRAINT log_entries_pkey TO log_entries_partitioned_pkey")
+    op.execute("""
+        CREATE TABLE log_entries (
+            user_id INTEGER REFERENCES users (id),
+            action VARCHAR NOT NULL,
+            model_type VARCHAR(30),
+            target_id INTEGER,
+            created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now() NOT NULL,
+            id INTEGER NOT NULL DEFAULT nextval('log_entries_id_seq'),
+            CONSTRAINT log_entries_pkey PRIMARY KEY (id)
+        )
+    """)
+    op.execute("ALTER SEQUENCE log_entries_id_seq OWNED BY log_entries.id")
+    op.execute(
+        "INSERT INTO log_entries (user_id, action, model_type, target_id, created_at, id) "
+        "SELECT user_id, action, model_type, target_id, created_at, id FROM log_entries_partitioned"
+    )
+    op.execute("DROP TABLE log_entries_partitioned")
@@ -0,0 +1,109 @@
+"""Create order_search table
+
+Revision ID: c8c0caf5011b
+Revises: 2a38424d821b
+Create Date: 2025-10-01 09:41:52.637210
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic
+revision = 'c8c0caf5011b'
+down_revision = '2a38424d821b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'order_search',
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('document', postgresql.TSVECTOR(), nullable=False),
+        sa.ForeignKeyConstraint(['order_id'], ['orders.id'], name='order_search_order_id_fkey', ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('order_id')
+    )
+    op.execute("""
+        CREATE FUNCTION order_search_refresh(order_ids integer[]) RETURNS void
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO order_search (order_id, document)
+            SELECT
+                o.id,
+                setweight(to_tsvector('simple', o.id::text || ' ' || translate(coalesce(o.number, ''), '-', ' ')), 'A')
+                || setweight(to_tsvector('simple', translate(
+                    concat_ws(' ', a.first_name, a.last_name, a.email), '@._-', '    '
+                )), 'B')
+                || setweight(to_tsvector('simple', coalesce(c.name, '')), 'C')
+            FROM orders o
+            LEFT JOIN applicants a ON a.order_id = o.id
+            LEFT JOIN clients c ON c.id = o.client_id
+            WHERE o.id = ANY(order_ids)
+            ON CONFLICT (order_id) DO UPDATE SET document = EXCLUDED.document;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE FUNCTION order_search_orders_changed() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM order_search_refresh(ARRAY[NEW.id]);
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE FUNCTION order_search_clients_changed() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM order_search_refresh(ARRAY(SELECT id FROM orders WHERE client_id = NEW.id));
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE FUNCTION order_search_applicants_changed() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                PERFORM order_search_refresh(ARRAY[OLD.order_id]);
+            END IF;
+
+            IF TG_OP <> 'DELETE' THEN
+                PERFORM order_search_refresh(ARRAY[NEW.order_id]);
+            END IF;
+
+            RETURN NULL;
+        END
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER order_search_orders AFTER INSERT OR UPDATE OF number, client_id ON orders
+        FOR EACH ROW EXECUTE FUNCTION order_search_orders_changed()
+    """)
+    op.execute("""
+        CREATE TRIGGER order_search_clients AFTER UPDATE OF name ON clients
+        FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name) EXECUTE FUNCTION order_search_clients_changed()
+    """)
+    op.execute("""
+        CREATE TRIGGER order_search_applicants
+        AFTER INSERT OR UPDATE OF first_name, last_name, email, order_id OR DELETE ON applicants
+        FOR EACH ROW EXECUTE FUNCTION order_search_applicants_changed()
+    """)
+    # Existing orders, before the index so that it is built once
+    op.execute("SELECT order_search_refresh(ARRAY(SELECT id FROM orders))")
+    op.create_index('ix_order_search_document', 'order_search', ['document'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER order_search_applicants ON applicants")
+    op.execute("DROP TRIGGER order_search_clients ON clients")
+    op.execute("DROP TRIGGER order_search_orders ON orders")
+    op.execute("DROP FUNCTION order_search_applicants_changed()")
+    op.execute("DROP FUNCTION order_search_clients_changed()")
+    op.execute("DROP FUNCTION order_search_orders_changed()")
+    op.drop_index('ix_order_search_document', table_name='order_search', postgresql_using='gin')
+    op.drop_table('order_search')
+    op.execute("DROP FUNCTION order_search_refresh(integer[])")
@@ -0,0 +1,111 @@
+"""Column-projected selects shaped for a response schema."""
+from dataclasses import dataclass, field
+from typing import Any, Optional, Sequence
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+from sqlalchemy import Select, inspect, select
+from sqlalchemy.orm import DeclarativeBase, aliased
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.schemas.serializers import get_nested_schema
+
+
+@dataclass
+class _Node:
+    """Positions of the values of one (nested) object in a projected row."""
+    columns: list[tuple[str, int]] = field(default_factory=list)
+    children: list[tuple[str, "_Node"]] = field(default_factory=list)
+    # Position of the primary key of an outer joined object; None for the root
+    key_index: Optional[int] = None
+
+    def build(self, row: Any) -> Optional[dict[str, Any]]:
+        if self.key_index is not None and row[self.key_index] is None:
+            return None
+
+        data = {name: row[index] for name, index in self.columns}
+
+        for name, child in self.children:
+            data[name] = child.build(row)
+
+        return data
+
+
+class SchemaProjection:
+    """The columns of a model, and of its scalar relations, that a response schema reads.
+
+    Fields named after a column select that column. Fields named after a scalar (many-to-one or
+    one-to-one) relationship with a nested schema outer join the related table and project the
+    nested schema recursively.
+    Other fields must have a default (such as ``MODEL_TYPE``), which the serializer fills in.
+    Collections cannot be projected into flat rows, so a schema with a collection field, or any
+    other field that has no column and no default, is rejected when the projection is built.
+
+    Rows of `select` are turned into nested dicts by `to_dicts`, so no ORM instance is built and
+    nothing enters the identity map. The dicts feed `app.schemas.serializers.FastSerializer`.
+    """
+
+    def __init__(self, model: type[DeclarativeBase], schema: type[BaseModel]) -> None:
+        self.model = model
+        self.schema = schema
+        self.columns: list[ColumnElement] = []
+        self.joins: list[tuple[Any, Any]] = []
+        self._root = self._project(inspect(model).entity, model, schema, ())
+
+    def _add_column(self, column: Any, path: tuple[str, ...]) -> int:
+        self.columns.append(column.label("_".join(path)))
+        return len(self.columns) - 1
+
+    def _project(self, entity: Any, model: type[DeclarativeBase], schema: type[BaseModel], path: tuple[str, ...]) -> _Node:
+        mapper = inspect(model)
+        node = _Node()
+
+        for name, schema_field in schema.model_fields.items():
+            if name in mapper.columns:
+                node.columns.append((name, self._add_column(getattr(entity, name), path + (name,))))
+                continue
+
+            relationship = mapper.relationships.get(name)
+            nested = get_nested_schema(schema_field.annotation)
+
+            if relationship is not None and nested is not None and not relationship.uselist:
+                related = relationship.mapper.class_
+                target = aliased(related, name="_".join(path + (name,)))
+                self.joins.append((target, getattr(entity, name).of_type(target)))
+                primary_key = inspect(related).primary_key[0].key
+                child = self._project(target, related, nested, path + (name,))
+                child.key_index = self._add_column(getattr(target, primary_key), path + (name, "pk"))
+                node.children.append((name, child))
+                continue
+
+            if schema_field.default is PydanticUndefined and schema_field.default_factory is None:
+                raise ValueError(f"{schema.__name__}.{name} cannot be projected from {model.__name__}")
+
+        return node
+
+    def select(self) -> Select:
+        """Return the select of the projected columns, with the joins of the nested relations."""
+        statement = select(*self.columns).select_from(self.model)
+
+        for target, on in self.joins:
+            statement = statement.outerjoin(target, on)
+
+        return statement
+
+    def to_dicts(self, rows: Sequence[Any]) -> list[dict[str, Any]]:
+        """Shape the rows of `select` as nested dicts keyed by the schema fields."""
+        build = self._root.build
+        return [build(row) for row in rows]  # type: ignore[misc]
+
+
+_projections: dict[tuple[type[DeclarativeBase], type[BaseModel]], SchemaProjection] = {}
+
+
+def get_projection(model: type[DeclarativeBase], schema: type[BaseModel]) -> SchemaProjection:
+    """Return the projection of a model for a schema, building it on first use."""
+    projection = _projections.get((model, schema))
+
+    if projection is None:
+        projection = _projections[model, schema] = SchemaProjection(model, schema)
+
+    return projection
@@ -1,24 +1,193 @@
+import base64
+import logging
 from collections.abc import Sequence
+from datetime import date, datetime
+from typing import Any, Optional
 
-from sqlalchemy import select, desc
+from sqlalchemy import desc, func, insert, select, text, tuple_
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app import config
 from app.database.repositories.base import BaseRepository
+from app.exceptions import InvalidCursorException
+from app.helpers import add_months
 from app.models.audit import LogEntry
-from app.schemas.audit import LogEntryCreateSchema
+from app.schemas.audit import LogEntryCreateSchema, LogEntryFilterSchema
+from app.services import audit_sink
+
+logger = logging.getLogger(__name__)
 
 
 class AuditRepository(BaseRepository):
+    # Key of the transaction advisory lock held while rotating the partitions
+    PARTITIONS_LOCK_KEY = 0x6C6F6765  # "loge"
+
     def __int__(self, db: AsyncSession):
         self.db = db
 
-    async def create(self, *, data: LogEntryCreateSchema) -> LogEntry:
+    async def create(self, *, data: LogEntryCreateSchema) -> Optional[LogEntry]:
+        """Record an audit entry.
+
+        The entry is handed to the batched audit sink when it is running. In strict mode, or
+        without a running sink, it is written in the caller's transaction instead and committed
+        together with the caller's changes.
+
+        Returns:
+            Optional[LogEntry]: The flushed entry, or None if it was queued.
+        """
+        if audit_sink.is_running and not config.AUDIT_STRICT_MODE:
+            audit_sink.enqueue(data)
+            return None
+
         entry: LogEntry = LogEntry(**data.model_dump())
         self.db.add(entry)
-        await self.db.commit()
+        await self.db.flush()
         return entry
 
-    async def get_for_user(self, *, user_id: int) -> Sequence[LogEntry]:
-        statement = select(LogEntry).where(LogEntry.user_id == user_id).order_by(desc(LogEntry.id))
-        results = await self.db.execute(statement)
-        return results.scalars().all()
+    async def create_many(self, *, data: list[LogEntryCreateSchema]) -> None:
+        """Record a batch of audit entries.
+
+        Same as `create` for each entry, except that without a running sink the entries are
+        written by a single multi-row insert.
+        """
+        if not data:
+            return
+
+        if audit_sink.is_running and not config.AUDIT_STRICT_MODE:
+            for item in data:
+                audit_sink.enqueue(item)
+            return
+
+        await self.db.execute(insert(LogEntry), [item.model_dump() for item in data])
+
+    async def get_for_user(self, *, user_id: int, limit: int = 100) -> Sequence[LogEntry]:
+        """Retrieve the latest entries of a user, newest first."""
+        result = await self.get_list(query_filters=LogEntryFilterSchema(user_id=user_id), size=limit)
+        return result["items"]
+
+    async def get_list(
+            self,
+            *,
+            query_filters: Optional[LogEntryFilterSchema] = None,
+            cursor: Optional[str] = None,
+            size: int = 25
+    ) -> dict[str, Any]:
+        """Retrieve a page of log entries, newest first, using keyset pagination.
+
+        Pages are delimited by the (created_at, id) of their last entry rather than an offset,
+        so every page is an index range scan on one of the (..., created_at) indexes and only
+        touches the partitions it needs.
+
+        Args:
+            query_filters (Optional[LogEntryFilterSchema]): Filters to apply.
+            cursor (Optional[str]): The `next_cursor` of the previous page.
+            size (int): The page size.
+
+        Returns:
+            dict[str, Any]: The entries under "items" and the cursor of the next page, if any,
+                under "next_cursor".
+
+        Raises:
+            InvalidCursorException: If the cursor cannot be decoded.
+        """
+        statement = select(LogEntry).order_by(desc(LogEntry.created_at), desc(LogEntry.id)).limit(size + 1)
+
+        if query_filters:
+            for field, value in query_filters.model_dump(exclude_none=True).items():
+                statement = statement.where(getattr(LogEntry, field) == value)
+
+        if cursor:
+            statement = statement.where(tuple_(LogEntry.created_at, LogEntry.id) < self.decode_cursor(cursor))
+
+        entries = list((await self.db.scalars(statement)).all())
+        next_cursor = None
+
+        if len(entries) > size:
+            entries = entries[:size]
+            next_cursor = self.encode_cursor(entries[-1])
+
+        return {"items": entries, "next_cursor": next_cursor}
+
+    @staticmethod
+    def encode_cursor(entry: LogEntry) -> str:
+        value = f"{entry.created_at.isoformat()}|{entry.id}"
+        return base64.urlsafe_b64encode(value.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, int]:
+        try:
+            created_at, entry_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+            return datetime.fromisoformat(created_at), int(entry_id)
+        except ValueError:
+            raise InvalidCursorException()
+
+    async def get_partitions(self) -> list[str]:
+        """Retrieve the names of the partitions of log_entries."""
+        statement = text(
+            "SELECT inhrelid::regclass::text FROM pg_inherits "
+            "WHERE inhparent = 'log_entries'::regclass ORDER BY 1"
+        )
+        return list((await self.db.scalars(statement)).all())
+
+    async def rotate_partitions(self, *, today: date, months_ahead: int, retention_months: int) -> dict[str, list[str]]:
+        """Create upcoming monthly partitions and drop the expired ones.
+
+        Dropping a partition discards a whole month of entries at once, without the table
+        bloat and WAL volume of a DELETE. Upcoming partitions must exist before their month
+        starts, otherwise entries land in the default partition.
+
+        Every worker runs the rotation, so it is done under an advisory lock: a worker that does
+        not get it leaves the rotation to the one holding it, rather than creating or dropping
+        the same tables concurrently.
+
+        Args:
+            today (date): The current date.
+            months_ahead (int): How many months after the current one to have partitions for.
+            retention_months (int): How many months, including the current one, to keep.
+
+        Returns:
+            dict[str, list[str]]: The names of the "created" and "dropped" partitions.
+        """
+        locked = await self.db.scalar(select(func.pg_try_advisory_xact_lock(self.PARTITIONS_LOCK_KEY)))
+
+        if not locked:
+            await self.db.rollback()
+            return {"created": [], "dropped": []}
+
+        existing = set(await self.get_partitions())
+        current_month = today.replace(day=1)
+        created, dropped = [], []
+
+        for offset in range(months_ahead + 1):
+            month = add_months(current_month, offset)
+            name = month.strftime(LogEntry.PARTITION_NAME_FORMAT)
+
+            if name in existing:
+                continue
+
+            try:
+                async with self.db.begin_nested():
+                    await self.db.execute(text(
+                        f"CREATE TABLE {name} PARTITION OF log_entries "
+                        f"FOR VALUES FROM ('{month}') TO ('{add_months(month, 1)}')"
+                    ))
+                created.append(name)
+            except SQLAlchemyError as e:
+                # E.g. the default partition already holds entries of that month
+                logger.error(f"Failed to create partition {name}: {str(e)}")
+
+        oldest_kept = add_months(current_month, 1 - retention_months)
+
+        for name in sorted(existing):
+            try:
+                month = datetime.strptime(name, LogEntry.PARTITION_NAME_FORMAT).date()
+            except ValueError:
+                continue  # The default partition
+
+            if month < oldest_kept:
+                await self.db.execute(text(f"DROP TABLE {name}"))
+                dropped.append(name)
+
+        await self.db.commit()
+        return {"created": created, "dropped": dropped}
@@ -1,10 +1,13 @@
 from typing import Any, Optional, TypeVar, Type, Generic
 
+from pydantic import BaseModel
 from sqlalchemy import select, func, and_
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql.elements import ClauseElement
+from sqlalchemy.sql.elements import ColumnElement
 
+from app.database.loaders import loader_registry
+from app.database.projection import get_projection
 from app.schemas.pagination import PageParamsSchema
 
 
@@ -18,6 +21,9 @@ class BaseRepository:
 
 
 class BasePaginatedRepository(BaseRepository, Generic[ModelType]):
+    # Schema the list items are serialized with; its relations are eagerly loaded by `get_paginated_list`
+    list_schema: Optional[Type[BaseModel]] = None
+
     def __init__(self, db: AsyncSession, model: Type[ModelType]) -> None:
         super().__init__(db)
         self.model = model
@@ -27,35 +33,36 @@ class BasePaginatedRepository(BaseRepository, Generic[ModelType]):
             *,
             query_filters: Optional[FilterSchemaType] = None,
             page_params: PageParamsSchema,
-            additional_filters: Optional[list[ClauseElement]] = None,
+            additional_filters: Optional[list[ColumnElement[bool]]] = None,
             order_by: Optional[Any] = None,
-            options: Optional[list] = None
+            options: Optional[list] = None,
+            schema: Optional[Type[BaseModel]] = None,
     ) -> dict[str, Any]:
         """
         Generic paginated list method
 
+        Unless `options` are given, the relationships read by the item schema (`schema`, or the
+        `list_schema` of the repository) are loaded with the options of `loader_registry`.
+
         Args:
             query_filters: Filter shema object
             page_params: Pagination parameters
             additional_filters: Extra SQLAlchemy filters
-            order_by: Ordering criteria (defaults to model.id)
+            order_by: Ordering criteria (defaults to `default_order_by`)
             options: SQLAlchemy options like selectinload, joinedload
+            schema: Item schema of the response, defaults to `list_schema`
         """
         statement = select(self.model)
+        schema = schema or self.list_schema
+
+        if options is None and schema is not None:
+            options = loader_registry.options(self.model, schema)
 
         # Apply options like selectinload, joinedload
         if options:
             statement = statement.options(*options)
 
-        # Build filters from query_filters if the repository has build filters method
-        filters = []
-
-        if hasattr(self, "build_filters") and query_filters:
-            filters.extend(self.build_filters(query_filters=query_filters))
-
-        # Add any additional filters
-        if additional_filters:
-            filters.extend(additional_filters)
+        filters = self._collect_filters(query_filters=query_filters, additional_filters=additional_filters)
 
         # Apply filters
         if filters:
@@ -65,10 +72,83 @@ class BasePaginatedRepository(BaseRepository, Generic[ModelType]):
         if order_by is not None:
             statement = statement.order_by(order_by)
         else:
-            statement = statement.order_by(self.model.id)
+            statement = statement.order_by(*self.default_order_by(query_filters=query_filters))
 
         return await self.paginate(query=statement, page_params=page_params)
 
+    async def get_projected_paginated_list(
+            self,
+            *,
+            schema: Type[BaseModel],
+            query_filters: Optional[FilterSchemaType] = None,
+            page_params: PageParamsSchema,
+            additional_filters: Optional[list[ColumnElement[bool]]] = None,
+            order_by: Optional[Any] = None,
+    ) -> dict[str, Any]:
+        """
+        Paginated list of column-projected rows
+
+        Same as `get_paginated_list`, but only the columns `schema` reads are selected, with its
+        nested scalar relations joined in the same statement (see `SchemaProjection`). Items
+        are dicts shaped for `schema` rather than ORM instances, so they are meant to be
+        serialized with `get_serializer(...)`, not modified.
+
+        Args:
+            schema: Item schema of the response
+            query_filters: Filter shema object
+            page_params: Pagination parameters
+            additional_filters: Extra SQLAlchemy filters
+            order_by: Ordering criteria (defaults to `default_order_by`)
+        """
+        projection = get_projection(self.model, schema)
+        filters = self._collect_filters(query_filters=query_filters, additional_filters=additional_filters)
+        page = page_params.page
+        size = page_params.size
+
+        total = await self.db.scalar(select(func.count()).select_from(self.model).where(*filters))
+        ordering = [order_by] if order_by is not None else self.default_order_by(query_filters=query_filters)
+        statement = (
+            projection.select()
+            .where(*filters)
+            .order_by(*ordering)
+            .offset((page - 1) * size)
+            .limit(size)
+        )
+        items = projection.to_dicts((await self.db.execute(statement)).all())
+        total_pages = (total + size - 1) // size if total else 0
+
+        return dict(
+            page=page,
+            size=size,
+            total=total,
+            total_pages=total_pages,
+            has_next=page < total_pages,
+            has_prev=page > 1,
+            items=items,
+        )
+
+    def default_order_by(self, *, query_filters: Optional[FilterSchemaType] = None) -> list:
+        """Ordering of the lists that are not given one, by id"""
+        return [self.model.id]
+
+    def _collect_filters(
+            self,
+            *,
+            query_filters: Optional[FilterSchemaType],
+            additional_filters: Optional[list[ColumnElement[bool]]],
+    ) -> list[ColumnElement[bool]]:
+        # Build filters from query_filters if the repository has build filters method
+        filters: list[ColumnElement[bool]] = []
+
+        if hasattr(self, "build_filters") and query_filters:
+            filters.extend(self.build_filters(query_filters=query_filters))
+
+        # Add any additional filters
+        if additional_filters:
+            filters.extend(additional_filters)
+
+        return filters
+
     async def paginate(
             self,
             query,
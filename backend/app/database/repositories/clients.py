@@ -2,18 +2,18 @@ from typing import Any, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import joinedload
 from sqlalchemy.sql.elements import ClauseElement
 
 from app.database.repositories.base import BasePaginatedRepository
-from app.database.repositories.mixins import BuildFiltersMixin
+from app.database.repositories.mixins import BuildFiltersMixin, NameSearchMixin
 from app.database.repositories.users import UsersRepository
 from app.models.clients import Client
-from app.schemas.client import ClientCreateSchema, ClientFilterSchema
+from app.schemas.client import ClientCreateSchema, ClientFilterSchema, ClientPublicSchema
 from app.schemas.pagination import PageParamsSchema
 
 
-class ClientsRepository(BasePaginatedRepository[Client], BuildFiltersMixin):
+class ClientsRepository(NameSearchMixin, BasePaginatedRepository[Client], BuildFiltersMixin):
     """Repository for managing client data in the database.
 
     This class provides methods to create, retrieve, and filter clients, as well as
@@ -23,6 +23,9 @@ class ClientsRepository(BasePaginatedRepository[Client], BuildFiltersMixin):
         users_repo (UsersRepository): Repository for accessing user data.
     """
 
+    list_schema = ClientPublicSchema
+    search_expression = Client.__table__.c.name
+
     def __init__(self, db: AsyncSession) -> None:
         """Initialize the ClientsRepository with a database session.
 
@@ -48,7 +51,7 @@ class ClientsRepository(BasePaginatedRepository[Client], BuildFiltersMixin):
         filters: list[ClauseElement] = list()
 
         if query_filters.name:
-            filters.append(Client.name.ilike(f"%{query_filters.name}%"))
+            filters.append(self.name_filter(query_filters.name))
 
         if query_filters.type:
             filters.append(Client.type == query_filters.type)
@@ -74,7 +77,6 @@ class ClientsRepository(BasePaginatedRepository[Client], BuildFiltersMixin):
         return await super().get_paginated_list(
             query_filters=query_filters,
             page_params=page_params,
-            options=[selectinload(Client.tariff)]
         )
 
     async def get_by_id(self, *, client_id: int) -> Client | None:
@@ -4,13 +4,15 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.sql.elements import ClauseElement
 
 from app.database.repositories.base import BasePaginatedRepository
-from app.database.repositories.mixins import BuildFiltersMixin
+from app.database.repositories.mixins import BuildFiltersMixin, NameSearchMixin
 from app.models import CountryVisa, VisaType
 from app.models.countries import Country
 from app.schemas.country import CountryFilterSchema, CountryUpdateSchema
 
 
-class CountriesRepository(BasePaginatedRepository[Country], BuildFiltersMixin):
+class CountriesRepository(NameSearchMixin, BasePaginatedRepository[Country], BuildFiltersMixin):
+    search_expression = Country.__table__.c.name
+
     def __init__(self, db: AsyncSession):
         super().__init__(db=db, model=Country)
 
@@ -18,7 +20,7 @@ class CountriesRepository(BasePaginatedRepository[Country], BuildFiltersMixin):
         filters: list[ClauseElement] = list()
 
         if query_filters.name:
-            filters.append(Country.name.ilike(f"%{query_filters.name}%"))
+            filters.append(self.name_filter(query_filters.name))
 
         if query_filters.available_for_order is not None:
             filters.append(
@@ -29,7 +31,7 @@ class CountriesRepository(BasePaginatedRepository[Country], BuildFiltersMixin):
 
     async def get_full_list(self, *, query_filters: CountryFilterSchema):
         """Retrieve all countries, only filters can be applied"""
-        statement = select(Country).order_by(Country.id)
+        statement = select(Country).order_by(*self.default_order_by(query_filters=query_filters))
 
         if filters := self.build_filters(query_filters=query_filters):
             statement = statement.where(and_(*filters))
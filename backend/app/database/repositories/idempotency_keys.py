@@ -0,0 +1,176 @@
+import logging
+from datetime import timedelta
+from typing import Any, Optional
+
+from sqlalchemy import delete, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import config
+from app.database.repositories.base import BaseRepository
+from app.models.idempotency_keys import IdempotencyKey
+from app.services import cache_service
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyKeysRepository(BaseRepository):
+    """Repository for the idempotency keys of requests and the responses they got.
+
+    Completed responses are also kept in a cache namespace until their key expires, so that the
+    retries of a request are replayed without a database round trip.
+    """
+
+    cache = cache_service.namespace("idempotency", ttl=config.IDEMPOTENCY_KEY_TTL_SECONDS)
+
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__(db)
+
+    async def get_cached(self, *, user_id: int, key: str) -> Optional[tuple[bytes, int, bytes]]:
+        """Return the fingerprint, status code and body stored for a completed key, if cached."""
+        return await self.cache.get(f"{user_id}:{key}")
+
+    async def claim(self, *, user_id: int, key: str, fingerprint: bytes) -> Optional[dict[str, Any]]:
+        """Claim a key for a request about to be handled.
+
+        A single INSERT ... ON CONFLICT, which also takes over a key that expired but was not
+        purged yet. The claim is committed, so concurrent requests with the same key see it.
+
+        Args:
+            user_id (int): The user sending the request.
+            key (str): The idempotency key.
+            fingerprint (bytes): The fingerprint of the request.
+
+        Returns:
+            Optional[dict[str, Any]]: None if the key was claimed. Otherwise the fingerprint,
+                status_code and body stored for the key, the last two None while the request
+                holding it is handled.
+
+        Raises:
+            SQLAlchemyError: If the insert fails.
+        """
+        expires_at = func.localtimestamp() + timedelta(seconds=config.IDEMPOTENCY_KEY_TTL_SECONDS)
+        statement = (
+            insert(IdempotencyKey)
+            .values(user_id=user_id, key=key, fingerprint=fingerprint, expires_at=expires_at)
+            .on_conflict_do_update(
+                index_elements=[IdempotencyKey.user_id, IdempotencyKey.key],
+                set_=dict(fingerprint=fingerprint, status_code=None, body=None, expires_at=expires_at),
+                where=IdempotencyKey.expires_at <= func.localtimestamp(),
+            )
+            .returning(IdempotencyKey.key)
+        )
+
+        try:
+            claimed = (await self.db.execute(statement)).first() is not None
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to claim idempotency key {key}: {str(e)}")
+            await self.db.rollback()
+            raise e
+
+        if claimed:
+            return None
+
+        # Columns rather than the entity, so that a row loaded earlier by the session is not reused
+        result = await self.db.execute(
+            select(
+                IdempotencyKey.fingerprint,
+                IdempotencyKey.status_code,
+                IdempotencyKey.body,
+                (IdempotencyKey.expires_at - func.localtimestamp()).label("expires_in"),
+            )
+            .where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+        )
+        row = result.mappings().first()
+
+        # Released by a failed request in the meantime: it is in progress as far as this one knows
+        if row is None:
+            return {"fingerprint": fingerprint, "status_code": None, "body": None}
+
+        if row["status_code"] is not None and row["expires_in"] > timedelta(0):
+            await self.cache.set(
+                f"{user_id}:{key}",
+                (row["fingerprint"], row["status_code"], row["body"]),
+                ttl=row["expires_in"].total_seconds()
+            )
+
+        return {name: row[name] for name in ("fingerprint", "status_code", "body")}
+
+    async def complete(self, *, user_id: int, key: str, fingerprint: bytes, status_code: int, body: bytes) -> None:
+        """Store the response of the request holding a key, and cache it.
+
+        Raises:
+            SQLAlchemyError: If the update fails.
+        """
+        statement = (
+            update(IdempotencyKey)
+            .where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+            .values(status_code=status_code, body=body)
+            .execution_options(synchronize_session=False)
+        )
+
+        try:
+            await self.db.execute(statement)
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to complete idempotency key {key}: {str(e)}")
+            await self.db.rollback()
+            raise e
+
+        await self.cache.set(f"{user_id}:{key}", (fingerprint, status_code, body))
+
+    async def release(self, *, user_id: int, key: str) -> None:
+        """Drop the claim of a request that failed, so that it can be retried with the same key.
+
+        Raises:
+            SQLAlchemyError: If the delete fails.
+        """
+        statement = delete(IdempotencyKey).where(
+            IdempotencyKey.user_id == user_id,
+            IdempotencyKey.key == key,
+            IdempotencyKey.status_code.is_(None),
+        )
+
+        try:
+            await self.db.execute(statement)
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to release idempotency key {key}: {str(e)}")
+            await self.db.rollback()
+            raise e
+
+    async def purge_expired(self, *, limit: int) -> int:
+        """Delete up to `limit` expired keys, read from `ix_idempotency_keys_expires_at`.
+
+        Rows locked by another worker are skipped.
+
+        Returns:
+            int: The number of keys deleted.
+
+        Raises:
+            SQLAlchemyError: If the delete fails.
+        """
+        expired = (
+            select(IdempotencyKey.user_id, IdempotencyKey.key)
+            .where(IdempotencyKey.expires_at <= func.localtimestamp())
+            .order_by(IdempotencyKey.expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        statement = (
+            delete(IdempotencyKey)
+            .where(tuple_(IdempotencyKey.user_id, IdempotencyKey.key).in_(expired))
+            .execution_options(synchronize_session=False)
+        )
+
+        try:
+            result = await self.db.execute(statement)
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to purge idempotency keys: {str(e)}")
+            await self.db.rollback()
+            raise e
+
+        return result.rowcount
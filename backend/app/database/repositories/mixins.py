@@ -1,4 +1,10 @@
 from abc import abstractmethod
+from typing import Any, ClassVar, Optional
+
+from sqlalchemy.sql.elements import ColumnElement
+
+from app import config
+from app.database.search import name_search, similarity
 
 
 class BuildFiltersMixin:
@@ -6,3 +12,25 @@ class BuildFiltersMixin:
     def build_filters(self, *, query_filters) -> list:
         """Build SQLAlchemy filter conditions from query filters"""
         pass
+
+
+class NameSearchMixin:
+    """Name filter of a paginated repository, served by the trigram index of `search_expression`.
+
+    With `SEARCH_SIMILARITY`, names similar to the term match too and lists filtered by name are
+    ranked by similarity, the most similar first.
+    """
+
+    search_expression: ClassVar[ColumnElement]
+
+    def name_filter(self, term: str) -> ColumnElement:
+        return name_search(self.search_expression, term)
+
+    def default_order_by(self, *, query_filters: Optional[Any] = None) -> list:
+        term = getattr(query_filters, "name", None)
+        ordering = super().default_order_by(query_filters=query_filters)  # type: ignore[misc]
+
+        if term and config.SEARCH_SIMILARITY:
+            return [similarity(self.search_expression, term).desc(), *ordering]
+
+        return ordering
@@ -7,8 +7,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, aliased
 
 from app.database.repositories.base import BaseRepository
-from app.models import Client, Order, OrderService, Service, TariffService
+from app.database.repositories.tariffs import TariffsRepository
+from app.exceptions import InvalidTariffServicesException
+from app.models import Client, Order, OrderService, Service, Tariff, TariffService
 from app.schemas.order_service import OrderServicesUpdateSchema
+from app.services import tariff_version_service
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +31,7 @@ class OrderServicesRepository(BaseRepository):
             db: Async database session
         """
         super().__init__(db)
+        self.tariffs_repo = TariffsRepository(db)
 
     async def get_for_order(self, *, order_id: int) -> dict[str, Sequence | None]:
         """
@@ -35,7 +39,8 @@ class OrderServicesRepository(BaseRepository):
 
         This method fetches:
         - Services already attached to the order
-        - Services available for attachment based on order criteria and client's tariff
+        - Services available for attachment based on order criteria and client's tariff,
+          priced with the active version of the tariff
 
         Args:
             order_id: ID of the order to retrieve services for
@@ -86,10 +91,14 @@ class OrderServicesRepository(BaseRepository):
                 .subquery()
             )
 
+            version_id = await tariff_version_service.get_active_version_id(
+                tariffs_repo=self.tariffs_repo,
+                tariff_id=tariff_id
+            )
             TS = aliased(TariffService)
             available_statement = (
                 select(Service, TS)
-                .join(TS, and_(TS.service_id == Service.id, TS.tariff_id == tariff_id))
+                .join(TS, and_(TS.service_id == Service.id, TS.version_id == version_id))
                 .where(~Service.id.in_(attached_ids))
             )
 
@@ -140,6 +149,8 @@ class OrderServicesRepository(BaseRepository):
             data: Schema containing tariff_services_ids to attach to the order
 
         Raises:
+            InvalidTariffServicesException: If a tariff service is not in the active version of the
+                tariff of the order's client
             Exception: If database operation fails
 
         Note:
@@ -151,30 +162,35 @@ class OrderServicesRepository(BaseRepository):
             tariff_services_ids: Optional[list[int]] = data.tariff_services_ids
 
             if tariff_services_ids is not None:
-                delete_stmt = delete(OrderService).where(OrderService.order_id == order_id)
-                await self.db.execute(delete_stmt)
+                rows: Sequence = []
 
                 if tariff_services_ids:
-                    services_stmt = select(
-                        TariffService.price,
-                        TariffService.tax,
-                        TariffService.service_id
-                    ).where(TariffService.id.in_(tariff_services_ids))
+                    # Only the services of the active version of the client's tariff: a reprice gives
+                    # the services new ids, so ids of older versions would attach outdated prices
+                    services_stmt = (
+                        select(
+                            TariffService.id,
+                            TariffService.price,
+                            TariffService.tax,
+                            TariffService.service_id
+                        )
+                        .join(Tariff, Tariff.active_version_id == TariffService.version_id)
+                        .join(Client, Client.tariff_id == Tariff.id)
+                        .join(Order, Order.client_id == Client.id)
+                        .where(Order.id == order_id, TariffService.id.in_(tariff_services_ids))
+                    )
                     rows = (await self.db.execute(services_stmt)).all()
 
-                    if not rows:
-                        logger.warning(f"No tariff services found for IDs: {tariff_services_ids}")
-                        await self.db.commit()
-                        return
-
-                    order_services_data = []
-
-                    for price, tax, service_id in rows:
-                        order_services_data.append(
-                            OrderService(price=price, tax=tax, order_id=order_id, service_id=service_id)
-                        )
-                    self.db.add_all(order_services_data)
+                    if len(rows) != len(set(tariff_services_ids)):
+                        logger.warning(f"Tariff services not in the active tariff version: {tariff_services_ids}")
+                        raise InvalidTariffServicesException()
 
+                delete_stmt = delete(OrderService).where(OrderService.order_id == order_id)
+                await self.db.execute(delete_stmt)
+                self.db.add_all(
+                    OrderService(price=price, tax=tax, order_id=order_id, service_id=service_id)
+                    for _, price, tax, service_id in rows
+                )
                 await self.db.commit()
         except SQLAlchemyError as e:
             logger.error(f"Failed to update services for order: {str(e)}")
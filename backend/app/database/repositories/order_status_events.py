@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.repositories.base import BaseRepository
+from app.models import OrderStatusEvent
+
+# Percentiles of `get_status_durations`, by name
+DURATION_PERCENTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+# Window of `get_status_durations` when no start is given
+DEFAULT_DURATIONS_WINDOW = timedelta(days=30)
+
+
+class OrderStatusEventsRepository(BaseRepository):
+    """Repository for reading the status history of orders.
+
+    Events are appended by triggers on orders (see `OrderStatusEvent`), so this repository only reads.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__(db)
+
+    async def get_timeline(self, *, order_id: int) -> list[dict[str, Any]]:
+        """Retrieve the status history of an order, oldest first.
+
+        A single range scan of `ix_order_status_events_order_id_created_at`; the time the order
+        left each status is the time of the next event, computed by a window function.
+
+        Args:
+            order_id (int): The ID of the order.
+
+        Returns:
+            list[dict[str, Any]]: The id, old_status, status, created_at and left_at of each event,
+                left_at being None for the current status. Empty if the order does not exist.
+        """
+        ordering = (OrderStatusEvent.created_at, OrderStatusEvent.id)
+        statement = (
+            select(
+                OrderStatusEvent.id,
+                OrderStatusEvent.old_status,
+                OrderStatusEvent.status,
+                OrderStatusEvent.created_at,
+                func.lead(OrderStatusEvent.created_at).over(order_by=ordering).label("left_at"),
+            )
+            .where(OrderStatusEvent.order_id == order_id)
+            .order_by(*ordering)
+        )
+        return [row._asdict() for row in await self.db.execute(statement)]
+
+    async def get_status_durations(self, *, status: str, since: Optional[datetime] = None) -> dict[str, Any]:
+        """Retrieve percentiles of the time orders spent in a status.
+
+        The stays considered are those that started at or after `since`. The stays that have not
+        ended yet are counted under "open" and left out of the percentiles.
+
+        Args:
+            status (str): The status.
+            since (Optional[datetime]): The start of the window, defaults to `DEFAULT_DURATIONS_WINDOW` ago.
+
+        Returns:
+            dict[str, Any]: The status, since, the number of "completed" and "open" stays, and the
+                `DURATION_PERCENTILES` of the completed stays in seconds, None without any.
+        """
+        since = since or datetime.now() - DEFAULT_DURATIONS_WINDOW
+        # Events after `since` only: the event ending a stay comes after the one starting it
+        events = (
+            select(
+                OrderStatusEvent.status,
+                OrderStatusEvent.created_at,
+                func.lead(OrderStatusEvent.created_at).over(
+                    partition_by=OrderStatusEvent.order_id,
+                    order_by=(OrderStatusEvent.created_at, OrderStatusEvent.id)
+                ).label("left_at"),
+            )
+            .where(OrderStatusEvent.created_at >= since)
+            .subquery("events")
+        )
+        duration = func.extract("epoch", events.c.left_at - events.c.created_at)
+        statement = select(
+            func.count(events.c.left_at).label("completed"),
+            func.count().filter(events.c.left_at.is_(None)).label("open"),
+            *(
+                func.percentile_cont(fraction).within_group(duration).label(name)
+                for name, fraction in DURATION_PERCENTILES.items()
+            ),
+        ).where(events.c.status == status)
+        row = (await self.db.execute(statement)).one()._asdict()
+
+        for name in DURATION_PERCENTILES:
+            if row[name] is not None:
+                row[name] = float(row[name])
+
+        return {"status": status, "since": since, **row}
@@ -1,18 +1,22 @@
 import logging
 
-from typing import Optional
+from datetime import datetime
+from typing import Any, Optional
 
-from sqlalchemy import select
+from sqlalchemy import Integer, String, any_, bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from sqlalchemy.sql.elements import ClauseElement
 
-from app.database.repositories.base import BasePaginatedRepository
+from app.database.repositories.base import BasePaginatedRepository, FilterSchemaType
+from app.database.projection import get_projection
 from app.database.repositories.mixins import BuildFiltersMixin
-from app.models import Order, Applicant, Client
-from app.schemas.order.admin import AdminOrderCreateSchema, AdminOrderUpdateSchema
-from app.schemas.order.admin import AdminOrderFilterSchema
+from app.database.search import prefix_tsquery
+from app.models import Order, Applicant, Client, OrderSearch
+from app.schemas.order.admin import AdminOrderCreateSchema, AdminOrderListSchema, AdminOrderUpdateSchema
+from app.schemas.order.admin import AdminOrderFilterSchema, AdminOrderStatusSchema
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +30,8 @@ class OrdersRepository(BasePaginatedRepository[Order], BuildFiltersMixin):
         db (AsyncSession): The asynchronous database session used for operations.
     """
 
+    list_schema = AdminOrderListSchema
+
     def __init__(self, db: AsyncSession) -> None:
         """Initialize the OrdersRepository with a database session.
 
@@ -59,8 +65,42 @@ class OrdersRepository(BasePaginatedRepository[Order], BuildFiltersMixin):
                     getattr(self.model, attr) == value
                 )
 
+        if query_filters.q and (query := prefix_tsquery(query_filters.q)) is not None:
+            matches = select(OrderSearch.order_id).where(OrderSearch.document.bool_op("@@")(query))
+            # An array of ids rather than an IN subquery: the planner then filters orders by primary
+            # key before joining the relations of the list, instead of joining every order first
+            filters.append(Order.id == any_(func.array(matches.scalar_subquery())))
+
+        # Served by the partial indexes of the orders not archived
+        if not query_filters.include_archived:
+            filters.append(Order.archived_at.is_(None))
+
         return filters
 
+    def default_order_by(self, *, query_filters: Optional[FilterSchemaType] = None) -> list:
+        """Order searched lists by relevance, the orders whose number matches first.
+
+        Args:
+            query_filters (Optional[FilterSchemaType]): The filters of the list, an
+                `AdminOrderFilterSchema` for the admin list.
+
+        Returns:
+            list: The ordering criteria.
+        """
+        ordering = super().default_order_by(query_filters=query_filters)
+        term = getattr(query_filters, "q", None)
+        query = prefix_tsquery(term) if term else None
+
+        if query is None:
+            return ordering
+
+        rank = (
+            select(func.ts_rank_cd(OrderSearch.document, query))
+            .where(OrderSearch.order_id == Order.id)
+            .scalar_subquery()
+        )
+        return [rank.desc(), *ordering]
+
     async def get_by_id(
             self,
             *,
@@ -97,6 +137,188 @@ class OrdersRepository(BasePaginatedRepository[Order], BuildFiltersMixin):
         result = await self.db.execute(statement)
         return result.scalars().one_or_none()
 
+    async def get_statuses_by_numbers(self, *, numbers: list[str]) -> list[dict[str, Any]]:
+        """Retrieve the status of the orders with the given numbers.
+
+        Only the columns of `AdminOrderStatusSchema` are selected, which `ix_orders_number`
+        covers, and no ORM instance is built. The numbers are sent as a single array parameter,
+        so the statement is the same, and prepared once, whatever their count.
+
+        Args:
+            numbers (list[str]): The order numbers to look up.
+
+        Returns:
+            list[dict[str, Any]]: The number, status and update time of the orders found, by
+                number. Unknown numbers are left out.
+        """
+        projection = get_projection(Order, AdminOrderStatusSchema)
+        statement = (
+            projection.select()
+            .where(Order.number == any_(bindparam("numbers", list(set(numbers)), type_=ARRAY(String))))
+            .order_by(Order.number)
+        )
+        return projection.to_dicts((await self.db.execute(statement)).all())
+
+    async def transition_statuses(self, *, order_ids: list[int], status: str) -> list[dict[str, Any]]:
+        """Move the given orders to a status, if the status machine allows it.
+
+        Orders are updated by a single UPDATE ... RETURNING, restricted to the orders in a status
+        `Order.STATUS_TRANSITIONS` allows to move from; the others are left as they are. The rows
+        are locked by the sub-select reading their status, so the returned old status is the one
+        that was replaced. Orders moved to completed are stamped with completed_at.
+
+        Args:
+            order_ids (list[int]): The IDs of the orders to move.
+            status (str): The target status.
+
+        Returns:
+            list[dict[str, Any]]: For every order moved, by ID: its id, number, old_status,
+                status and updated_at, and the type and email of its client for the notifications.
+
+        Raises:
+            SQLAlchemyError: If the update fails.
+        """
+        sources = Order.get_statuses_transitioning_to(status)
+
+        if not sources:
+            return []
+
+        previous = (
+            select(
+                Order.id,
+                Order.status,
+                Client.type.label("client_type"),
+                Client.email.label("client_email"),
+            )
+            .join(Client, Client.id == Order.client_id)
+            .where(
+                Order.id == any_(bindparam("order_ids", list(set(order_ids)), type_=ARRAY(Integer))),
+                Order.status.in_(sources)
+            )
+            .with_for_update(of=Order)
+            .subquery("previous")
+        )
+        values: dict[str, Any] = {"status": status}
+
+        if status == Order.STATUS_COMPLETED:
+            values["completed_at"] = func.now()
+
+        statement = (
+            update(Order)
+            .where(Order.id == previous.c.id)
+            .values(**values)
+            .returning(
+                Order.id,
+                Order.number,
+                previous.c.status.label("old_status"),
+                Order.status,
+                Order.updated_at,
+                previous.c.client_type,
+                previous.c.client_email,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        try:
+            rows = (await self.db.execute(statement)).all()
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to transition orders to {status}: {str(e)}")
+            await self.db.rollback()
+            raise e
+
+        return sorted((row._asdict() for row in rows), key=lambda row: row["id"])
+
+    async def claim_overdue(self, *, limit: int) -> list[dict[str, Any]]:
+        """Mark active orders past their due time as notified, oldest due first.
+
+        A single UPDATE ... RETURNING over a range scan of `ix_orders_due_at_pending`, which only
+        holds the active orders not notified yet, so completed, canceled and notified orders are
+        never read. Rows locked by another worker claiming overdue orders are skipped rather than
+        waited for, and an order is claimed once until its due time changes.
+
+        Args:
+            limit (int): Most orders to claim.
+
+        Returns:
+            list[dict[str, Any]]: The id, number, status and due_at of each order claimed, by due time.
+
+        Raises:
+            SQLAlchemyError: If the update fails.
+        """
+        now = func.localtimestamp()
+        overdue = (
+            select(Order.id)
+            .where(Order.is_active(), Order.overdue_notified_at.is_(None), Order.due_at <= now)
+            .order_by(Order.due_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .subquery("overdue")
+        )
+        statement = (
+            update(Order)
+            .where(Order.id == overdue.c.id)
+            # Being reported is not an update of the order
+            .values(overdue_notified_at=now, updated_at=Order.updated_at)
+            .returning(Order.id, Order.number, Order.status, Order.due_at)
+            .execution_options(synchronize_session=False)
+        )
+
+        try:
+            rows = (await self.db.execute(statement)).all()
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to claim overdue orders: {str(e)}")
+            await self.db.rollback()
+            raise e
+
+        return sorted((row._asdict() for row in rows), key=lambda row: (row["due_at"], row["id"]))
+
+    async def archive_finished(self, *, before: datetime, limit: int) -> list[int]:
+        """Archive finished orders not updated since `before`, oldest update first.
+
+        A single UPDATE ... RETURNING over a range scan of `ix_orders_finished_updated_at`, which
+        only holds the finished orders not archived yet. Rows locked by another worker are skipped.
+        The orders stay in place with their services, applicant, status history and statistics;
+        archiving takes them out of the partial indexes the admin lists read.
+
+        Args:
+            before (datetime): Orders updated at or after this time are kept.
+            limit (int): Most orders to archive.
+
+        Returns:
+            list[int]: The IDs of the archived orders.
+
+        Raises:
+            SQLAlchemyError: If the update fails.
+        """
+        finished = (
+            select(Order.id)
+            .where(Order.is_finished(), Order.archived_at.is_(None), Order.updated_at < before)
+            .order_by(Order.updated_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .subquery("finished")
+        )
+        statement = (
+            update(Order)
+            .where(Order.id == finished.c.id)
+            # Being archived is not an update of the order
+            .values(archived_at=func.localtimestamp(), updated_at=Order.updated_at)
+            .returning(Order.id)
+            .execution_options(synchronize_session=False)
+        )
+
+        try:
+            order_ids = (await self.db.scalars(statement)).all()
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to archive orders: {str(e)}")
+            await self.db.rollback()
+            raise e
+
+        return sorted(order_ids)
+
     async def create(self, *, data: AdminOrderCreateSchema, populate_client: bool = False) -> Order:
         """Create a new order in the database.
 
@@ -0,0 +1,200 @@
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Any, Optional
+
+from sqlalchemy import Date, and_, cast, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import config
+from app.database.repositories.base import BaseRepository
+from app.helpers import add_months
+from app.models import Client, Order, OrderService, Service
+from app.schemas.revenue import RevenueDimensionEnum, RevenueFilterSchema
+from app.services import cache_service
+from app.services.cache import MISSING
+
+# Months of the report when no first month is given, the last one included
+DEFAULT_REVENUE_MONTHS = 12
+# Orders whose services are not revenue
+REVENUE_EXCLUDED_STATUSES = (Order.STATUS_DRAFT, Order.STATUS_CANCELED)
+# Sums of each row of the report
+REVENUE_AMOUNTS = ("revenue", "tax", "total")
+
+
+class RevenueRepository(BaseRepository):
+    """Repository for the revenue report, the amounts of the services of orders by month.
+
+    The report is computed month by month. The rows of a closed month, one before the current
+    month, are cached per dimensions and filters, so a report over a year recomputes the current
+    month only. Edits to the services of an order of a closed month show up once the cached month
+    expires, after `REVENUE_CACHE_TTL_SECONDS`.
+    """
+
+    cache = cache_service.namespace("revenue", ttl=config.REVENUE_CACHE_TTL_SECONDS)
+
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__(db)
+
+    async def get_revenue(self, *, query_filters: RevenueFilterSchema, today: Optional[date] = None) -> dict[str, Any]:
+        """Sum the services of the orders created over a range of months, by the requested dimensions.
+
+        The months missing from the cache are computed by a single aggregate over the services of
+        their orders. Draft and canceled orders are left out. The tariff of a service is the
+        current tariff of the client of the order.
+
+        Args:
+            query_filters (RevenueFilterSchema): The months, the dimensions and the filters.
+            today (Optional[date]): The day deciding the current month, defaults to today.
+
+        Returns:
+            dict[str, Any]: The first days of the first and last months, the "revenue" (net
+                prices), "tax" and "total" and, under "items", the number of services and the
+                amounts of each combination of the dimensions, ordered by them. Combinations
+                without services are left out.
+        """
+        current_month = (today or date.today()).replace(day=1)
+        month_to = (query_filters.month_to or current_month).replace(day=1)
+        month_from = (
+            query_filters.month_from or add_months(month_to, 1 - DEFAULT_REVENUE_MONTHS)
+        ).replace(day=1)
+        group_by = list(dict.fromkeys(query_filters.group_by))
+        dimensions = [dimension.value for dimension in group_by if dimension != RevenueDimensionEnum.MONTH]
+        months = []
+        month = month_from
+
+        while month <= month_to:
+            months.append(month)
+            month = add_months(month, 1)
+
+        key = self._cache_key(dimensions, query_filters)
+        rows_by_month: dict[date, list[dict[str, Any]]] = {}
+
+        for month in months:
+            if month < current_month:
+                rows = await self.cache.get(f"{month.isoformat()}:{key}", MISSING)
+
+                if rows is not MISSING:
+                    rows_by_month[month] = rows
+
+        missing = [month for month in months if month not in rows_by_month]
+
+        if missing:
+            computed = await self._compute_months(months=missing, dimensions=dimensions, query_filters=query_filters)
+
+            for month in missing:
+                rows_by_month[month] = computed.get(month, [])
+
+                if month < current_month:
+                    await self.cache.set(f"{month.isoformat()}:{key}", rows_by_month[month])
+
+        if RevenueDimensionEnum.MONTH in group_by:
+            items = [
+                {"month": month, **row}
+                for month in months
+                for row in rows_by_month[month]
+            ]
+        else:
+            items = self._merge([row for month in months for row in rows_by_month[month]], dimensions)
+
+        return dict(
+            month_from=month_from,
+            month_to=month_to,
+            **{amount: sum((item[amount] for item in items), Decimal(0)) for amount in REVENUE_AMOUNTS},
+            items=items,
+        )
+
+    async def _compute_months(
+            self,
+            *,
+            months: list[date],
+            dimensions: list[str],
+            query_filters: RevenueFilterSchema
+    ) -> dict[date, list[dict[str, Any]]]:
+        """Aggregate the services of the orders created in the given months, by month and dimensions."""
+        month = cast(func.date_trunc("month", Order.created_at), Date).label("month")
+        columns = {
+            "tariff_id": Client.tariff_id,
+            "service_id": OrderService.service_id,
+            "fee_type": Service.fee_type,
+            "country_id": Order.country_id,
+        }
+        selected = [columns[dimension].label(dimension) for dimension in dimensions]
+        statement = (
+            select(
+                month,
+                *selected,
+                func.count().label("services"),
+                func.sum(OrderService.price).label("revenue"),
+                func.sum(OrderService.tax_amount).label("tax"),
+                func.sum(OrderService.total).label("total"),
+            )
+            .select_from(OrderService)
+            .join(Order, Order.id == OrderService.order_id)
+            .where(Order.status.not_in(REVENUE_EXCLUDED_STATUSES))
+            .where(or_(*(
+                and_(Order.created_at >= start, Order.created_at < end)
+                for start, end in self._month_ranges(months)
+            )))
+            .group_by(month, *selected)
+            .order_by(month, *selected)
+        )
+
+        # Clients and services are only joined when a dimension or a filter needs them
+        if "tariff_id" in dimensions or query_filters.tariff_id is not None:
+            statement = statement.join(Client, Client.id == Order.client_id)
+
+        if "fee_type" in dimensions or query_filters.fee_type is not None:
+            statement = statement.join(Service, Service.id == OrderService.service_id)
+
+        for attr, column in columns.items():
+            value = getattr(query_filters, attr)
+
+            if value is not None:
+                statement = statement.where(column == value)
+
+        computed: dict[date, list[dict[str, Any]]] = defaultdict(list)
+
+        for row in await self.db.execute(statement):
+            values = row._asdict()
+            computed[values.pop("month")].append(values)
+
+        return computed
+
+    @staticmethod
+    def _month_ranges(months: list[date]) -> list[tuple[date, date]]:
+        """Group sorted months into ranges of consecutive months, the end of each excluded."""
+        ranges: list[tuple[date, date]] = []
+
+        for month in months:
+            if ranges and ranges[-1][1] == month:
+                ranges[-1] = (ranges[-1][0], add_months(month, 1))
+            else:
+                ranges.append((month, add_months(month, 1)))
+
+        return ranges
+
+    @staticmethod
+    def _merge(rows: list[dict[str, Any]], dimensions: list[str]) -> list[dict[str, Any]]:
+        """Sum the rows of several months with the same values of the dimensions."""
+        merged: dict[tuple, dict[str, Any]] = {}
+
+        for row in rows:
+            values = tuple(row[dimension] for dimension in dimensions)
+            item = merged.get(values)
+
+            if item is None:
+                merged[values] = dict(row)
+            else:
+                for amount in ("services", *REVENUE_AMOUNTS):
+                    item[amount] += row[amount]
+
+        return [merged[values] for values in sorted(merged, key=lambda values: [(v is None, v) for v in values])]
+
+    @staticmethod
+    def _cache_key(dimensions: list[str], query_filters: RevenueFilterSchema) -> str:
+        filters = ",".join(
+            f"{attr}={getattr(query_filters, attr)}"
+            for attr in ("tariff_id", "service_id", "fee_type", "country_id")
+        )
+        return f"{','.join(dimensions)}:{filters}"
@@ -6,23 +6,33 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.sql.elements import ClauseElement
 
 from app.database.repositories.base import BasePaginatedRepository
-from app.database.repositories.mixins import BuildFiltersMixin
-from app.models import Service, TariffService
+from app.database.repositories.mixins import BuildFiltersMixin, NameSearchMixin
+from app.database.repositories.tariffs import TariffsRepository
+from app.models import Service, TariffService, TariffVersion
 from app.schemas.pagination import PageParamsSchema
-from app.schemas.service import ServiceCreateSchema, ServiceFilterSchema, ServiceUpdateSchema
+from app.schemas.service import (
+    ServiceCreateSchema,
+    ServiceFilterSchema,
+    ServiceResponseSchema,
+    ServiceUpdateSchema
+)
+from app.services import price_quote_service, tariff_version_service
 
 
-class ServicesRepository(BasePaginatedRepository[Service], BuildFiltersMixin):
+class ServicesRepository(NameSearchMixin, BasePaginatedRepository[Service], BuildFiltersMixin):
+    list_schema = ServiceResponseSchema
+    search_expression = Service.__table__.c.name
 
     def __init__(self, db: AsyncSession) -> None:
         super().__init__(db=db, model=Service)
+        self.tariffs_repo = TariffsRepository(db)
 
     def build_filters(self, *, query_filters: ServiceFilterSchema) -> list:
         """Convert filter schema to SQLAlchemy filter conditions"""
         filters: list[ClauseElement] = list()
 
         if query_filters.name:
-            filters.append(Service.name.ilike(f"%{query_filters.name}%"))
+            filters.append(self.name_filter(query_filters.name))
 
         if query_filters.fee_type:
             filters.append(Service.fee_type == query_filters.fee_type)
@@ -52,9 +62,6 @@ class ServicesRepository(BasePaginatedRepository[Service], BuildFiltersMixin):
         return await super().get_paginated_list(
             query_filters=query_filters,
             page_params=page_params,
-            options=[
-                selectinload(Service.tariff_services).selectinload(TariffService.tariff)
-            ]
         )
 
     async def get_by_id(self, *, service_id) -> Service | None:
@@ -66,26 +73,29 @@ class ServicesRepository(BasePaginatedRepository[Service], BuildFiltersMixin):
         return service
 
     async def create(self, *, data: ServiceCreateSchema) -> Service:
-        """Create new service"""
+        """Create new service.
+
+        Prices are added by writing a new version of each of the given tariffs.
+        """
         service_data = data.model_dump(exclude={"tariff_services"})
         service = Service(**service_data)
         self.db.add(service)
         await self.db.flush()  # Flush to get the service ID
 
-        # Create tariff services if provided
-        if data.tariff_services:
-            for tariff_service_data in data.tariff_services:
-                tariff_service = TariffService(
-                    service_id=service.id,
-                    **tariff_service_data.model_dump()
-                )
-                self.db.add(tariff_service)
-
+        versions = [
+            await self.tariffs_repo.create_version(tariff_id=ts_data.tariff_id, prices={service.id: ts_data})
+            for ts_data in data.tariff_services or []
+        ]
         await self.db.commit()
+        self._activate(versions)
         return await self.get_by_id(service_id=service.id)
 
     async def update(self, *, service_id: int, data: ServiceUpdateSchema) -> Service | None:
-        """Update service"""
+        """Update service.
+
+        Tariff services are never updated in place: every tariff whose price of the service
+        changes, or that no longer has the service, gets a new version.
+        """
         service = await self.get_by_id(service_id=service_id)
 
         if not service:
@@ -96,19 +106,31 @@ class ServicesRepository(BasePaginatedRepository[Service], BuildFiltersMixin):
         for attr, val in update_data.items():
             setattr(service, attr, val)
 
+        versions = []
+
         if data.tariff_services is not None:
-            for ts in service.tariff_services:
-                await self.db.delete(ts)
-            await self.db.flush()
-
-            new_tariff_services = [
-                TariffService(
-                    service_id=30,
-                    **ts_data.model_dump(exclude_unset=True)
+            current = {ts.tariff_id: ts for ts in service.tariff_services}
+            new = {ts_data.tariff_id: ts_data for ts_data in data.tariff_services}
+
+            for tariff_id in sorted(current.keys() | new.keys()):
+                ts, ts_data = current.get(tariff_id), new.get(tariff_id)
+
+                if ts is not None and ts_data is not None and (ts.price, ts.tax) == (ts_data.price, ts_data.tax):
+                    continue
+
+                versions.append(
+                    await self.tariffs_repo.create_version(tariff_id=tariff_id, prices={service.id: ts_data})
                 )
-                for ts_data in data.tariff_services
-            ]
-            service.tariff_services = new_tariff_services
 
         await self.db.commit()
+        self._activate(versions)
+        # Criteria of the service are part of the cached tariff price tables
+        await price_quote_service.invalidate()
+        self.db.expire(service, ["tariff_services"])
         return await self.get_by_id(service_id=service_id)
+
+    @staticmethod
+    def _activate(versions: list[TariffVersion]) -> None:
+        """Make the committed versions visible to the cached active version lookup."""
+        for version in versions:
+            tariff_version_service.set_active(tariff_id=version.tariff_id, version_id=version.id)
@@ -0,0 +1,63 @@
+from datetime import date, timedelta
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.repositories.base import BaseRepository
+from app.models import OrderStatsDaily
+from app.schemas.stats import OrderStatsFilterSchema
+
+# Window of the stats when no start date is given
+DEFAULT_STATS_WINDOW = timedelta(days=30)
+
+
+class OrderStatsRepository(BaseRepository):
+    """Repository for reading the order statistics rollups.
+
+    The rollups are maintained by triggers on orders (see `OrderStatsDaily`), so this repository
+    only reads.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__(db)
+
+    async def get_order_counts(self, *, query_filters: OrderStatsFilterSchema) -> dict[str, Any]:
+        """Count the orders created over a range of days, by the requested dimensions.
+
+        The counts are sums of `order_stats_daily` rows over a range of its primary key, so the
+        cost depends on the number of days and dimension values, not on the number of orders.
+
+        Args:
+            query_filters (OrderStatsFilterSchema): The days, the dimensions and the filters.
+
+        Returns:
+            dict[str, Any]: The dates of the range, the "total" number of orders and, under
+                "items", the number of orders of each combination of the dimensions, ordered by
+                them. Combinations without orders are left out.
+        """
+        date_to = query_filters.date_to or date.today()
+        date_from = query_filters.date_from or date_to - DEFAULT_STATS_WINDOW
+        dimensions = [getattr(OrderStatsDaily, dimension.value) for dimension in dict.fromkeys(query_filters.group_by)]
+        orders = func.sum(OrderStatsDaily.orders)
+        statement = (
+            select(*dimensions, orders.label("orders"))
+            .where(OrderStatsDaily.day.between(date_from, date_to))
+            .group_by(*dimensions)
+            .having(orders > 0)
+            .order_by(*dimensions)
+        )
+
+        for attr in ("status", "country_id", "visa_type_id", "urgency_id", "client_id"):
+            value = getattr(query_filters, attr)
+
+            if value is not None:
+                statement = statement.where(getattr(OrderStatsDaily, attr) == value)
+
+        items = [row._asdict() for row in await self.db.execute(statement)]
+        return dict(
+            date_from=date_from,
+            date_to=date_to,
+            total=sum(item["orders"] for item in items),
+            items=items,
+        )
@@ -1,8 +1,12 @@
-from sqlalchemy import select
+from typing import Mapping, Optional, Sequence
+
+from sqlalchemy import Integer, Row, insert, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.repositories.base import BaseRepository
+from app.models import Service, TariffService, TariffVersion
 from app.models.tariffs import Tariff
+from app.schemas.service import TariffServiceCreateSchema
 from app.schemas.tariff import TariffCreateSchema
 
 
@@ -20,3 +24,120 @@ class TariffsRepository(BaseRepository):
         self.db.add(tariff)
         await self.db.commit()
         return tariff
+
+    async def get_active_version_id(self, *, tariff_id: int) -> Optional[int]:
+        """Retrieve the id of the price list version currently in use by a tariff."""
+        statement = select(Tariff.active_version_id).where(Tariff.id == tariff_id)
+        return await self.db.scalar(statement)
+
+    async def create_version(
+            self,
+            *,
+            tariff_id: int,
+            prices: Mapping[int, Optional[TariffServiceCreateSchema]]
+    ) -> TariffVersion:
+        """Write a new price list version of a tariff and make it the active one.
+
+        The new version is a copy of the active one with the given service prices replaced, made
+        with a single INSERT ... SELECT. Rows of previous versions are never modified, so readers of
+        the active version are not blocked. Only the tariff row is locked, to serialize concurrent
+        repricing of the same tariff. The caller commits, which activates the version atomically.
+
+        Args:
+            tariff_id (int): The tariff to reprice.
+            prices (Mapping[int, Optional[TariffServiceCreateSchema]]): New prices by service id.
+                A None price removes the service from the tariff.
+
+        Returns:
+            TariffVersion: The new, active version. Its loaded tariff_services hold the given
+                prices only, the copied ones are inserted directly.
+        """
+        base_version_id = await self.db.scalar(
+            select(Tariff.active_version_id).where(Tariff.id == tariff_id).with_for_update()
+        )
+        version = TariffVersion(
+            tariff_id=tariff_id,
+            tariff_services=[
+                TariffService(price=price.price, tax=price.tax, service_id=service_id, tariff_id=tariff_id)
+                for service_id, price in prices.items()
+                if price is not None
+            ]
+        )
+        self.db.add(version)
+        await self.db.flush()
+
+        if base_version_id is not None:
+            copied_columns = (
+                TariffService.price,
+                TariffService.tax,
+                TariffService.tax_amount,
+                TariffService.total,
+                TariffService.service_id,
+                TariffService.tariff_id,
+                TariffService.created_at,
+                TariffService.updated_at,
+                TariffService.archived_at,
+            )
+            await self.db.execute(
+                insert(TariffService).from_select(
+                    [column.key for column in copied_columns] + ["version_id"],
+                    select(*copied_columns, literal(version.id, Integer)).where(
+                        TariffService.version_id == base_version_id,
+                        TariffService.service_id.not_in(list(prices)),
+                    )
+                )
+            )
+
+        await self.db.execute(update(Tariff).where(Tariff.id == tariff_id).values(active_version_id=version.id))
+        await self.db.flush()
+        return version
+
+    async def get_price_rows(
+            self,
+            *,
+            tariff_id: Optional[int] = None,
+            version_id: Optional[int] = None
+    ) -> Sequence[Row]:
+        """Retrieve flat price rows (tariff service joined with its service).
+
+        This is the same tariff_services/services join `OrderServicesRepository.get_for_order`
+        performs, returned as plain rows so it can be kept in memory by the price quote cache.
+
+        Args:
+            tariff_id (Optional[int]): Restrict the rows to the active version of a single tariff.
+            version_id (Optional[int]): Return the rows of this version instead of the active ones.
+
+        Returns:
+            Sequence[Row]: Rows ordered by tariff and service name.
+        """
+        statement = (
+            select(
+                TariffService.id,
+                TariffService.tariff_id,
+                TariffService.version_id,
+                TariffService.price,
+                TariffService.tax,
+                TariffService.tax_amount,
+                TariffService.total,
+                Service.id.label("service_id"),
+                Service.name.label("service_name"),
+                Service.fee_type.label("service_fee_type"),
+                Service.country_id,
+                Service.urgency_id,
+                Service.visa_duration_id,
+                Service.visa_type_id,
+            )
+            .join(Service, Service.id == TariffService.service_id)
+            .order_by(TariffService.tariff_id, Service.name)
+        )
+
+        if version_id is not None:
+            statement = statement.where(TariffService.version_id == version_id)
+        else:
+            statement = statement.join(Tariff, Tariff.active_version_id == TariffService.version_id)
+
+        if tariff_id is not None:
+            statement = statement.where(TariffService.tariff_id == tariff_id)
+
+        result = await self.db.execute(statement)
+        return result.all()
@@ -1,6 +1,6 @@
 from datetime import datetime
+from typing import Sequence
 
-from mypyc.ir.ops import Sequence
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -1,15 +1,19 @@
-from typing import Sequence
+from typing import Any, Sequence
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app import config
 from app.database.repositories.base import BaseRepository
 from app.exceptions import NameExistsException
 from app.models.urgencies import Urgency
 from app.schemas.urgency import UrgencyCreateSchema, UrgencyUpdateSchema
+from app.services import cache_service
 
 
 class UrgenciesRepository(BaseRepository):
+    # Reference data listed on every order form, cached for all workers and cleared on writes
+    cache = cache_service.namespace("urgencies", ttl=config.CACHE_REFERENCE_TTL_SECONDS)
 
     def __init__(self, db: AsyncSession) -> None:
         super().__init__(db)
@@ -19,6 +23,14 @@ class UrgenciesRepository(BaseRepository):
         result = await self.db.scalars(statement)
         return result.all()
 
+    async def get_cached_list(self) -> list[dict[str, Any]]:
+        """Return the id, name and processing window of every urgency, from the shared cache when possible."""
+        return await self.cache.get_or_set("list", self._load_list)
+
+    async def _load_list(self) -> list[dict[str, Any]]:
+        result = await self.db.execute(select(Urgency.id, Urgency.name, Urgency.processing_hours).order_by(Urgency.id))
+        return [dict(row) for row in result.mappings()]
+
     async def get_by_id(self, *, urgency_id: int) -> Urgency | None:
         statement = select(Urgency).where(Urgency.id == urgency_id)
         result = await self.db.execute(statement)
@@ -38,6 +50,7 @@ class UrgenciesRepository(BaseRepository):
 
         self.db.add(urgency)
         await self.db.commit()
+        await self.cache.clear()
         return urgency
 
     async def update(self, *, urgency_id: int, data: UrgencyUpdateSchema) -> Urgency | None:
@@ -46,8 +59,10 @@ class UrgenciesRepository(BaseRepository):
         if not urgency:
             return None
 
-        for attr, value in data.model_dump().items():
+        # Fields left out of the request are kept: clearing processing_hours reschedules the orders
+        for attr, value in data.model_dump(exclude_unset=True).items():
             setattr(urgency, attr, value)
-            await self.db.commit()
-            await self.db.refresh(urgency)
+        await self.db.commit()
+        await self.db.refresh(urgency)
+        await self.cache.clear()
         return urgency
@@ -1,14 +1,14 @@
 from typing import Any
 
 from pydantic import EmailStr
-from sqlalchemy import select, update, or_
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.elements import ClauseElement
 
 from app.database.repositories.base import BasePaginatedRepository
-from app.database.repositories.mixins import BuildFiltersMixin
+from app.database.repositories.mixins import BuildFiltersMixin, NameSearchMixin
 from app.exceptions import AuthEmailAlreadyRegisteredException, AuthEmailAlreadyVerifiedException, NotFoundException
-from app.models.users import User
+from app.models.users import USER_FULL_NAME, User
 from app.schemas.pagination import PageParamsSchema
 from app.schemas.user import (
     UserCreateSchema,
@@ -19,7 +19,9 @@ from app.schemas.user import (
 from app.services.auth import AuthService
 
 
-class UsersRepository(BasePaginatedRepository[User], BuildFiltersMixin):
+class UsersRepository(NameSearchMixin, BasePaginatedRepository[User], BuildFiltersMixin):
+    search_expression = USER_FULL_NAME
+
     def __init__(self, db: AsyncSession) -> None:
         super().__init__(db=db, model=User)
         self.auth_service = AuthService()
@@ -28,12 +30,7 @@ class UsersRepository(BasePaginatedRepository[User], BuildFiltersMixin):
         filters: list[ClauseElement] = list()
 
         if query_filters.name:
-            filters.append(
-                or_(
-                    User.first_name.ilike(f"%{query_filters.name}%"),
-                    User.last_name.ilike(f"%{query_filters.name}%"),
-                )
-            )
+            filters.append(self.name_filter(query_filters.name))
 
         if query_filters.role:
             filters.append(User.role == query_filters.role)
@@ -57,7 +54,7 @@ class UsersRepository(BasePaginatedRepository[User], BuildFiltersMixin):
         if await self.get_by_email(email=new_user.email):
             raise AuthEmailAlreadyRegisteredException(email=new_user.email)
 
-        user_password_update = self.auth_service.create_salt_and_hashed_password(
+        user_password_update = await self.auth_service.create_salt_and_hashed_password_async(
             plaintext_password=new_user.password
         )
         new_user = UserCreateInDBSchema(
@@ -78,6 +75,12 @@ class UsersRepository(BasePaginatedRepository[User], BuildFiltersMixin):
         updated_user = await self.get_by_id(user_id=user.id)
         return updated_user
 
+    async def get_active_emails(self, *, role: str) -> list[str]:
+        """Return the emails of the active users of a role."""
+        statement = select(User.email).where(User.role == role, User.is_active.is_(True)).order_by(User.id)
+        result = await self.db.scalars(statement)
+        return list(result)
+
     async def get_by_email(self, *, email: EmailStr) -> User | None:
         statement = select(User).where(User.email == email)
         result = await self.db.execute(statement)
@@ -90,7 +93,7 @@ class UsersRepository(BasePaginatedRepository[User], BuildFiltersMixin):
         if not user:
             return None
 
-        if not self.auth_service.verify_password(
+        if not await self.auth_service.verify_password_async(
                 password=password,
                 salt=user.salt,
                 hashed_password=user.password
@@ -0,0 +1,105 @@
+"""Name search predicates served by the trigram (pg_trgm) indexes of the searched columns.
+
+A ``name ILIKE '%term%'`` filter cannot use a B-tree index, but a GIN index built with
+``gin_trgm_ops`` serves it, as well as the word similarity operator ``<%`` used by ranked
+searches. The indexes are created by the migration enabling pg_trgm; databases created from the
+models without the extension, such as the test databases, are created without them and run the
+same predicates with sequential scans.
+
+Searches across several tables, such as the order search, match a ``tsvector`` document
+maintained by triggers instead, with `prefix_tsquery`.
+"""
+import re
+from typing import Any, Optional, Union
+
+from sqlalchemy import Index, Table, func, literal, or_, text
+from sqlalchemy.engine import Connection, Dialect
+from sqlalchemy.sql.compiler import DDLCompiler
+from sqlalchemy.sql.ddl import BaseDDLElement
+from sqlalchemy.sql.schema import SchemaItem
+from sqlalchemy.sql.elements import ColumnElement
+
+from app import config
+
+TRIGRAM_OPS = "gin_trgm_ops"
+LIKE_ESCAPE = "\\"
+
+
+def _trigram_installed(
+        ddl: BaseDDLElement,
+        target: Union[SchemaItem, str],
+        bind: Optional[Connection],
+        tables: Optional[list[Table]] = None,
+        state: Optional[Any] = None,
+        *,
+        dialect: Dialect,
+        compiler: Optional[DDLCompiler] = None,
+        checkfirst: bool = False,
+        **kw: Any,
+) -> bool:
+    if bind is None:
+        return True
+
+    return bool(bind.scalar(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")))
+
+
+def trigram_index(name: str, expression: str | ColumnElement) -> Index:
+    """Return a GIN trigram index of a column name or a labeled expression.
+
+    The index is only created by `MetaData.create_all` when pg_trgm is installed in the database.
+    """
+    key = expression if isinstance(expression, str) else expression.key
+    index = Index(name, expression, postgresql_using="gin", postgresql_ops={key: TRIGRAM_OPS})
+    return index.ddl_if(callable_=_trigram_installed)
+
+
+def escape_like(term: str) -> str:
+    """Escape the LIKE wildcards of a search term, so that they match themselves."""
+    for character in (LIKE_ESCAPE, "%", "_"):
+        term = term.replace(character, LIKE_ESCAPE + character)
+
+    return term
+
+
+def contains(expression: ColumnElement, term: str) -> ColumnElement:
+    """Case-insensitive substring match of `term`."""
+    return expression.ilike(f"%{escape_like(term)}%", escape=LIKE_ESCAPE)
+
+
+def similar(expression: ColumnElement, term: str) -> ColumnElement:
+    """Match when a word of `expression` is similar to `term`, above `pg_trgm.word_similarity_threshold`."""
+    return literal(term).op("<%")(expression.self_group())
+
+
+def similarity(expression: ColumnElement, term: str) -> ColumnElement:
+    """Word similarity of `term` to `expression`, between 0 and 1."""
+    return func.word_similarity(term, expression)
+
+
+def name_search(expression: ColumnElement, term: str, *, ranked: Optional[bool] = None) -> ColumnElement:
+    """Return the filter of a search box on `expression`.
+
+    Args:
+        expression: Indexed column or expression searched
+        term: Search term
+        ranked: Also match similar names, defaults to `SEARCH_SIMILARITY`
+    """
+    if ranked if ranked is not None else config.SEARCH_SIMILARITY:
+        return or_(contains(expression, term), similar(expression, term))
+
+    return contains(expression, term)
+
+
+def prefix_tsquery(term: str) -> Optional[ColumnElement]:
+    """Return the ``simple`` text search query matching the documents having a word starting with
+    each word of `term`, or None when `term` has no word.
+
+    Words are the runs of letters and digits, so that punctuation, such as the dash of an order
+    number or the ``@`` of an email, splits words the same way as in the searched documents.
+    """
+    words = re.findall(r"[^\W_]+", term.lower())
+
+    if not words:
+        return None
+
+    return func.to_tsquery("simple", " & ".join(f"{word}:*" for word in words))
@@ -123,6 +123,61 @@ class InvalidOrExpiredConfirmationTokenException(BaseAppException):
         )
 
 
+class IdempotencyKeyInProgressException(BaseAppException):
+    """
+    Exception raised when a request is sent with the key of a request still being handled.
+    """
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A request with this Idempotency-Key is in progress"
+        )
+
+
+class IdempotencyKeyReusedException(BaseAppException):
+    """
+    Exception raised when the key of a previous request is sent with another request.
+    """
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Idempotency-Key was already used for another request"
+        )
+
+
+class InvalidCursorException(BaseAppException):
+    """
+    Exception raised when a pagination cursor cannot be decoded.
+    """
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+class InvalidStatusTransitionException(BaseAppException):
+    """
+    Exception raised when no order can be moved to the requested status.
+    """
+    def __init__(self, target: str) -> None:
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Orders cannot be moved to {target}"
+        )
+
+
+class InvalidTariffServicesException(BaseAppException):
+    """
+    Exception raised when tariff services are not of the active version of the order client's tariff.
+    """
+    def __init__(self) -> None:
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Tariff services are not in the active price list of the client's tariff"
+        )
+
+
 class InvalidTokenException(BaseAppException):
     """
     Exception raised when a user's access token is invalid.
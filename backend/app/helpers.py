@@ -1,4 +1,5 @@
 import re
+from datetime import date
 from decimal import Decimal
 from urllib.parse import urlparse, parse_qs
 
@@ -17,3 +18,9 @@ def fetch_url_param_value(*, url: str, param: str) -> str:
 
 def calculate_tax(price: Decimal, tax: Decimal) -> Decimal:
     return price * tax
+
+
+def add_months(month: date, months: int) -> date:
+    """Return the first day of the month `months` after (or before, if negative) the given one."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
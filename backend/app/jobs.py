@@ -0,0 +1,93 @@
+"""Periodic background jobs, scheduled from the application lifespan."""
+import logging
+from datetime import date, datetime, timedelta
+
+from app import config
+from app.database.db import Session
+from app.database.repositories.audit import AuditRepository
+from app.database.repositories.idempotency_keys import IdempotencyKeysRepository
+from app.database.repositories.orders import OrdersRepository
+from app.database.repositories.users import UsersRepository
+from app.models import User
+from app.services import notification_service
+
+logger = logging.getLogger(__name__)
+
+
+async def rotate_audit_partitions() -> None:
+    """Create upcoming log_entries partitions and drop the ones past retention."""
+    async with Session() as session:
+        result = await AuditRepository(session).rotate_partitions(
+            today=date.today(),
+            months_ahead=config.AUDIT_PARTITIONS_AHEAD_MONTHS,
+            retention_months=config.AUDIT_RETENTION_MONTHS,
+        )
+
+    if result["created"] or result["dropped"]:
+        logger.info(f"Audit partitions created: {result['created']}, dropped: {result['dropped']}")
+
+
+async def notify_overdue_orders() -> None:
+    """Report the active orders that went past their due time to the operators, in batches.
+
+    Orders are marked as notified before the emails are sent, so an order is reported at most once
+    by all the workers running this job, even if sending fails.
+    """
+    async with Session() as session:
+        orders_repo = OrdersRepository(session)
+        emails = None
+
+        while True:
+            orders = await orders_repo.claim_overdue(limit=config.SLA_SCAN_BATCH_SIZE)
+
+            if not orders:
+                break
+
+            if emails is None:
+                emails = await UsersRepository(session).get_active_emails(role=User.ROLE_OPERATOR)
+
+            logger.info(f"{len(orders)} overdue orders reported to {len(emails)} operators")
+            await notification_service.notify_on_overdue_orders(emails=emails, orders=orders)
+
+            if len(orders) < config.SLA_SCAN_BATCH_SIZE:
+                break
+
+
+async def archive_finished_orders() -> None:
+    """Archive the orders finished and not updated for `ORDER_ARCHIVE_AFTER_DAYS`, in batches.
+
+    Each batch is its own transaction, so the rows are never locked for long.
+    """
+    before = datetime.now() - timedelta(days=config.ORDER_ARCHIVE_AFTER_DAYS)
+    archived = 0
+
+    async with Session() as session:
+        orders_repo = OrdersRepository(session)
+
+        while True:
+            order_ids = await orders_repo.archive_finished(before=before, limit=config.ORDER_ARCHIVE_BATCH_SIZE)
+            archived += len(order_ids)
+
+            if len(order_ids) < config.ORDER_ARCHIVE_BATCH_SIZE:
+                break
+
+    if archived:
+        logger.info(f"{archived} orders archived")
+
+
+async def purge_idempotency_keys() -> None:
+    """Delete the expired idempotency keys and their responses, in batches."""
+    purged = 0
+
+    async with Session() as session:
+        idempotency_repo = IdempotencyKeysRepository(session)
+
+        while True:
+            deleted = await idempotency_repo.purge_expired(limit=config.IDEMPOTENCY_PURGE_BATCH_SIZE)
+            purged += deleted
+
+            if deleted < config.IDEMPOTENCY_PURGE_BATCH_SIZE:
+                break
+
+    if purged:
+        logger.info(f"{purged} idempotency keys purged")
@@ -0,0 +1,237 @@
+"""In-process Prometheus-style metrics, rendered in the text exposition format by /metrics.
+
+Metrics are lock-free: every thread updates its own shard of the values, and shards are only
+summed when the metrics are rendered. Within the event loop thread an update is a couple of
+list operations, so they can be used on hot paths.
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Iterator, Optional
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Metric:
+    type = ""
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            *,
+            labelnames: tuple[str, ...] = (),
+            registry: Optional["Registry"] = None
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._local = threading.local()
+        self._shards: list[dict[tuple[str, ...], list[float]]] = []
+        (registry or default_registry).register(self)
+
+    def _size(self) -> int:
+        return 1
+
+    def _values(self, labels: dict[str, str]) -> list[float]:
+        """Return the values of the calling thread for the given labels."""
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            self._shards.append(shard)
+
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        values = shard.get(key)
+
+        if values is None:
+            values = shard[key] = [0.0] * self._size()
+
+        return values
+
+    def collect(self) -> dict[tuple[str, ...], list[float]]:
+        """Return the values summed over all threads, by label values."""
+        totals: dict[tuple[str, ...], list[float]] = {}
+
+        for shard in list(self._shards):
+            for key, values in shard.copy().items():
+                total = totals.setdefault(key, [0.0] * self._size())
+
+                for index, value in enumerate(list(values)):
+                    total[index] += value
+
+        return totals
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type}"
+
+        for key, values in sorted(self.collect().items()):
+            yield f"{self.name}{self._format_labels(key)} {_format_value(values[0])}"
+
+    def _format_labels(self, key: tuple[str, ...], **extra: str) -> str:
+        pairs = list(zip(self.labelnames, key)) + list(extra.items())
+
+        if not pairs:
+            return ""
+
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        self._values(labels)[0] += amount
+
+
+class Gauge(Metric):
+    """A gauge either updated with `inc`/`dec` or read from functions, one per label values, when rendered."""
+    type = "gauge"
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            *,
+            labelnames: tuple[str, ...] = (),
+            registry: Optional["Registry"] = None
+    ) -> None:
+        super().__init__(name, documentation, labelnames=labelnames, registry=registry)
+        self._functions: dict[tuple[str, ...], Callable[[], float]] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        self._values(labels)[0] += amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self._values(labels)[0] -= amount
+
+    def set_function(self, function: Callable[[], float], **labels: str) -> None:
+        self._functions[tuple(str(labels[name]) for name in self.labelnames)] = function
+
+    def collect(self) -> dict[tuple[str, ...], list[float]]:
+        if self._functions:
+            return {key: [float(function())] for key, function in self._functions.items()}
+
+        return super().collect()
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            *,
+            labelnames: tuple[str, ...] = (),
+            buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+            registry: Optional["Registry"] = None
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames=labelnames, registry=registry)
+
+    def _size(self) -> int:
+        # A count per bucket, one for +Inf, then the sum
+        return len(self.buckets) + 2
+
+    def observe(self, value: float, **labels: str) -> None:
+        values = self._values(labels)
+        values[bisect_left(self.buckets, value)] += 1
+        values[-1] += value
+
+    def time(self, **labels: str) -> "_Timer":
+        """Observe the duration of a `with` block."""
+        return _Timer(self, labels)
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type}"
+
+        for key, values in sorted(self.collect().items()):
+            cumulative = 0.0
+
+            for bound, count in zip(self.buckets + (float("inf"),), values[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                yield f"{self.name}_bucket{self._format_labels(key, le=le)} {_format_value(cumulative)}"
+
+            yield f"{self.name}_sum{self._format_labels(key)} {_format_value(values[-1])}"
+            yield f"{self.name}_count{self._format_labels(key)} {_format_value(cumulative)}"
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: dict[str, str]) -> None:
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        lines = [line for metric in self._metrics.values() for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if value == int(value) and abs(value) < 1e15 else repr(value)
+
+
+default_registry = Registry()
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Duration of HTTP requests, until the response is sent",
+    labelnames=("method", "route", "status"),
+)
+http_requests_in_flight = Gauge("http_requests_in_flight", "HTTP requests being processed")
+background_tasks_pending = Gauge(
+    "background_tasks_pending",
+    "Requests whose response is sent and whose background tasks are still running",
+)
+audit_buffer_size = Gauge("audit_buffer_size", "Audit entries waiting to be written by the audit sink")
+db_pool_size = Gauge("db_pool_size", "Connections kept by the database pool", labelnames=("pool",))
+db_pool_checked_out = Gauge("db_pool_checked_out", "Database connections currently checked out", labelnames=("pool",))
+db_pool_overflow = Gauge("db_pool_overflow", "Database connections opened beyond the pool size", labelnames=("pool",))
+db_pool_checkout_wait = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a database connection from the pool",
+    labelnames=("pool",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+email_send_duration = Histogram(
+    "email_send_duration_seconds",
+    "Duration of sending an email",
+    labelnames=("outcome",),
+)
+bcrypt_duration = Histogram(
+    "bcrypt_duration_seconds",
+    "Duration of bcrypt password hashing and verification",
+    labelnames=("operation",),
+)
+bcrypt_pool_busy = Gauge("bcrypt_pool_busy_workers", "bcrypt pool workers currently hashing")
+bcrypt_pool_workers = Gauge("bcrypt_pool_workers", "Size of the bcrypt pool")
+cache_requests = Counter(
+    "cache_requests_total",
+    "Cache lookups by namespace and result",
+    labelnames=("namespace", "result"),
+)
@@ -2,13 +2,18 @@ from app.models.applicants import Applicant
 from app.models.audit import LogEntry
 from app.models.clients import Client
 from app.models.countries import Country
+from app.models.idempotency_keys import IdempotencyKey
 from app.models.country_visas import CountryVisa
 from app.models.m2m_country_visa_duration import country_visa_duration
 from app.models.order import Order
+from app.models.order_search import OrderSearch
+from app.models.order_stats import OrderStatsDaily
+from app.models.order_status_event import OrderStatusEvent
 from app.models.order_service import OrderService
 from app.models.services import Service
 from app.models.tariff_service import TariffService
 from app.models.tariffs import Tariff
+from app.models.tariff_version import TariffVersion
 from app.models.tokens import BlackListToken
 from app.models.urgencies import Urgency
 from app.models.users import User
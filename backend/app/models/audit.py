@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Integer, DateTime, ForeignKey
+from sqlalchemy import DDL, DateTime, ForeignKey, Index, Integer, String, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -15,7 +15,23 @@ if TYPE_CHECKING:
 
 
 class LogEntry(IDIntMixin, Base):
+    """An audit log entry.
+
+    The table is range partitioned by month on created_at, which therefore is part of the primary
+    key. Monthly partitions are named `log_entries_yYYYYmMM` and rotated by
+    `AuditRepository.rotate_partitions`; rows outside of them land in `log_entries_default`.
+    """
+
     __tablename__ = "log_entries"
+    __table_args__ = (
+        Index("ix_log_entries_model_type_target_id_created_at", "model_type", "target_id", "created_at"),
+        Index("ix_log_entries_user_id_created_at", "user_id", "created_at"),
+        Index("ix_log_entries_created_at", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    PARTITION_NAME_FORMAT = "log_entries_y%Ym%m"
+    DEFAULT_PARTITION_NAME = "log_entries_default"
 
     ACTION_ACCESS = "access"
     ACTION_ARCHIVE = "archive"
@@ -44,7 +60,7 @@ class LogEntry(IDIntMixin, Base):
     action: Mapped[str] = mapped_column(ChoiceType(ACTION_CHOICES))
     model_type: Mapped[str] = mapped_column(String(30), unique=False, nullable=True)
     target_id: Mapped[int] = mapped_column(Integer, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), primary_key=True)
 
     user: Mapped["User"] = relationship(back_populates="entry_logs")
 
@@ -54,3 +70,11 @@ class LogEntry(IDIntMixin, Base):
     @staticmethod
     def get_model_type() -> str:
         return "log_entry"
+
+
+# A partitioned table cannot take rows without a partition to hold them
+event.listen(
+    LogEntry.__table__,
+    "after_create",
+    DDL(f"CREATE TABLE IF NOT EXISTS {LogEntry.DEFAULT_PARTITION_NAME} PARTITION OF log_entries DEFAULT")
+)
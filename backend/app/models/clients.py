@@ -4,6 +4,7 @@ from sqlalchemy import ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.custom_types import ChoiceType
+from app.database.search import trigram_index
 from app.models.base import Base
 from app.models.mixins import CreatedAtMixin, UpdatedAtMixin, IDIntMixin, IsActiveMixin
 
@@ -13,6 +14,7 @@ if TYPE_CHECKING:
 
 class Client(IDIntMixin, CreatedAtMixin, UpdatedAtMixin, IsActiveMixin, Base):
     __tablename__ = "clients"
+    __table_args__ = (trigram_index("ix_clients_name_trgm", "name"),)
 
     TYPE_INDIVIDUAL = 'individual'
     TYPE_LEGAL = 'legal'
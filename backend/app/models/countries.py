@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 from sqlalchemy import Boolean, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.database.search import trigram_index
 from app.models.base import Base
 from app.models.mixins import IDIntMixin
 
@@ -12,6 +13,7 @@ if TYPE_CHECKING:
 
 class Country(IDIntMixin, Base):
     __tablename__ = 'countries'
+    __table_args__ = (trigram_index("ix_countries_name_trgm", "name"),)
 
     name: Mapped[str] = mapped_column(String)
     alpha2: Mapped[str] = mapped_column(String)
@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, LargeBinary, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class IdempotencyKey(Base):
+    """An `Idempotency-Key` sent with a request, and the response the request got.
+
+    A key is claimed, with no response, before its request is handled, and completed with the
+    response once it succeeds; a request that fails releases its key so that it can be retried.
+    Keys are scoped to the user sending them and expire after `IDEMPOTENCY_KEY_TTL_SECONDS`.
+
+    Attributes:
+        user_id (Mapped[int]): The user who sent the request.
+        key (Mapped[str]): The value of the header.
+        fingerprint (Mapped[bytes]): SHA-256 of the method, path and body of the request, telling
+            a retry from the reuse of a key for another request.
+        status_code (Mapped[int]): Status of the response, None while the request is handled.
+        body (Mapped[bytes]): JSON body of the response.
+        expires_at (Mapped[datetime]): When the key can be reused, and the row purged.
+    """
+
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        Index("ix_idempotency_keys_expires_at", "expires_at"),
+    )
+
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE", name="idempotency_keys_user_id_fkey"),
+        primary_key=True
+    )
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    fingerprint: Mapped[bytes] = mapped_column(LargeBinary)
+    status_code: Mapped[Optional[int]] = mapped_column(SmallInteger, nullable=True)
+    body: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(DateTime)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<IdempotencyKey {self.user_id} {self.key}>"
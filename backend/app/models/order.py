@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Integer, ForeignKey, String
+from sqlalchemy import DDL, DateTime, FetchedValue, Index, Integer, ForeignKey, String, bindparam, event, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.custom_types import ChoiceType
@@ -30,6 +31,11 @@ class Order(ArchivedAtMixin, CompletedAtMixin, CreatedAtMixin, IDIntMixin, Updat
         client_id (Mapped[int]): Foreign key referencing the associated client.
         created_by_id (Mapped[int]): Foreign key referencing the user who created the order.
         urgency_id (Mapped[int]): Foreign key referencing the urgency level of the order.
+        due_at (Mapped[datetime]): When the order should be processed by, the creation time plus the
+            processing window of its urgency, None if the urgency has no window. Set by triggers.
+        overdue_notified_at (Mapped[datetime]): When the operators were told the order is overdue.
+        archived_at (Mapped[datetime]): When the order was archived, once finished and left untouched
+            for `ORDER_ARCHIVE_AFTER_DAYS`. Archived orders are left out of the admin list by default.
         visa_duration_id (Mapped[int]): Foreign key referencing the duration of the visa.
         visa_type_id (Mapped[int]): Foreign key referencing the type of visa.
         country (Mapped[Country]): Relationship to the Country model.
@@ -42,6 +48,32 @@ class Order(ArchivedAtMixin, CompletedAtMixin, CreatedAtMixin, IDIntMixin, Updat
     """
 
     __tablename__ = "orders"
+    __table_args__ = (
+        # Covers the status lookup by numbers, which is then answered by an index-only scan
+        Index("ix_orders_number", "number", unique=True, postgresql_include=["status", "updated_at"]),
+        # Range scans of the months of the revenue report
+        Index("ix_orders_created_at", "created_at"),
+        # Read by the overdue order scanner, holds the active orders not reported overdue yet
+        Index(
+            "ix_orders_due_at_pending",
+            "due_at",
+            postgresql_where=text(
+                "status IN ('draft', 'new', 'in_progress') AND overdue_notified_at IS NULL"
+            ),
+        ),
+        # Lists of the admin default to the orders not archived, which these keep apart from the
+        # archived ones however many accumulate
+        Index("ix_orders_hot_id", "id", postgresql_where=text("archived_at IS NULL")),
+        Index("ix_orders_hot_client_id", "client_id", "id", postgresql_where=text("archived_at IS NULL")),
+        # Read by the archival job, holds the finished orders not archived yet
+        Index(
+            "ix_orders_finished_updated_at",
+            "updated_at",
+            postgresql_where=text("status IN ('completed', 'canceled') AND archived_at IS NULL"),
+        ),
+    )
+    # Returns the due time set by the triggers on the statement writing the order
+    __mapper_args__ = {"eager_defaults": True}
 
     STATUS_DRAFT = "draft"
     STATUS_NEW = "new"
@@ -57,6 +89,20 @@ class Order(ArchivedAtMixin, CompletedAtMixin, CreatedAtMixin, IDIntMixin, Updat
         (STATUS_CANCELED, "Canceled"),
     )
 
+    # The statuses an order in a status can be moved to
+    STATUS_TRANSITIONS = {
+        STATUS_DRAFT: (STATUS_NEW, STATUS_CANCELED),
+        STATUS_NEW: (STATUS_IN_PROGRESS, STATUS_CANCELED),
+        STATUS_IN_PROGRESS: (STATUS_COMPLETED, STATUS_CANCELED),
+        STATUS_COMPLETED: (),
+        STATUS_CANCELED: (),
+    }
+
+    # Orders still being worked on, the ones with a due time to keep
+    ACTIVE_STATUSES = (STATUS_DRAFT, STATUS_NEW, STATUS_IN_PROGRESS)
+    # Orders done with, archived once they have not been updated for a while
+    FINISHED_STATUSES = (STATUS_COMPLETED, STATUS_CANCELED)
+
     status: Mapped[str] = mapped_column(ChoiceType(choices=STATUS_CHOICES), default=STATUS_DRAFT, server_default="draft")
     number: Mapped[str] = mapped_column(String, nullable=True)
     # Foreign key fields
@@ -84,6 +130,12 @@ class Order(ArchivedAtMixin, CompletedAtMixin, CreatedAtMixin, IDIntMixin, Updat
         Integer,
         ForeignKey("visa_types.id", name="orders_visa_type_id_fkey")
     )
+    due_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=True, server_default=FetchedValue(), server_onupdate=FetchedValue()
+    )
+    overdue_notified_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=True, server_default=FetchedValue(), server_onupdate=FetchedValue()
+    )
 
     # Relationships
     applicant: Mapped["Applicant"] = relationship(
@@ -107,6 +159,36 @@ class Order(ArchivedAtMixin, CompletedAtMixin, CreatedAtMixin, IDIntMixin, Updat
         """Return a string representation of the Order instance."""
         return f"<Order {self.number}>"
 
+    @classmethod
+    def is_active(cls):
+        """Return the condition of `ACTIVE_STATUSES`.
+
+        The statuses are rendered as literals rather than parameters, so that the planner can
+        match the condition with the predicate of a partial index such as `ix_orders_due_at_pending`.
+        """
+        return cls.status.in_(
+            bindparam("active_statuses", cls.ACTIVE_STATUSES, expanding=True, literal_execute=True)
+        )
+
+    @classmethod
+    def is_finished(cls):
+        """Return the condition of `FINISHED_STATUSES`, rendered as literals as in `is_active`."""
+        return cls.status.in_(
+            bindparam("finished_statuses", cls.FINISHED_STATUSES, expanding=True, literal_execute=True)
+        )
+
+    @classmethod
+    def get_statuses_transitioning_to(cls, status: str) -> tuple[str, ...]:
+        """Return the statuses an order can be moved to `status` from.
+
+        Args:
+            status (str): The target status.
+
+        Returns:
+            tuple[str, ...]: The source statuses, empty if no order can be moved to `status`.
+        """
+        return tuple(source for source, targets in cls.STATUS_TRANSITIONS.items() if status in targets)
+
     @staticmethod
     def get_model_type() -> str:
         """Return the model type as a string.
@@ -115,3 +197,33 @@ class Order(ArchivedAtMixin, CompletedAtMixin, CreatedAtMixin, IDIntMixin, Updat
             str: The type of the model, which is 'order'.
         """
         return "order"
+
+
+# Kept in sync with the migration adding the due times
+DUE_AT_FUNCTION = DDL("""
+    CREATE OR REPLACE FUNCTION orders_set_due_at() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.due_at := NEW.created_at + make_interval(
+            hours => (SELECT processing_hours FROM urgencies WHERE id = NEW.urgency_id)
+        );
+        NEW.overdue_notified_at := NULL;
+        RETURN NEW;
+    END
+    $$
+""")
+
+DUE_AT_INSERT_TRIGGER = DDL("""
+    CREATE TRIGGER orders_due_at_insert BEFORE INSERT ON orders
+    FOR EACH ROW EXECUTE FUNCTION orders_set_due_at()
+""")
+
+DUE_AT_UPDATE_TRIGGER = DDL("""
+    CREATE TRIGGER orders_due_at_update BEFORE UPDATE OF created_at, urgency_id ON orders
+    FOR EACH ROW WHEN ((OLD.created_at, OLD.urgency_id) IS DISTINCT FROM (NEW.created_at, NEW.urgency_id))
+    EXECUTE FUNCTION orders_set_due_at()
+""")
+
+# One statement at a time, see app.models.order_search
+for statement in (DUE_AT_FUNCTION, DUE_AT_INSERT_TRIGGER, DUE_AT_UPDATE_TRIGGER):
+    event.listen(Order.__table__, "after_create", statement)
@@ -0,0 +1,116 @@
+from sqlalchemy import DDL, ForeignKey, Index, Integer, event
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.applicants import Applicant
+from app.models.base import Base
+
+
+class OrderSearch(Base):
+    """Full-text search document of an order.
+
+    The document holds the order id and number (weight A), the name and email of its applicant
+    (weight B) and the name of its client (weight C), split into words so that fragments such as
+    ``0042`` or ``smith`` match as prefixes. Rows are maintained by triggers on `orders`,
+    `applicants` and `clients`, and never written by the application.
+    """
+
+    __tablename__ = "order_search"
+    __table_args__ = (
+        Index("ix_order_search_document", "document", postgresql_using="gin"),
+    )
+
+    order_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("orders.id", ondelete="CASCADE", name="order_search_order_id_fkey"),
+        primary_key=True
+    )
+    document: Mapped[str] = mapped_column(TSVECTOR, nullable=False)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<OrderSearch {self.order_id}>"
+
+
+# Kept in sync with the migration creating the table
+REFRESH_FUNCTION = DDL("""
+    CREATE OR REPLACE FUNCTION order_search_refresh(order_ids integer[]) RETURNS void
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO order_search (order_id, document)
+        SELECT
+            o.id,
+            setweight(to_tsvector('simple', o.id::text || ' ' || translate(coalesce(o.number, ''), '-', ' ')), 'A')
+            || setweight(to_tsvector('simple', translate(
+                concat_ws(' ', a.first_name, a.last_name, a.email), '@._-', '    '
+            )), 'B')
+            || setweight(to_tsvector('simple', coalesce(c.name, '')), 'C')
+        FROM orders o
+        LEFT JOIN applicants a ON a.order_id = o.id
+        LEFT JOIN clients c ON c.id = o.client_id
+        WHERE o.id = ANY(order_ids)
+        ON CONFLICT (order_id) DO UPDATE SET document = EXCLUDED.document;
+    END
+    $$
+""")
+
+ORDERS_TRIGGER_FUNCTION = DDL("""
+    CREATE OR REPLACE FUNCTION order_search_orders_changed() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM order_search_refresh(ARRAY[NEW.id]);
+        RETURN NULL;
+    END
+    $$
+""")
+
+ORDERS_TRIGGER = DDL("""
+    CREATE TRIGGER order_search_orders AFTER INSERT OR UPDATE OF number, client_id ON orders
+    FOR EACH ROW EXECUTE FUNCTION order_search_orders_changed()
+""")
+
+CLIENTS_TRIGGER_FUNCTION = DDL("""
+    CREATE OR REPLACE FUNCTION order_search_clients_changed() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM order_search_refresh(ARRAY(SELECT id FROM orders WHERE client_id = NEW.id));
+        RETURN NULL;
+    END
+    $$
+""")
+
+CLIENTS_TRIGGER = DDL("""
+    CREATE TRIGGER order_search_clients AFTER UPDATE OF name ON clients
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name) EXECUTE FUNCTION order_search_clients_changed()
+""")
+
+APPLICANTS_TRIGGER_FUNCTION = DDL("""
+    CREATE OR REPLACE FUNCTION order_search_applicants_changed() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP <> 'INSERT' THEN
+            PERFORM order_search_refresh(ARRAY[OLD.order_id]);
+        END IF;
+
+        IF TG_OP <> 'DELETE' THEN
+            PERFORM order_search_refresh(ARRAY[NEW.order_id]);
+        END IF;
+
+        RETURN NULL;
+    END
+    $$
+""")
+
+APPLICANTS_TRIGGER = DDL("""
+    CREATE TRIGGER order_search_applicants
+    AFTER INSERT OR UPDATE OF first_name, last_name, email, order_id OR DELETE ON applicants
+    FOR EACH ROW EXECUTE FUNCTION order_search_applicants_changed()
+""")
+
+# Statements are executed one by one, asyncpg prepares a single statement at a time. The tables
+# a trigger is created on exist when the table it is attached to is created: orders and clients
+# are created before order_search, which references orders.
+for statement in (REFRESH_FUNCTION, ORDERS_TRIGGER_FUNCTION, ORDERS_TRIGGER, CLIENTS_TRIGGER_FUNCTION, CLIENTS_TRIGGER):
+    event.listen(OrderSearch.__table__, "after_create", statement)
+
+for statement in (APPLICANTS_TRIGGER_FUNCTION, APPLICANTS_TRIGGER):
+    event.listen(Applicant.__table__, "after_create", statement)
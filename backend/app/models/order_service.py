@@ -1,7 +1,7 @@
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Integer, ForeignKey, Numeric
+from sqlalchemy import Index, Integer, ForeignKey, Numeric
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.helpers import calculate_tax
@@ -14,6 +14,10 @@ if TYPE_CHECKING:
 
 class OrderService(IDIntMixin, Base):
     __tablename__ = "order_services"
+    __table_args__ = (
+        # Services of an order, read by the revenue report once its orders are found by month
+        Index("ix_order_services_order_id", "order_id"),
+    )
 
     price: Mapped[Decimal] = mapped_column(Numeric(10, 2))  # Net price
     tax: Mapped[Decimal] = mapped_column(Numeric(10, 2))  # Tax / 100
@@ -0,0 +1,79 @@
+from datetime import date
+
+from sqlalchemy import DDL, Date, Integer, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database.custom_types import ChoiceType
+from app.models.base import Base
+from app.models.order import Order
+
+
+class OrderStatsDaily(Base):
+    """Number of orders created on a day, by current status, country, visa type, urgency and client.
+
+    Rows are maintained by triggers on `orders`: an inserted order adds one to the row of its day
+    and dimensions, a deleted order removes one, and a change of status or of a dimension moves
+    the order from its old row to its new one. Rows emptied by such moves are kept with a count
+    of zero. Dashboards read these rows instead of scanning orders, so their cost grows with the
+    number of days and dimension values rather than with the number of orders.
+    """
+
+    __tablename__ = "order_stats_daily"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    status: Mapped[str] = mapped_column(ChoiceType(choices=Order.STATUS_CHOICES), primary_key=True)
+    country_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    visa_type_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    urgency_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    client_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    orders: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<OrderStatsDaily {self.day} {self.status} {self.orders}>"
+
+
+# Kept in sync with the migration creating the table
+TRIGGER_FUNCTION = DDL("""
+    CREATE OR REPLACE FUNCTION order_stats_daily_apply() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP <> 'INSERT' THEN
+            UPDATE order_stats_daily SET orders = orders - 1
+            WHERE day = OLD.created_at::date AND status = OLD.status AND country_id = OLD.country_id
+                AND visa_type_id = OLD.visa_type_id AND urgency_id = OLD.urgency_id AND client_id = OLD.client_id;
+        END IF;
+
+        IF TG_OP <> 'DELETE' THEN
+            INSERT INTO order_stats_daily (day, status, country_id, visa_type_id, urgency_id, client_id, orders)
+            VALUES (
+                NEW.created_at::date, NEW.status, NEW.country_id, NEW.visa_type_id, NEW.urgency_id, NEW.client_id, 1
+            )
+            ON CONFLICT (day, status, country_id, visa_type_id, urgency_id, client_id)
+            DO UPDATE SET orders = order_stats_daily.orders + 1;
+        END IF;
+
+        RETURN NULL;
+    END
+    $$
+""")
+
+INSERT_DELETE_TRIGGER = DDL("""
+    CREATE TRIGGER order_stats_daily_insert_delete AFTER INSERT OR DELETE ON orders
+    FOR EACH ROW EXECUTE FUNCTION order_stats_daily_apply()
+""")
+
+UPDATE_TRIGGER = DDL("""
+    CREATE TRIGGER order_stats_daily_update
+    AFTER UPDATE OF created_at, status, country_id, visa_type_id, urgency_id, client_id ON orders
+    FOR EACH ROW WHEN (
+        (OLD.created_at::date, OLD.status, OLD.country_id, OLD.visa_type_id, OLD.urgency_id, OLD.client_id)
+        IS DISTINCT FROM
+        (NEW.created_at::date, NEW.status, NEW.country_id, NEW.visa_type_id, NEW.urgency_id, NEW.client_id)
+    )
+    EXECUTE FUNCTION order_stats_daily_apply()
+""")
+
+# One statement at a time, see app.models.order_search. Created with orders, which the triggers
+# are on: the statistics table has no foreign key to it, so it may be created first
+for statement in (TRIGGER_FUNCTION, INSERT_DELETE_TRIGGER, UPDATE_TRIGGER):
+    event.listen(Order.__table__, "after_create", statement)
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+from sqlalchemy import DDL, BigInteger, DateTime, ForeignKey, Index, Integer, event
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.database.custom_types import ChoiceType
+from app.models.base import Base
+from app.models.order import Order
+
+
+class OrderStatusEvent(Base):
+    """A status change of an order.
+
+    Rows are appended by triggers on `orders`, in the statement that inserts the order or
+    changes its status, whichever path changes it; they are never written by the application.
+    The first event of an order has no old status. An order is in `status` from `created_at` to
+    the `created_at` of its next event.
+    """
+
+    __tablename__ = "order_status_events"
+    __table_args__ = (
+        Index("ix_order_status_events_order_id_created_at", "order_id", "created_at"),
+        Index("ix_order_status_events_created_at", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    order_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("orders.id", ondelete="CASCADE", name="order_status_events_order_id_fkey")
+    )
+    old_status: Mapped[str] = mapped_column(ChoiceType(choices=Order.STATUS_CHOICES), nullable=True)
+    status: Mapped[str] = mapped_column(ChoiceType(choices=Order.STATUS_CHOICES))
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<OrderStatusEvent {self.order_id} {self.old_status} -> {self.status}>"
+
+
+# Kept in sync with the migration creating the table
+TRIGGER_FUNCTION = DDL("""
+    CREATE OR REPLACE FUNCTION order_status_events_append() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO order_status_events (order_id, old_status, status, created_at)
+        VALUES (NEW.id, CASE WHEN TG_OP = 'UPDATE' THEN OLD.status END, NEW.status, now());
+        RETURN NULL;
+    END
+    $$
+""")
+
+INSERT_TRIGGER = DDL("""
+    CREATE TRIGGER order_status_events_insert AFTER INSERT ON orders
+    FOR EACH ROW EXECUTE FUNCTION order_status_events_append()
+""")
+
+UPDATE_TRIGGER = DDL("""
+    CREATE TRIGGER order_status_events_update AFTER UPDATE OF status ON orders
+    FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status) EXECUTE FUNCTION order_status_events_append()
+""")
+
+# One statement at a time, see app.models.order_search
+for statement in (TRIGGER_FUNCTION, INSERT_TRIGGER, UPDATE_TRIGGER):
+    event.listen(OrderStatusEvent.__table__, "after_create", statement)
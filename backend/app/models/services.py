@@ -1,10 +1,11 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Integer, ForeignKey, event
+from sqlalchemy import String, Integer, ForeignKey, and_, event, select
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.custom_types import ChoiceType
+from app.database.search import trigram_index
 from app.models.base import Base
 from app.models.mixins import CreatedAtMixin, IDIntMixin, UpdatedAtMixin, ArchivedAtMixin
 
@@ -23,13 +24,15 @@ class Service(ArchivedAtMixin, CreatedAtMixin, IDIntMixin, UpdatedAtMixin, Base)
             visa_duration_id (Mapped[int]): Foreign key referencing the associated visa duration.
             visa_type_id (Mapped[int]): Foreign key referencing the associated visa type.
             country (Mapped[Country]): Relationship to the Country model.
-            tariff_services (Mapped[list[TariffService]]): Relationship to the TariffService model.
+            tariff_services (Mapped[list[TariffService]]): Read-only relationship to the prices of the
+                service in the active versions of the tariffs.
             urgency (Mapped[Urgency]): Relationship to the Urgency model.
             visa_duration (Mapped[VisaDuration]): Relationship to the VisaDuration model.
             visa_type (Mapped[VisaType]): Relationship to the VisaType model.
         """
 
     __tablename__ = "services"
+    __table_args__ = (trigram_index("ix_services_name_trgm", "name"),)
 
     FEE_TYPE_CONSULAR = "consular"
     FEE_TYPE_GENERAL = "general"
@@ -58,10 +61,10 @@ class Service(ArchivedAtMixin, CreatedAtMixin, IDIntMixin, UpdatedAtMixin, Base)
 
     # Relationships
     country: Mapped["Country"] = relationship(back_populates="services")
+    # Prices are written as tariff versions (see TariffsRepository.create_version), never through this
     tariff_services: Mapped[list["TariffService"]] = relationship(
-        back_populates="service",
-        foreign_keys="TariffService.service_id",
-        cascade="all, delete-orphan",
+        primaryjoin=lambda: _active_tariff_services_join(),
+        viewonly=True,
     )
     urgency: Mapped["Urgency"] = relationship(back_populates="services")
     visa_duration: Mapped["VisaDuration"] = relationship(back_populates="services")
@@ -75,6 +78,15 @@ class Service(ArchivedAtMixin, CreatedAtMixin, IDIntMixin, UpdatedAtMixin, Base)
         return "service"
 
 
+def _active_tariff_services_join():
+    from app.models import Tariff, TariffService
+
+    return and_(
+        Service.id == TariffService.service_id,
+        TariffService.version_id.in_(select(Tariff.active_version_id).scalar_subquery()),
+    )
+
+
 @event.listens_for(Service, "before_update")
 def set_updated_at(mapper, connection, target):
     """Automatically set the updated_at timestamp before any update to the Service instance.
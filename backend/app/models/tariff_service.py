@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import Integer, Numeric, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -9,13 +9,13 @@ from app.models.base import Base
 from app.models.mixins import ArchivedAtMixin, CreatedAtMixin, IDIntMixin, UpdatedAtMixin
 
 if TYPE_CHECKING:
-    from app.models import Service, Tariff
+    from app.models import Service, Tariff, TariffVersion
 
 
 class TariffService(IDIntMixin, CreatedAtMixin, UpdatedAtMixin, ArchivedAtMixin, Base):
     __tablename__ = "tariff_services"
     __table_args__ = (
-        UniqueConstraint("service_id", "tariff_id", name="uq_tariff_service_service_tariff"),
+        UniqueConstraint("version_id", "service_id", name="uq_tariff_service_version_service"),
     )
 
     price: Mapped[Decimal] = mapped_column(Numeric(10, 2))  # Net price
@@ -26,12 +26,23 @@ class TariffService(IDIntMixin, CreatedAtMixin, UpdatedAtMixin, ArchivedAtMixin,
     # Foreign key fields
     service_id: Mapped[int] = mapped_column(Integer, ForeignKey("services.id", ondelete="CASCADE"))
     tariff_id: Mapped[int] = mapped_column(Integer, ForeignKey("tariffs.id", ondelete="CASCADE"))
+    version_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("tariff_versions.id", ondelete="CASCADE"), index=True
+    )
 
     # Relationships
-    service: Mapped["Service"] = relationship(back_populates="tariff_services")
+    service: Mapped["Service"] = relationship()
     tariff: Mapped["Tariff"] = relationship(back_populates="tariff_services")
+    version: Mapped["TariffVersion"] = relationship(back_populates="tariff_services")
 
-    def __init__(self, price: Decimal, tax: Decimal, service_id: int, tariff_id: int):
+    def __init__(
+            self,
+            price: Decimal,
+            tax: Decimal,
+            service_id: int,
+            tariff_id: int,
+            version_id: Optional[int] = None
+    ):
         super().__init__()
         self.price = price
         self.tax = tax
@@ -40,6 +51,10 @@ class TariffService(IDIntMixin, CreatedAtMixin, UpdatedAtMixin, ArchivedAtMixin,
         self.service_id = service_id
         self.tariff_id = tariff_id
 
+        # Otherwise set on flush, from the version the row is added to
+        if version_id is not None:
+            self.version_id = version_id
+
     @staticmethod
     def calculate_tax(price: Decimal, tax: Decimal) -> Decimal:
         """Calculate tax based on price and tax"""
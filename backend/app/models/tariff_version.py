@@ -0,0 +1,41 @@
+from typing import TYPE_CHECKING
+
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import Base
+from app.models.mixins import CreatedAtMixin, IDIntMixin
+
+if TYPE_CHECKING:
+    from app.models import Tariff, TariffService
+
+
+class TariffVersion(IDIntMixin, CreatedAtMixin, Base):
+    """An immutable snapshot of a tariff price list.
+
+    Repricing never updates tariff_services rows in place: a new version is written in bulk and
+    activated by pointing `Tariff.active_version_id` at it. Previous versions are kept for audit.
+
+        Attributes:
+            tariff_id (Mapped[int]): Foreign key referencing the versioned tariff.
+            tariff (Mapped[Tariff]): Relationship to the Tariff model.
+            tariff_services (Mapped[list[TariffService]]): The prices of this version.
+        """
+
+    __tablename__ = "tariff_versions"
+
+    tariff_id: Mapped[int] = mapped_column(Integer, ForeignKey("tariffs.id", ondelete="CASCADE"), index=True)
+
+    # Relationships
+    tariff: Mapped["Tariff"] = relationship(back_populates="versions", foreign_keys=[tariff_id])
+    tariff_services: Mapped[list["TariffService"]] = relationship(
+        back_populates="version",
+        foreign_keys="TariffService.version_id"
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return "<TariffVersion {}>".format(self.id)
+
+    @staticmethod
+    def get_model_type() -> str:
+        return "tariff_version"
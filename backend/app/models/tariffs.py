@@ -1,13 +1,13 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, String
+from sqlalchemy import Boolean, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
 from app.models.mixins import IDIntMixin
 
 if TYPE_CHECKING:
-    from app.models import Client, TariffService
+    from app.models import Client, TariffService, TariffVersion
 
 
 class Tariff(IDIntMixin, Base):
@@ -15,6 +15,12 @@ class Tariff(IDIntMixin, Base):
 
     name: Mapped[str] = mapped_column(String(100))
     is_default: Mapped[bool] = mapped_column(Boolean, default=False)
+    # The price list currently in use, see TariffVersion
+    active_version_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("tariff_versions.id", ondelete="SET NULL", use_alter=True, name="tariffs_active_version_id_fkey"),
+        nullable=True
+    )
 
     # Relationships
     clients: Mapped[list["Client"]] = relationship(back_populates="tariff", foreign_keys="Client.tariff_id")
@@ -22,6 +28,10 @@ class Tariff(IDIntMixin, Base):
         back_populates="tariff",
         foreign_keys="TariffService.tariff_id"
     )
+    versions: Mapped[list["TariffVersion"]] = relationship(
+        back_populates="tariff",
+        foreign_keys="TariffVersion.tariff_id"
+    )
 
     def __repr__(self) -> str:  # pragma: no cover
         return "<Tariff {}>".format(self.id)
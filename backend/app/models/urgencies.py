@@ -1,6 +1,6 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String
+from sqlalchemy import DDL, Integer, String, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -11,9 +11,17 @@ if TYPE_CHECKING:
 
 
 class Urgency(IDIntMixin, Base):
+    """An urgency of orders.
+
+    `processing_hours` is the processing window of the orders of the urgency: an order is due that
+    many hours after it was created (see `Order.due_at`). Urgencies without a window have no due time.
+    Changing the window moves the due time of the active orders of the urgency, by a trigger.
+    """
+
     __tablename__ = "urgencies"
 
     name: Mapped[str] = mapped_column(String)
+    processing_hours: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Relations
     services: Mapped[list["Service"]] = relationship(back_populates="urgency", foreign_keys="Service.urgency_id")
@@ -24,3 +32,27 @@ class Urgency(IDIntMixin, Base):
     @staticmethod
     def get_model_type() -> str:
         return "urgency"
+
+
+# Kept in sync with the migration adding the due times
+RESCHEDULE_FUNCTION = DDL("""
+    CREATE OR REPLACE FUNCTION urgencies_reschedule_orders() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE orders
+        SET due_at = created_at + make_interval(hours => NEW.processing_hours), overdue_notified_at = NULL
+        WHERE urgency_id = NEW.id AND status IN ('draft', 'new', 'in_progress');
+        RETURN NULL;
+    END
+    $$
+""")
+
+RESCHEDULE_TRIGGER = DDL("""
+    CREATE TRIGGER urgencies_reschedule_orders AFTER UPDATE OF processing_hours ON urgencies
+    FOR EACH ROW WHEN (OLD.processing_hours IS DISTINCT FROM NEW.processing_hours)
+    EXECUTE FUNCTION urgencies_reschedule_orders()
+""")
+
+# One statement at a time, see app.models.order_search
+for statement in (RESCHEDULE_FUNCTION, RESCHEDULE_TRIGGER):
+    event.listen(Urgency.__table__, "after_create", statement)
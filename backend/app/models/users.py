@@ -1,10 +1,11 @@
 from typing import TYPE_CHECKING
 
 from pydantic import EmailStr
-from sqlalchemy import String, Integer, Boolean, ForeignKey
+from sqlalchemy import String, Integer, Boolean, ForeignKey, literal_column
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.custom_types import ChoiceType
+from app.database.search import trigram_index
 from app.models.base import Base
 from app.models.mixins import CreatedAtMixin, IDIntMixin, UpdatedAtMixin, IsActiveMixin
 
@@ -69,3 +70,10 @@ class User(CreatedAtMixin, IDIntMixin, IsActiveMixin, UpdatedAtMixin, Base):
     @property
     def full_name(self) -> str:
         return f"{self.first_name} {self.last_name}"
+
+
+# Searched by UsersRepository, with the trigram index below. The separator is a literal rather
+# than a bound parameter, for the expression of the queries to match the indexed one.
+USER_FULL_NAME = (User.__table__.c.first_name + literal_column("' '") + User.__table__.c.last_name).label("full_name")
+
+trigram_index("ix_users_full_name_trgm", USER_FULL_NAME)
@@ -4,6 +4,7 @@ from pydantic import Field
 
 from app.models import LogEntry
 from app.schemas.core import CoreSchema, CreatedAtSchemaMixin, IDSchemaMixin
+from app.schemas.pagination import KeysetResponseSchema
 
 
 class LogEntryBaseSchema(CoreSchema):
@@ -23,3 +24,17 @@ class LogEntryCreateSchema(CoreSchema):
     action: Optional[str] = None
     model_type: Optional[str] = None
     target_id: Optional[int] = None
+
+
+class LogEntryFilterSchema(CoreSchema):
+    """
+    Schema for filtering log entries in admin panel.
+    """
+    user_id: Optional[int] = None
+    action: Optional[str] = None
+    model_type: Optional[str] = None
+    target_id: Optional[int] = None
+
+
+class LogEntryListResponseSchema(KeysetResponseSchema):
+    items: list[LogEntryPublicSchema]
@@ -6,6 +6,14 @@ from pydantic import BaseModel, field_validator
 STRFTIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
+def format_datetime(value: datetime) -> str:
+    """Format a datetime as `STRFTIME_FORMAT` does, through the much cheaper `isoformat`."""
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None)
+
+    return value.isoformat(" ", "seconds")
+
+
 class CoreSchema(BaseModel):
     model_config = {"from_attributes": True}
 
@@ -20,7 +28,7 @@ class ArchivedAtSchemaMixin(BaseModel):
 
     @field_validator("archived_at")
     def parse_archived_at(cls, value: datetime | None) -> str | None:
-        return value.strftime(STRFTIME_FORMAT) if value else None
+        return format_datetime(value) if value else None
 
 
 class CreatedAtSchemaMixin(BaseModel):
@@ -29,7 +37,7 @@ class CreatedAtSchemaMixin(BaseModel):
 
     @field_validator("created_at")
     def parse_created_at(cls, value: datetime) -> str:
-        return value.strftime(STRFTIME_FORMAT)
+        return format_datetime(value)
 
     @field_validator('created_at')
     def default_created_at(cls, value: datetime) -> datetime:
@@ -42,7 +50,7 @@ class UpdatedAtSchemaMixin(BaseModel):
 
     @field_validator("updated_at")
     def parse_updated_at(cls, value: datetime) -> str:
-        return value.strftime(STRFTIME_FORMAT)
+        return format_datetime(value)
 
     @field_validator('updated_at')
     def default_updated_at(cls, value: datetime) -> datetime:
@@ -55,7 +63,7 @@ class CompletedAtSchemaMixin(BaseModel):
 
     @field_validator("completed_at")
     def parse_completed_at(cls, value: datetime | None) -> str:
-        return value and value.strftime(STRFTIME_FORMAT)
+        return value and format_datetime(value)
 
     @field_validator('completed_at')
     def default_completed_at(cls, value: datetime | None) -> datetime:
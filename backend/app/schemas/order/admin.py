@@ -1,21 +1,35 @@
-from typing import Optional
+from datetime import datetime
+from typing import Annotated, Optional
+
+from fastapi import Query
+from pydantic import ConfigDict, Field, field_validator
 
 from app.schemas.applicant import ApplicantPublicSchema
 from app.schemas.client import ClientPublicSchema
 from app.schemas.core import (
-    CoreSchema
+    CoreSchema,
+    CreatedAtSchemaMixin,
+    IDSchemaMixin,
+    UpdatedAtSchemaMixin,
+    format_datetime
 )
 from app.schemas.order.base import (
     BaseOrderListSchema,
     BaseOrderCreateSchema,
     BaseOrderUpdateSchema,
-    BaseOrdersFilterSchema
+    BaseOrdersFilterSchema,
+    OrderStatusEnum
 )
 from app.schemas.pagination import PagedResponseSchema
 
 
 class AdminOrderListSchema(BaseOrderListSchema):
     client: ClientPublicSchema
+    due_at: Optional[datetime] = None
+
+    @field_validator("due_at")
+    def parse_due_at(cls, value: datetime | None) -> str | None:
+        return format_datetime(value) if value else None
 
 
 class AdminOrderDetailSchema(AdminOrderListSchema):
@@ -37,3 +51,95 @@ class AdminOrderPaginatedListSchema(PagedResponseSchema, CoreSchema):
 class AdminOrderFilterSchema(BaseOrdersFilterSchema):
     created_by_id: Optional[int] = None
     client_id: Optional[int] = None
+    q: Annotated[
+        str | None,
+        Query(max_length=100, description="Search by order number, applicant name or email, or client name")
+    ] = None
+    include_archived: Annotated[
+        bool,
+        Query(description="Include the archived orders, left out by default")
+    ] = False
+
+
+# Most order numbers a single status lookup accepts
+ORDER_STATUS_LOOKUP_LIMIT = 5000
+
+
+class AdminOrderStatusLookupSchema(CoreSchema):
+    numbers: list[str] = Field(..., min_length=1, max_length=ORDER_STATUS_LOOKUP_LIMIT)
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "numbers": ["2025-0001", "2025-0002"]
+            }
+        }
+    )
+
+
+class AdminOrderStatusSchema(UpdatedAtSchemaMixin, CoreSchema):
+    number: str
+    status: OrderStatusEnum
+
+
+class AdminOrderStatusListSchema(CoreSchema):
+    items: list[AdminOrderStatusSchema]
+
+
+class AdminOrderStatusTransitionSchema(CoreSchema):
+    order_ids: list[int] = Field(..., min_length=1, max_length=ORDER_STATUS_LOOKUP_LIMIT)
+    status: OrderStatusEnum
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "order_ids": [1, 2, 3],
+                "status": OrderStatusEnum.COMPLETED
+            }
+        }
+    )
+
+
+class AdminOrderTransitionedSchema(AdminOrderStatusSchema, IDSchemaMixin):
+    old_status: OrderStatusEnum
+
+
+class AdminOrderStatusTransitionResultSchema(CoreSchema):
+    items: list[AdminOrderTransitionedSchema]
+    # Orders not found, or whose status cannot be moved to the requested one
+    skipped_ids: list[int]
+
+
+class AdminOrderStatusEventSchema(IDSchemaMixin, CreatedAtSchemaMixin):
+    old_status: Optional[OrderStatusEnum] = None
+    status: OrderStatusEnum
+    # When the order left the status, None for its current status
+    left_at: Optional[datetime] = None
+
+    @field_validator("left_at")
+    def parse_left_at(cls, value: datetime | None) -> str | None:
+        return format_datetime(value) if value else None
+
+
+class AdminOrderStatusTimelineSchema(CoreSchema):
+    items: list[AdminOrderStatusEventSchema]
+
+
+class AdminOrderStatusDurationsParamsSchema(CoreSchema):
+    status: OrderStatusEnum
+    since: Optional[datetime] = None
+
+
+class AdminOrderStatusDurationsSchema(CoreSchema):
+    status: OrderStatusEnum
+    since: datetime
+    completed: int
+    open: int
+    # Seconds spent in the status, over the completed stays
+    p50: Optional[float] = None
+    p90: Optional[float] = None
+    p99: Optional[float] = None
+
+    @field_validator("since")
+    def parse_since(cls, value: datetime) -> str:
+        return format_datetime(value)
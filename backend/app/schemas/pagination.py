@@ -1,4 +1,4 @@
-from typing import Annotated, Generic, TypeVar
+from typing import Annotated, Generic, Optional, TypeVar
 from pydantic import conint
 
 from app.schemas.core import CoreSchema
@@ -18,3 +18,13 @@ class PagedResponseSchema(CoreSchema, Generic[TypeT]):
     total_pages: int
     has_next: bool
     has_prev: bool
+
+
+class KeysetParamsSchema(CoreSchema):
+    """Parameters of keyset (cursor) pagination: the `next_cursor` of the previous page, if any"""
+    cursor: Optional[str] = None
+    size: Annotated[int, conint(ge=1, le=100)] = 25
+
+
+class KeysetResponseSchema(CoreSchema):
+    next_cursor: Optional[str] = None
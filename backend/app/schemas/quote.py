@@ -0,0 +1,21 @@
+from decimal import Decimal
+
+from app.schemas.core import CoreSchema
+from app.schemas.order_service import TariffServicePublicSchema
+
+
+class QuoteParamsSchema(CoreSchema):
+    client_id: int
+    country_id: int
+    visa_type_id: int
+    visa_duration_id: int
+    urgency_id: int
+
+
+class QuoteResponseSchema(CoreSchema):
+    client_id: int
+    tariff_id: int
+    services: list[TariffServicePublicSchema]
+    price: Decimal
+    tax_amount: Decimal
+    total: Decimal
@@ -0,0 +1,54 @@
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from typing import Annotated, Optional
+
+from fastapi import Query
+
+from app.schemas.core import CoreSchema
+from app.schemas.service import FeeTypeEnum
+
+
+class RevenueDimensionEnum(str, Enum):
+    MONTH = "month"
+    TARIFF = "tariff_id"
+    SERVICE = "service_id"
+    FEE_TYPE = "fee_type"
+    COUNTRY = "country_id"
+
+
+class RevenueFilterSchema(CoreSchema):
+    """Services of the orders created from the month of `month_from` to the month of `month_to`
+    included, by default over the last 12 months"""
+    month_from: Optional[date] = None
+    month_to: Optional[date] = None
+    group_by: Annotated[
+        list[RevenueDimensionEnum],
+        Query(description="Dimensions to sum the revenue by, none for a single total")
+    ] = [RevenueDimensionEnum.MONTH]
+    tariff_id: Optional[int] = None
+    service_id: Optional[int] = None
+    fee_type: Optional[FeeTypeEnum] = None
+    country_id: Optional[int] = None
+
+
+class RevenueRowSchema(CoreSchema):
+    # Only the dimensions grouped by are set
+    month: Optional[date] = None
+    tariff_id: Optional[int] = None
+    service_id: Optional[int] = None
+    fee_type: Optional[FeeTypeEnum] = None
+    country_id: Optional[int] = None
+    services: int
+    revenue: Decimal
+    tax: Decimal
+    total: Decimal
+
+
+class RevenueResponseSchema(CoreSchema):
+    month_from: date
+    month_to: date
+    revenue: Decimal
+    tax: Decimal
+    total: Decimal
+    items: list[RevenueRowSchema]
@@ -0,0 +1,50 @@
+from datetime import date
+from enum import Enum
+from typing import Annotated, Optional
+
+from fastapi import Query
+
+from app.schemas.core import CoreSchema
+from app.schemas.order.base import OrderStatusEnum
+
+
+class OrderStatsDimensionEnum(str, Enum):
+    DAY = "day"
+    STATUS = "status"
+    COUNTRY = "country_id"
+    VISA_TYPE = "visa_type_id"
+    URGENCY = "urgency_id"
+    CLIENT = "client_id"
+
+
+class OrderStatsFilterSchema(CoreSchema):
+    """Orders created from `date_from` to `date_to` included, by default over the last 30 days"""
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    group_by: Annotated[
+        list[OrderStatsDimensionEnum],
+        Query(description="Dimensions to count the orders by, none for a single total")
+    ] = [OrderStatsDimensionEnum.DAY]
+    status: Optional[OrderStatusEnum] = None
+    country_id: Optional[int] = None
+    visa_type_id: Optional[int] = None
+    urgency_id: Optional[int] = None
+    client_id: Optional[int] = None
+
+
+class OrderStatsRowSchema(CoreSchema):
+    # Only the dimensions grouped by are set
+    day: Optional[date] = None
+    status: Optional[OrderStatusEnum] = None
+    country_id: Optional[int] = None
+    visa_type_id: Optional[int] = None
+    urgency_id: Optional[int] = None
+    client_id: Optional[int] = None
+    orders: int
+
+
+class OrderStatsResponseSchema(CoreSchema):
+    date_from: date
+    date_to: date
+    total: int
+    items: list[OrderStatsRowSchema]
@@ -7,14 +7,18 @@ from app.schemas.core import CoreSchema, IDSchemaMixin
 class UrgencyBaseSchema(CoreSchema):
     MODEL_TYPE: str = Field(default_factory=lambda: Urgency.get_model_type())
     name: str | None = None
+    processing_hours: int | None = None
 
 
 class UrgencyCreateSchema(CoreSchema):
     name: str
+    # Hours an order of the urgency should be processed within, none for no due time
+    processing_hours: int | None = Field(default=None, gt=0)
 
 
 class UrgencyUpdateSchema(CoreSchema):
     name: str
+    processing_hours: int | None = Field(default=None, gt=0)
 
 
 class UrgencyResponseSchema(IDSchemaMixin, UrgencyBaseSchema):
@@ -1,11 +1,24 @@
+from app import metrics
+from app.services.audit import AuditSink
 from app.services.auth import AuthService
+from app.services.cache import CacheService
 from app.services.email import EmailService
 from app.services.jwt import JWTService
 from app.services.notification import NotificationService
+from app.services.price_quote import PriceQuoteService
 from app.services.recipient import RecipientService
+from app.services.scheduler import Scheduler
+from app.services.tariff_version import TariffVersionService
 
+audit_sink = AuditSink()
 auth_service = AuthService()
+cache_service = CacheService()
 email_service = EmailService()
 jwt_service = JWTService()
 notification_service = NotificationService()
 recipient_service = RecipientService()
+scheduler = Scheduler()
+tariff_version_service = TariffVersionService()
+price_quote_service = PriceQuoteService(tariff_version_service=tariff_version_service, cache_service=cache_service)
+
+metrics.audit_buffer_size.set_function(lambda: audit_sink.buffer_size)
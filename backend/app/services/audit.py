@@ -0,0 +1,119 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Callable, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import config
+from app.models import LogEntry
+from app.schemas.audit import LogEntryCreateSchema
+
+logger = logging.getLogger(__name__)
+
+
+class AuditSink:
+    """Buffers audit entries and writes them in multi-row inserts off the request path.
+
+    The buffer is flushed by a background task when it reaches `batch_size` entries or every
+    `flush_interval` seconds, whichever comes first, and once more on `stop`. Entries keep the
+    time they were enqueued at as their created_at.
+    """
+
+    def __init__(
+            self,
+            *,
+            batch_size: int = config.AUDIT_BATCH_SIZE,
+            flush_interval: float = config.AUDIT_FLUSH_INTERVAL_SECONDS,
+            max_buffer_size: int = config.AUDIT_MAX_BUFFER_SIZE,
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer_size = max_buffer_size
+        self._buffer: list[dict[str, Any]] = []
+        self._session_factory: Optional[Callable[[], AsyncSession]] = None
+        self._task: Optional[asyncio.Task] = None
+        # Created again by `start`, for the event loop it runs on
+        self._wakeup = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._stopping = False
+
+    @property
+    def buffer_size(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, *, session_factory: Callable[[], AsyncSession]) -> None:
+        """Start the background flush task on the running event loop."""
+        self._session_factory = session_factory
+        self._wakeup = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task and write everything still buffered."""
+        if self._task is None:
+            return
+
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+        await self.flush()
+
+    def enqueue(self, data: LogEntryCreateSchema) -> None:
+        """Buffer an entry, waking the flush task up if a batch is full."""
+        self._buffer.append({**data.model_dump(), "created_at": datetime.now()})
+
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> int:
+        """Write the buffered entries, a batch per statement.
+
+        Returns:
+            int: The number of entries written. On a database error the unwritten entries are
+                kept for the next flush, up to `max_buffer_size`. Before `start` nothing is
+                written, the entries are kept until then.
+        """
+        written = 0
+
+        if self._session_factory is None:
+            return written
+
+        async with self._lock:
+            while self._buffer:
+                batch, self._buffer = self._buffer[:self.batch_size], self._buffer[self.batch_size:]
+
+                try:
+                    async with self._session_factory() as session:
+                        await session.execute(insert(LogEntry), batch)
+                        await session.commit()
+                except Exception:
+                    logger.exception(f"Failed to write {len(batch)} audit entries")
+                    self._buffer = batch + self._buffer
+                    dropped = len(self._buffer) - self.max_buffer_size
+
+                    if dropped > 0:
+                        logger.error(f"Audit buffer is full, dropping {dropped} oldest entries")
+                        self._buffer = self._buffer[dropped:]
+                    break
+
+                written += len(batch)
+
+        return written
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+
+            self._wakeup.clear()
+            await self.flush()
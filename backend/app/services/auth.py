@@ -1,9 +1,39 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, TypeVar
+
 import bcrypt
-from passlib.context import CryptContext
+
+from app import config, metrics
 from app.schemas.user import UserPasswordUpdateSchema
 
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+
+@functools.cache
+def get_pwd_context() -> "CryptContext":
+    """Return the password hashing context, importing passlib on first use."""
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+bcrypt_executor = ThreadPoolExecutor(max_workers=config.BCRYPT_WORKERS, thread_name_prefix="bcrypt")
+metrics.bcrypt_pool_workers.set_function(lambda: config.BCRYPT_WORKERS)
+
+T = TypeVar("T")
+
+
+def _measured(operation: str, function: Callable[[], T]) -> T:
+    metrics.bcrypt_pool_busy.inc()
+
+    try:
+        with metrics.bcrypt_duration.time(operation=operation):
+            return function()
+    finally:
+        metrics.bcrypt_pool_busy.dec()
 
 
 class AuthService:
@@ -11,7 +41,7 @@ class AuthService:
         return bcrypt.gensalt().decode()
 
     def hash_password(self, *, password: str, salt: str) -> str:
-        return pwd_context.hash(password + salt)
+        return get_pwd_context().hash(password + salt)
 
     def create_salt_and_hashed_password(self, *, plaintext_password: str) -> UserPasswordUpdateSchema:
         salt = self.generate_salt()
@@ -19,4 +49,22 @@ class AuthService:
         return UserPasswordUpdateSchema(password=hashed_password, salt=salt)
 
     def verify_password(self, *, password: str, salt: str, hashed_password: str) -> bool:
-        return pwd_context.verify(password + salt, hashed_password)
+        return get_pwd_context().verify(password + salt, hashed_password)
+
+    async def create_salt_and_hashed_password_async(self, *, plaintext_password: str) -> UserPasswordUpdateSchema:
+        """Same as `create_salt_and_hashed_password`, run in the bcrypt thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(
+            bcrypt_executor,
+            _measured,
+            "hash",
+            lambda: self.create_salt_and_hashed_password(plaintext_password=plaintext_password)
+        )
+
+    async def verify_password_async(self, *, password: str, salt: str, hashed_password: str) -> bool:
+        """Same as `verify_password`, run in the bcrypt thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(
+            bcrypt_executor,
+            _measured,
+            "verify",
+            lambda: self.verify_password(password=password, salt=salt, hashed_password=hashed_password)
+        )
@@ -0,0 +1,335 @@
+import asyncio
+import logging
+import pickle
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from app import config, metrics
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Returned by backends for a missing or expired key, since None is a value that can be cached
+MISSING: Any = object()
+
+
+class LocalCache:
+    """In-process LRU cache whose entries expire after a time to live.
+
+    The least recently used entry is evicted once `max_entries` is reached. Expired entries are
+    dropped when they are read, or evicted as any other entry.
+    """
+
+    def __init__(self, *, max_entries: int = 10_000, ttl: Optional[float] = None) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[Any, Optional[float]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        """Return the value of a key, or `MISSING`."""
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return MISSING
+
+        value, expires_at = entry
+
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return MISSING
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, *, ttl: Optional[float] = None) -> None:
+        """Store a value, for `ttl` seconds or the default time to live of the cache."""
+        ttl = ttl if ttl is not None else self.ttl
+        self._entries[key] = (value, time.monotonic() + ttl if ttl is not None else None)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class CacheBackend(ABC):
+    """Storage of a `CacheService`. Values are any picklable objects, keys are strings."""
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    @abstractmethod
+    async def get(self, key: str) -> Any:
+        """Return the value of a key, or `MISSING`."""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, *, ttl: Optional[float] = None) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        pass
+
+    @abstractmethod
+    async def delete_prefix(self, prefix: str) -> None:
+        pass
+
+    @abstractmethod
+    def reset_local(self) -> None:
+        """Drop the values kept in the memory of this process."""
+
+
+class MemoryBackend(CacheBackend):
+    """Backend keeping values in the memory of the process, for a single worker."""
+
+    def __init__(self, *, max_entries: int = config.CACHE_LOCAL_MAX_ENTRIES) -> None:
+        self.local = LocalCache(max_entries=max_entries)
+
+    async def get(self, key: str) -> Any:
+        return self.local.get(key)
+
+    async def set(self, key: str, value: Any, *, ttl: Optional[float] = None) -> None:
+        self.local.set(key, value, ttl=ttl)
+
+    async def delete(self, *keys: str) -> None:
+        self.local.delete(*keys)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        self.local.delete_prefix(prefix)
+
+    def reset_local(self) -> None:
+        self.local.clear()
+
+
+class RedisBackend(CacheBackend):
+    """Backend shared by all workers through a Redis-protocol server, with a near cache per worker.
+
+    Values are pickled into the server and kept for a short time in a `LocalCache`, so hot keys
+    are served without a round trip. Every write and delete is published on `channel`, and the
+    other workers drop the key from their near cache when they receive it; the short time to live
+    of near entries bounds how stale a worker can be when a message is lost, such as while it
+    reconnects. When the server cannot be reached, reads are misses and writes are skipped, so
+    callers fall back to loading the value themselves.
+
+    `client` is a `redis.asyncio.Redis` compatible client. Only trusted values may be cached, as
+    they are unpickled.
+    """
+
+    def __init__(
+            self,
+            client: Any,
+            *,
+            channel: str = config.CACHE_INVALIDATION_CHANNEL,
+            near_ttl: float = config.CACHE_NEAR_TTL_SECONDS,
+            max_entries: int = config.CACHE_LOCAL_MAX_ENTRIES,
+    ) -> None:
+        self.client = client
+        self.channel = channel
+        self.near = LocalCache(max_entries=max_entries, ttl=near_ttl)
+        # Identifies the messages of this worker, which it does not need to apply
+        self.origin = uuid.uuid4().hex
+        self._listener: Optional[asyncio.Task] = None
+        self._subscribed = asyncio.Event()
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> "RedisBackend":
+        # Only deployments with a shared cache need the client library
+        from redis.asyncio import Redis
+
+        return cls(Redis.from_url(url), **kwargs)
+
+    async def start(self) -> None:
+        """Subscribe to the invalidations of the other workers."""
+        self._listener = asyncio.create_task(self._listen(), name="cache-invalidation")
+        await self._subscribed.wait()
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
+        await self.client.aclose()
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.client.pubsub()
+
+            try:
+                await pubsub.subscribe(self.channel)
+                self._subscribed.set()
+
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+
+                    if message is not None:
+                        self._apply(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Cache invalidation subscription failed")
+                # Invalidations may have been missed until the subscription is back
+                self.near.clear()
+                self._subscribed.set()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def _apply(self, data: bytes | str) -> None:
+        message = data.decode() if isinstance(data, bytes) else data
+        origin, _, key = message.partition(" ")
+
+        if origin == self.origin:
+            return
+
+        if key.endswith("*"):
+            self.near.delete_prefix(key[:-1])
+        else:
+            self.near.delete(key)
+
+    async def _publish(self, key: str) -> None:
+        await self.client.publish(self.channel, f"{self.origin} {key}")
+
+    async def get(self, key: str) -> Any:
+        value = self.near.get(key)
+
+        if value is not MISSING:
+            return value
+
+        try:
+            data = await self.client.get(key)
+        except Exception:
+            logger.warning(f"Cache read of {key} failed", exc_info=True)
+            return MISSING
+
+        if data is None:
+            return MISSING
+
+        value = pickle.loads(data)
+        self.near.set(key, value)
+        return value
+
+    async def set(self, key: str, value: Any, *, ttl: Optional[float] = None) -> None:
+        near_ttl = self.near.ttl if ttl is None or self.near.ttl is None else min(ttl, self.near.ttl)
+        self.near.set(key, value, ttl=near_ttl if near_ttl is not None else ttl)
+
+        try:
+            await self.client.set(key, pickle.dumps(value), px=int(ttl * 1000) if ttl is not None else None)
+            await self._publish(key)
+        except Exception:
+            logger.warning(f"Cache write of {key} failed", exc_info=True)
+
+    async def delete(self, *keys: str) -> None:
+        self.near.delete(*keys)
+
+        try:
+            await self.client.delete(*keys)
+
+            for key in keys:
+                await self._publish(key)
+        except Exception:
+            logger.warning(f"Cache delete of {', '.join(keys)} failed", exc_info=True)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        self.near.delete_prefix(prefix)
+
+        try:
+            keys = [key async for key in self.client.scan_iter(match=f"{prefix}*")]
+
+            if keys:
+                await self.client.delete(*keys)
+
+            await self._publish(f"{prefix}*")
+        except Exception:
+            logger.warning(f"Cache delete of {prefix}* failed", exc_info=True)
+
+    def reset_local(self) -> None:
+        self.near.clear()
+
+
+class CacheNamespace:
+    """The keys of a `CacheService` under one prefix, with a default time to live.
+
+    A repository opts in to caching by taking a namespace, such as
+    ``cache_service.namespace("urgencies", ttl=300)``, and clearing it when it writes.
+    """
+
+    def __init__(self, service: "CacheService", name: str, *, ttl: Optional[float] = None) -> None:
+        self.service = service
+        self.name = name
+        self.ttl = ttl
+        self.prefix = f"{name}:"
+
+    def key(self, key: Any) -> str:
+        return f"{self.prefix}{key}"
+
+    async def get(self, key: Any, default: Any = None) -> Any:
+        value = await self.service.backend.get(self.key(key))
+        metrics.cache_requests.inc(namespace=self.name, result="miss" if value is MISSING else "hit")
+        return default if value is MISSING else value
+
+    async def set(self, key: Any, value: Any, *, ttl: Optional[float] = None) -> None:
+        await self.service.backend.set(self.key(key), value, ttl=ttl if ttl is not None else self.ttl)
+
+    async def delete(self, *keys: Any) -> None:
+        await self.service.backend.delete(*[self.key(key) for key in keys])
+
+    async def clear(self) -> None:
+        await self.service.backend.delete_prefix(self.prefix)
+
+    async def get_or_set(self, key: Any, factory: Callable[[], Awaitable[T]], *, ttl: Optional[float] = None) -> T:
+        """Return the cached value of a key, or cache and return the value `factory` loads."""
+        value = await self.get(key, MISSING)
+
+        if value is MISSING:
+            value = await factory()
+            await self.set(key, value, ttl=ttl)
+
+        return value
+
+
+class CacheService:
+    """Cache shared by the workers of the application, split into namespaces.
+
+    Values are kept in the memory of the worker unless `CACHE_URL` points to a Redis-protocol
+    server, which is then connected to by `start`.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None) -> None:
+        self.backend = backend or MemoryBackend()
+
+    def namespace(self, name: str, *, ttl: Optional[float] = None) -> CacheNamespace:
+        return CacheNamespace(self, name, ttl=ttl)
+
+    async def start(self, *, url: str = config.CACHE_URL) -> None:
+        if url:
+            self.backend = RedisBackend.from_url(url)
+
+        await self.backend.start()
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+    def reset_local(self) -> None:
+        """Drop the values kept in the memory of this worker."""
+        self.backend.reset_local()
@@ -1,6 +1,6 @@
-from fastapi_mail import MessageSchema, MessageType
+import time
 
-from app.config import fm_mail
+from app import config, metrics
 from app.schemas.recipient import RecipientSchema
 
 
@@ -8,6 +8,9 @@ class EmailService:
 
     @staticmethod
     async def send(recipients: list[RecipientSchema]):
+        # fastapi_mail is only imported by the workers that send emails
+        from fastapi_mail import MessageSchema, MessageType
+
         for recipient in recipients:
             message = MessageSchema(
                 subject=recipient.subject,
@@ -15,4 +18,11 @@ class EmailService:
                 template_body=recipient.body.model_dump(),
                 subtype=MessageType.html,
             )
-            await fm_mail.send_message(message, template_name="email_confirm.html")
+            started = time.perf_counter()
+            outcome = "error"
+
+            try:
+                await config.fm_mail.send_message(message, template_name="email_confirm.html")
+                outcome = "success"
+            finally:
+                metrics.email_send_duration.observe(time.perf_counter() - started, outcome=outcome)
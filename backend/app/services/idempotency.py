@@ -0,0 +1,95 @@
+import hashlib
+from typing import Any, Awaitable, Callable, Optional
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+from app.database.repositories.idempotency_keys import IdempotencyKeysRepository
+from app.exceptions import IdempotencyKeyInProgressException, IdempotencyKeyReusedException
+
+# Header set on the responses replayed from a previous request
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+class IdempotencyService:
+    """Service replaying the response of a request to its retries sent with the same `Idempotency-Key`.
+
+    The first request with a key claims it, is handled, and stores its response; the retries get
+    the stored response without being handled again, from the cache when it holds the key.
+    A retry sent while the first request is handled is rejected, as is a key reused for a
+    different request. Only successful responses are stored: a request that fails releases its
+    key, so that it can be retried.
+
+    Attributes:
+        idempotency_repo (IdempotencyKeysRepository): Repository for the keys and their responses.
+    """
+
+    def __init__(self, idempotency_repo: IdempotencyKeysRepository) -> None:
+        self.idempotency_repo = idempotency_repo
+
+    @staticmethod
+    def get_fingerprint(*, method: str, path: str, data: BaseModel) -> bytes:
+        """Return the SHA-256 of the method, path and body of a request."""
+        return hashlib.sha256(f"{method} {path}\n{data.model_dump_json()}".encode()).digest()
+
+    async def run(
+            self,
+            *,
+            user_id: int,
+            key: str,
+            fingerprint: bytes,
+            handler: Callable[[], Awaitable[Any]],
+            schema: type[BaseModel],
+            status_code: int
+    ) -> Response:
+        """Handle a request sent with an idempotency key, or replay the response it got.
+
+        Args:
+            user_id (int): The user sending the request.
+            key (str): The idempotency key.
+            fingerprint (bytes): The fingerprint of the request, from `get_fingerprint`.
+            handler (Callable[[], Awaitable[Any]]): Handles the request, returns its result.
+            schema (type[BaseModel]): The response schema the result is serialized with.
+            status_code (int): The status of a successful response.
+
+        Returns:
+            Response: The JSON response of the request.
+
+        Raises:
+            IdempotencyKeyInProgressException: If the request holding the key is being handled.
+            IdempotencyKeyReusedException: If the key was sent with a different request.
+        """
+        stored: Optional[tuple[bytes, int, bytes]] = await self.idempotency_repo.get_cached(user_id=user_id, key=key)
+
+        if stored is None:
+            row = await self.idempotency_repo.claim(user_id=user_id, key=key, fingerprint=fingerprint)
+
+            if row is not None:
+                if row["status_code"] is None and row["fingerprint"] == fingerprint:
+                    raise IdempotencyKeyInProgressException()
+
+                stored = (row["fingerprint"], row["status_code"], row["body"])
+
+        if stored is not None:
+            if stored[0] != fingerprint:
+                raise IdempotencyKeyReusedException()
+
+            return Response(
+                content=stored[2],
+                status_code=stored[1],
+                media_type="application/json",
+                headers={REPLAYED_HEADER: "true"}
+            )
+
+        try:
+            result = await handler()
+        except BaseException:
+            await self.idempotency_repo.release(user_id=user_id, key=key)
+            raise
+
+        body = orjson.dumps(schema.model_validate(result).model_dump(mode="json"))
+        await self.idempotency_repo.complete(
+            user_id=user_id, key=key, fingerprint=fingerprint, status_code=status_code, body=body
+        )
+        return Response(content=body, status_code=status_code, media_type="application/json")
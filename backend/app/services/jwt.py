@@ -1,7 +1,7 @@
+import functools
 import uuid
 from datetime import datetime, timedelta
-
-import jwt
+from types import ModuleType
 
 from app.config import (
     JWT_ALGORITHM,
@@ -19,23 +19,36 @@ from app.schemas.token import (
 )
 
 
+@functools.cache
+def _pyjwt() -> ModuleType:
+    """Import PyJWT on first use; importing it probes its optional crypto backends."""
+    import jwt
+
+    return jwt
+
+
 class JWTService:
     TYPE_AUTH_TOKEN = "auth"
     TYPE_EMAIL_CONFIRMATION_TOKEN = "email_confirmation"
 
+    @property
+    def errors(self) -> ModuleType:
+        """`jwt.exceptions`, for ``except jwt_service.errors.ExpiredSignatureError`` clauses."""
+        return _pyjwt().exceptions
+
     def create_access_token(self, *, payload: JWTPayloadSchema, minutes: int | None = None) -> str:
         expire_dt = datetime.now() + timedelta(
             minutes=minutes or JWT_ACCESS_TOKEN_EXPIRES_MINUTES
         )
         expire_timestamp = int(expire_dt.timestamp())
         payload: JWTPayloadSchema = payload.model_copy(update={"exp": expire_timestamp})
-        return jwt.encode(payload=payload.model_dump(), key=str(SECRET_KEY), algorithm=str(JWT_ALGORITHM))
+        return _pyjwt().encode(payload=payload.model_dump(), key=str(SECRET_KEY), algorithm=str(JWT_ALGORITHM))
 
     def create_refresh_token(self, *, payload: JWTPayloadSchema) -> str:
         expire_dt = datetime.now() + timedelta(minutes=JWT_REFRESH_TOKEN_EXPIRES_MINUTES)
         expire_timestamp = int(expire_dt.timestamp())
         payload: JWTPayloadSchema = payload.model_copy(update={"exp": expire_timestamp})
-        return jwt.encode(payload=payload.model_dump(), key=str(SECRET_KEY), algorithm=str(JWT_ALGORITHM))
+        return _pyjwt().encode(payload=payload.model_dump(), key=str(SECRET_KEY), algorithm=str(JWT_ALGORITHM))
 
     def create_token_pair(self, *, user: User) -> TokenPairSchema | None:
         if not user:
@@ -75,11 +88,11 @@ class JWTService:
             if payload.type != self.TYPE_EMAIL_CONFIRMATION_TOKEN:
                 return None
             return payload
-        except jwt.exceptions.PyJWTError:
+        except self.errors.PyJWTError:
             return None
 
     def decode_token(self, *, token: str) -> JWTPayloadSchema:
-        payload: dict = jwt.decode(
+        payload: dict = _pyjwt().decode(
             jwt=token,
             key=str(SECRET_KEY),
             algorithms=[str(JWT_ALGORITHM)],
@@ -1,3 +1,5 @@
+from typing import Any
+
 from app.models import Order, User
 
 from app.services.email import EmailService
@@ -24,3 +26,33 @@ class NotificationService:
             new_status=new_status
         )
         await self.email_service.send([recipient])
+
+    async def notify_on_order_status_transitions(self, *, transitions: list[dict[str, Any]]) -> None:
+        """Notify the clients of orders moved by `OrdersRepository.transition_statuses`, in one send.
+
+        Orders whose client has no email are skipped.
+        """
+        recipients = [
+            self.recipient_service.get_notified_on_order_status_transition(
+                order_id=transition["id"],
+                number=transition["number"],
+                client_type=transition["client_type"],
+                client_email=transition["client_email"],
+                old_status=transition["old_status"],
+                new_status=transition["status"]
+            )
+            for transition in transitions
+            if transition["client_email"]
+        ]
+
+        if recipients:
+            await self.email_service.send(recipients)
+
+    async def notify_on_overdue_orders(self, *, emails: list[str], orders: list[dict[str, Any]]) -> None:
+        """Notify operators of the orders claimed by `OrdersRepository.claim_overdue`, one email
+        per operator for the whole batch, in one send."""
+        if emails and orders:
+            await self.email_service.send([
+                self.recipient_service.get_notified_on_overdue_orders(email=email, orders=orders)
+                for email in emails
+            ])
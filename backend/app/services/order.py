@@ -5,13 +5,17 @@ from fastapi import BackgroundTasks
 from app.database.repositories.audit import AuditRepository
 from app.database.repositories.orders import OrdersRepository
 from app.database.repositories.order_services import OrderServicesRepository
-from app.exceptions import NotFoundException
+from app.exceptions import InvalidStatusTransitionException, NotFoundException
 from app.models import Order, LogEntry
 from app.schemas.audit import LogEntryCreateSchema
-from app.schemas.order.admin import AdminOrderCreateSchema, AdminOrderUpdateSchema
+from app.schemas.order.admin import (
+    AdminOrderCreateSchema,
+    AdminOrderStatusTransitionSchema,
+    AdminOrderUpdateSchema
+)
 from app.schemas.order_service import OrderServicesUpdateSchema
 from app.services.notification import NotificationService
-from app.tasks import task_notify_on_order_status_update
+from app.tasks import task_notify_on_order_status_transitions, task_notify_on_order_status_update
 
 
 class OrderService:
@@ -134,6 +138,54 @@ class OrderService:
 
         return updated_order
 
+    async def transition_orders(
+            self,
+            *,
+            data: AdminOrderStatusTransitionSchema,
+            user_id: int,
+            bg_tasks: BackgroundTasks
+    ) -> dict[str, Any]:
+        """Move a batch of orders to a status.
+
+        The orders the status machine allows to move are updated in a single statement, with an
+        audit entry each, written in a batch, and their clients are notified by a single
+        background task. The other orders are left as they are and reported as skipped.
+
+        Args:
+            data (AdminOrderStatusTransitionSchema): The IDs of the orders and the target status.
+            user_id (int): The ID of the user moving the orders.
+            bg_tasks (BackgroundTasks): Background tasks to be executed after the response is sent.
+
+        Returns:
+            dict[str, Any]: The moved orders under "items" and the IDs of the others under
+                "skipped_ids".
+
+        Raises:
+            InvalidStatusTransitionException: If no order can be moved to the status.
+        """
+        if not Order.get_statuses_transitioning_to(data.status.value):
+            raise InvalidStatusTransitionException(target=data.status.value)
+
+        transitions = await self.orders_repo.transition_statuses(order_ids=data.order_ids, status=data.status.value)
+
+        await self.audit_repo.create_many(
+            data=[
+                LogEntryCreateSchema(
+                    user_id=user_id,
+                    action=LogEntry.ACTION_UPDATE,
+                    model_type=Order.get_model_type(),
+                    target_id=transition["id"]
+                )
+                for transition in transitions
+            ]
+        )
+
+        if transitions:
+            bg_tasks.add_task(task_notify_on_order_status_transitions, transitions)
+
+        moved = {transition["id"] for transition in transitions}
+        return {"items": transitions, "skipped_ids": sorted(set(data.order_ids) - moved)}
+
     async def get_order_services(self, *, order_id: int) -> dict[str, Any]:
         """
         Retrieve all services for a specific order, including attached and available services.
@@ -0,0 +1,178 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
+
+from app import config
+from app.services.cache import CacheService
+from app.services.tariff_version import TariffVersionService
+
+if TYPE_CHECKING:
+    from app.database.repositories.tariffs import TariffsRepository
+
+
+class TariffPriceRow(NamedTuple):
+    """A single tariff service price, flattened with the service fields a quote needs."""
+    id: int
+    tariff_id: int
+    version_id: int
+    price: Decimal
+    tax: Decimal
+    tax_amount: Decimal
+    total: Decimal
+    service_id: int
+    service_name: str
+    service_fee_type: str
+    country_id: Optional[int]
+    urgency_id: Optional[int]
+    visa_duration_id: Optional[int]
+    visa_type_id: Optional[int]
+
+
+class TariffPriceTable:
+    """Immutable in-memory price list of one tariff version, bucketed by country.
+
+    Services with no country are kept in the ``None`` bucket and apply to every country.
+    """
+
+    def __init__(self, rows: list[TariffPriceRow], version_id: Optional[int]) -> None:
+        self.version_id = version_id
+        buckets: dict[Optional[int], list[TariffPriceRow]] = defaultdict(list)
+
+        for row in rows:
+            buckets[row.country_id].append(row)
+
+        self.buckets: dict[Optional[int], tuple[TariffPriceRow, ...]] = {
+            country_id: tuple(bucket) for country_id, bucket in buckets.items()
+        }
+
+    def match(
+            self,
+            *,
+            country_id: Optional[int],
+            urgency_id: Optional[int],
+            visa_duration_id: Optional[int],
+            visa_type_id: Optional[int],
+    ) -> list[TariffPriceRow]:
+        """Return rows applicable to the given order criteria, ordered by service name.
+
+        Mirrors the filtering of `OrderServicesRepository.get_for_order`: a service applies when
+        each of its criteria is either unset or equal to the requested value.
+        """
+        candidates = self.buckets.get(None, ())
+
+        if country_id is not None:
+            candidates = self.buckets.get(country_id, ()) + candidates
+
+        # Compared against the trailing urgency_id, visa_duration_id and visa_type_id fields
+        criteria = ((None, urgency_id), (None, visa_duration_id), (None, visa_type_id))
+        rows = [
+            row for row in candidates
+            if all(value in allowed for value, allowed in zip(row[-3:], criteria))
+        ]
+        rows.sort(key=lambda row: row.service_name)
+        return rows
+
+
+class PriceQuoteService:
+    """Tariff price cache answering "how much would this cost" without a DB round trip.
+
+    Price tables are loaded per tariff (all of them at startup, or lazily on first use) into a
+    namespace of the cache service, so that every worker sees the same tables and is told when
+    one is dropped. A table is reloaded once its tariff has another active version, and dropped
+    through `invalidate` when the services themselves change.
+    """
+
+    def __init__(self, tariff_version_service: TariffVersionService, cache_service: CacheService) -> None:
+        self.tariff_version_service = tariff_version_service
+        self.cache = cache_service.namespace("price_tables", ttl=config.CACHE_REFERENCE_TTL_SECONDS)
+        self._generation = 0
+
+    async def warm_up(self, *, tariffs_repo: "TariffsRepository") -> None:
+        """Load the price tables of the active versions of all tariffs in a single query."""
+        generation = self._generation
+        rows = await tariffs_repo.get_price_rows()
+        grouped: dict[int, list[TariffPriceRow]] = defaultdict(list)
+
+        for row in rows:
+            grouped[row.tariff_id].append(TariffPriceRow(*row))
+
+        if generation == self._generation:
+            for tariff_id, items in grouped.items():
+                await self.cache.set(tariff_id, TariffPriceTable(items, version_id=items[0].version_id))
+
+    async def get_table(self, *, tariffs_repo: "TariffsRepository", tariff_id: int) -> TariffPriceTable:
+        """Return the price table of the active version of a tariff, loading it on a cache miss."""
+        version_id = await self.tariff_version_service.get_active_version_id(
+            tariffs_repo=tariffs_repo,
+            tariff_id=tariff_id
+        )
+        table = await self.cache.get(tariff_id)
+
+        if table is None or table.version_id != version_id:
+            generation = self._generation
+            rows = await tariffs_repo.get_price_rows(version_id=version_id) if version_id is not None else []
+            table = TariffPriceTable([TariffPriceRow(*row) for row in rows], version_id=version_id)
+
+            # Do not keep a table that was invalidated while it was being loaded
+            if generation == self._generation:
+                await self.cache.set(tariff_id, table)
+
+        return table
+
+    async def invalidate(self, *, tariff_id: Optional[int] = None) -> None:
+        """Drop the cached price table of a tariff, or of all tariffs if no id is given, in every worker."""
+        self._generation += 1
+
+        if tariff_id is None:
+            await self.cache.clear()
+        else:
+            await self.cache.delete(tariff_id)
+
+    async def quote(
+            self,
+            *,
+            tariffs_repo: "TariffsRepository",
+            tariff_id: int,
+            country_id: Optional[int] = None,
+            urgency_id: Optional[int] = None,
+            visa_duration_id: Optional[int] = None,
+            visa_type_id: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """Compute the applicable services and totals for the given tariff and order criteria.
+
+        Args:
+            tariffs_repo (TariffsRepository): Used only to load the price table on a cache miss.
+            tariff_id (int): The tariff to price with.
+            country_id (Optional[int]): The order country.
+            urgency_id (Optional[int]): The order urgency.
+            visa_duration_id (Optional[int]): The order visa duration.
+            visa_type_id (Optional[int]): The order visa type.
+
+        Returns:
+            dict[str, Any]: The applicable services and the price, tax amount and total sums.
+        """
+        table = await self.get_table(tariffs_repo=tariffs_repo, tariff_id=tariff_id)
+        rows = table.match(
+            country_id=country_id,
+            urgency_id=urgency_id,
+            visa_duration_id=visa_duration_id,
+            visa_type_id=visa_type_id,
+        )
+        services = [
+            {
+                "id": row.id,
+                "service": {"id": row.service_id, "name": row.service_name, "fee_type": row.service_fee_type},
+                "price": row.price,
+                "tax": row.tax,
+                "tax_amount": row.tax_amount,
+                "total": row.total,
+            }
+            for row in rows
+        ]
+        return {
+            "tariff_id": tariff_id,
+            "services": services,
+            "price": sum((row.price for row in rows), Decimal(0)),
+            "tax_amount": sum((row.tax_amount for row in rows), Decimal(0)),
+            "total": sum((row.total for row in rows), Decimal(0)),
+        }
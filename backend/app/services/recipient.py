@@ -1,3 +1,4 @@
+from typing import Any
 from urllib.parse import urljoin
 
 from app.config import BACKEND_URL, JWT_EMAIL_CONFIRMATION_TOKEN_EXPIRES_DAYS
@@ -32,19 +33,58 @@ class RecipientService:
             new_status: str
     ) -> RecipientSchema:
         client = await order.awaitable_attrs.client
-        subject = f"Order #{order.number} status updated"
-        user_role: str = "manager" if client.type == Client.TYPE_LEGAL else "individual"
+        return self.get_notified_on_order_status_transition(
+            order_id=order.id,
+            number=order.number,
+            client_type=client.type,
+            client_email=client.email,
+            old_status=old_status,
+            new_status=new_status
+        )
+
+    def get_notified_on_order_status_transition(
+            self,
+            *,
+            order_id: int,
+            number: str,
+            client_type: str,
+            client_email: str,
+            old_status: str,
+            new_status: str
+    ) -> RecipientSchema:
+        """Same as `get_notified_on_order_status_update`, from the values of an order rather than
+        the order, such as the rows of `OrdersRepository.transition_statuses`."""
+        subject = f"Order #{number} status updated"
+        user_role: str = "manager" if client_type == Client.TYPE_LEGAL else "individual"
         old_status: str = dict(Order.STATUS_CHOICES).get(old_status)
         new_status: str = dict(Order.STATUS_CHOICES).get(new_status)
-        message: str = f"Order #{order.number} status updated: from {old_status} to {new_status}"
+        message: str = f"Order #{number} status updated: from {old_status} to {new_status}"
 
         return RecipientSchema(
-            email=client.email,
+            email=client_email,
             subject=subject,
             body=RecipientBodySchema(
                 title=subject,
                 message=message,
-                btn_url=urljoin(BACKEND_URL, f"{user_role}/orders/{order.id}"),
+                btn_url=urljoin(BACKEND_URL, f"{user_role}/orders/{order_id}"),
                 btn_txt="Go to order"
             ),
         )
+
+    def get_notified_on_overdue_orders(self, *, email: str, orders: list[dict[str, Any]]) -> RecipientSchema:
+        """Notify an operator of a batch of orders claimed by `OrdersRepository.claim_overdue`."""
+        subject = f"{len(orders)} orders overdue" if len(orders) > 1 else f"Order #{orders[0]['number']} overdue"
+        overdue = ", ".join(
+            f"#{order['number']} (due {order['due_at']:%Y-%m-%d %H:%M})" for order in orders
+        )
+
+        return RecipientSchema(
+            email=email,
+            subject=subject,
+            body=RecipientBodySchema(
+                title=subject,
+                message=f"Orders past their due time: {overdue}",
+                btn_url=urljoin(BACKEND_URL, "admin/orders"),
+                btn_txt="Go to orders"
+            ),
+        )
@@ -0,0 +1,44 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Scheduler:
+    """Runs periodic background jobs for the lifetime of the application.
+
+    Every job runs once right after `start` and then every `interval` seconds. A failing run is
+    logged and does not stop the job.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, tuple[Callable[[], Awaitable[None]], float]] = {}
+        self._tasks: list[asyncio.Task] = []
+
+    def add_job(self, job: Callable[[], Awaitable[None]], *, interval: float, name: Optional[str] = None) -> None:
+        """Register a job, replacing a job registered under the same name."""
+        self._jobs[name or job.__name__] = (job, interval)
+
+    def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._run(name, job, interval), name=name)
+            for name, (job, interval) in self._jobs.items()
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    @staticmethod
+    async def _run(name: str, job: Callable[[], Awaitable[None]], interval: float) -> None:
+        while True:
+            try:
+                await job()
+            except Exception:
+                logger.exception(f"Job {name} failed")
+
+            await asyncio.sleep(interval)
@@ -0,0 +1,42 @@
+import time
+from typing import TYPE_CHECKING, Optional
+
+from app import config
+
+if TYPE_CHECKING:
+    from app.database.repositories.tariffs import TariffsRepository
+
+
+class TariffVersionService:
+    """Cached lookup of the active price list version of each tariff.
+
+    Versions are immutable, so a cached id is never wrong, only possibly stale: another worker that
+    activated a newer version is picked up once the entry expires. The worker that activates a
+    version updates its own cache right away through `set_active`.
+    """
+
+    def __init__(self, ttl: float = config.TARIFF_VERSION_CACHE_TTL_SECONDS) -> None:
+        self.ttl = ttl
+        self._active: dict[int, tuple[Optional[int], float]] = {}
+
+    async def get_active_version_id(self, *, tariffs_repo: "TariffsRepository", tariff_id: int) -> Optional[int]:
+        """Return the active version id of a tariff, loading it on a cache miss or expiry."""
+        cached = self._active.get(tariff_id)
+
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        version_id = await tariffs_repo.get_active_version_id(tariff_id=tariff_id)
+        self.set_active(tariff_id=tariff_id, version_id=version_id)
+        return version_id
+
+    def set_active(self, *, tariff_id: int, version_id: Optional[int]) -> None:
+        """Record the active version of a tariff."""
+        self._active[tariff_id] = (version_id, time.monotonic() + self.ttl)
+
+    def invalidate(self, *, tariff_id: Optional[int] = None) -> None:
+        """Forget the active version of a tariff, or of all tariffs if no id is given."""
+        if tariff_id is None:
+            self._active = {}
+        else:
+            self._active.pop(tariff_id, None)
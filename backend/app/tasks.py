@@ -1,3 +1,5 @@
+from typing import Any
+
 from app.models import Order, User
 from app.services import notification_service
 
@@ -8,3 +10,7 @@ async def task_notify_on_email_confirm(user: User):
 
 async def task_notify_on_order_status_update(order: Order, old_status: str, new_status: str):
     await notification_service.notify_on_order_status_update(order=order, old_status=old_status, new_status=new_status)
+
+
+async def task_notify_on_order_status_transitions(transitions: list[dict[str, Any]]):
+    await notification_service.notify_on_order_status_transitions(transitions=transitions)
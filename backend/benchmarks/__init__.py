@@ -0,0 +1,29 @@
+"""Load benchmarks of the API hot paths.
+
+The suite seeds a dedicated ``<DATABASE_URL>_bench`` database with a realistic data set, drives the
+ASGI application in-process through httpx and reports latency percentiles and throughput per
+scenario. It is not collected by pytest; run it from the backend directory:
+
+    python -m benchmarks                                  # seed (if needed) and run all scenarios
+    python -m benchmarks --save-baseline baseline.json    # record the current numbers
+    python -m benchmarks --baseline baseline.json         # exit with status 1 on a regression
+
+See ``python -m benchmarks --help`` for the data set size, request count and concurrency options.
+
+With ``--url`` the requests go over HTTP to a running server instead, which measures the server
+setup as well. To compare the production profile with the development one, seed the database
+(the first in-process run does it), then run the same benchmark against each server started on
+the benchmark database:
+
+    POSTGRES_DB=visa_bench uvicorn app.api.server:app --reload --loop asyncio --http h11 --port 8001
+    python -m benchmarks --url http://127.0.0.1:8001 --concurrency 50 --save-baseline dev.json
+    POSTGRES_DB=visa_bench python -m app.serve --port 8002
+    python -m benchmarks --url http://127.0.0.1:8002 --concurrency 50 --baseline dev.json
+
+``app.serve`` runs one worker per core with uvloop and httptools, so its gain grows with the
+number of cores; on a single core it comes from uvloop and httptools alone.
+
+The revenue report is benchmarked separately, over a database grown to 10M order services:
+
+    python -m benchmarks.revenue
+"""
@@ -0,0 +1,133 @@
+import argparse
+import asyncio
+import json
+import random
+import sys
+from pathlib import Path
+from typing import AsyncGenerator
+
+from httpx import ASGITransport, AsyncClient, Limits
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api.server import get_application
+from app.config import DATABASE_URL
+from app.database.db import ReadOnlySession, get_replica_session, get_session
+from app.database.instrumentation import instrument_engine
+from benchmarks import seed as seeding
+from benchmarks.report import compare, format_table, save_baseline
+from benchmarks.scenarios import SCENARIOS, Context, authenticate, run_scenario
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the API hot paths.")
+    parser.add_argument("--db-url", default=f"{DATABASE_URL}_bench", help="database to seed and benchmark against")
+    parser.add_argument("--orders", type=int, default=seeding.SeedOptions.orders)
+    parser.add_argument("--clients", type=int, default=seeding.SeedOptions.clients)
+    parser.add_argument("--tariffs", type=int, default=seeding.SeedOptions.tariffs)
+    parser.add_argument("--services", type=int, default=seeding.SeedOptions.services)
+    parser.add_argument(
+        "--url",
+        help="benchmark a running server at this base URL instead of the application in-process; "
+             "the server must use the benchmark database"
+    )
+    parser.add_argument("--reseed", action="store_true", help="recreate the database even if it is already seeded")
+    parser.add_argument("--requests", type=int, default=500, help="requests per scenario, scaled by its weight")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=10, help="untimed requests sent before each scenario")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="run only this scenario (repeatable)"
+    )
+    parser.add_argument("--baseline", type=Path, help="baseline JSON to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p95/rps deviation from the baseline")
+    parser.add_argument("--save-baseline", type=Path, help="write the results as a baseline JSON")
+    parser.add_argument("--seed", type=int, default=seeding.SeedOptions.seed, help="random seed of data and requests")
+    return parser.parse_args(argv)
+
+
+async def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    options = seeding.SeedOptions(
+        orders=args.orders,
+        clients=args.clients,
+        tariffs=args.tariffs,
+        services=args.services,
+        seed=args.seed,
+    )
+    engine = create_async_engine(args.db_url, pool_size=args.concurrency, max_overflow=0)
+    instrument_engine(engine)
+
+    data = None if args.reseed else await seeding.load(engine, options)
+
+    if data is None:
+        print(f"Seeding {args.db_url} with {options}")
+        await engine.dispose()
+        await seeding.create_database(args.db_url)
+        data = await seeding.seed(engine, options)
+
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    # Same transaction handling as app.database.db.get_session, against the benchmark database
+    async def get_bench_session() -> AsyncGenerator:
+        async with session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    replica_session_factory = async_sessionmaker(
+        bind=engine, class_=AsyncSession, sync_session_class=ReadOnlySession, expire_on_commit=False
+    )
+
+    # Reads routed to the replica go to the benchmark database as well
+    async def get_bench_replica_session() -> AsyncGenerator:
+        async with replica_session_factory() as session:
+            yield session
+
+    app = get_application()
+    app.dependency_overrides[get_session] = get_bench_session
+    app.dependency_overrides[get_replica_session] = get_bench_replica_session
+    scenarios = [scenario for scenario in SCENARIOS if not args.scenario or scenario.name in args.scenario]
+    results = []
+
+    if args.url:
+        client = AsyncClient(base_url=args.url, timeout=60, limits=Limits(max_connections=args.concurrency))
+    else:
+        client = AsyncClient(transport=ASGITransport(app=app, raise_app_exceptions=False), base_url="http://bench")
+
+    async with client:
+        ctx = Context(app=app, client=client, data=data, rng=random.Random(args.seed))
+        await authenticate(ctx)
+
+        for scenario in scenarios:
+            requests = max(1, int(args.requests * scenario.weight))
+            results.append(await run_scenario(ctx, scenario, requests, args.concurrency, args.warmup))
+            print(format_table(results[-1:]).splitlines()[-1], flush=True)
+
+    await engine.dispose()
+    print()
+    print(format_table(results))
+
+    if args.save_baseline:
+        meta = {"orders": args.orders, "requests": args.requests, "concurrency": args.concurrency}
+        save_baseline(args.save_baseline, results, meta=meta)
+        print(f"\nBaseline written to {args.save_baseline}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), tolerance=args.tolerance)
+
+        if regressions:
+            print("\nRegressions:\n" + "\n".join(f"  {message}" for message in regressions))
+            return 1
+
+        print(f"\nNo regression against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(sys.argv[1:])))
@@ -0,0 +1,95 @@
+import json
+import statistics
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class ScenarioResult:
+    """Latencies (in seconds) of the measured requests of one scenario."""
+    name: str
+    duration: float
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def rps(self) -> float:
+        return self.requests / self.duration if self.duration else 0.0
+
+    def percentile(self, value: int) -> float:
+        """Return the given latency percentile in milliseconds."""
+        if not self.latencies:
+            return 0.0
+
+        if len(self.latencies) == 1:
+            return self.latencies[0] * 1000
+
+        return statistics.quantiles(self.latencies, n=100, method="inclusive")[value - 1] * 1000
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rps": round(self.rps, 2),
+            "p50_ms": round(self.percentile(50), 2),
+            "p95_ms": round(self.percentile(95), 2),
+            "p99_ms": round(self.percentile(99), 2),
+        }
+
+
+def format_table(results: list[ScenarioResult]) -> str:
+    """Render the results as a plain text table."""
+    header = f"{'scenario':<24}{'requests':>10}{'errors':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    lines = [header, "-" * len(header)]
+
+    for result in results:
+        row = result.to_dict()
+        lines.append(
+            f"{result.name:<24}{row['requests']:>10}{row['errors']:>8}{row['rps']:>10.1f}"
+            f"{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}{row['p99_ms']:>10.2f}"
+        )
+
+    return "\n".join(lines)
+
+
+def save_baseline(path: Path, results: list[ScenarioResult], meta: dict[str, Any]) -> None:
+    """Write the results, with the options they were measured with, as a JSON baseline."""
+    data = {"meta": meta, "scenarios": {result.name: result.to_dict() for result in results}}
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+
+def compare(results: list[ScenarioResult], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Compare the results with a baseline written by `save_baseline`.
+
+    A scenario regresses when its p95 latency grows, or its throughput drops, by more than
+    `tolerance` (a fraction), or when it has errors the baseline did not have. Scenarios missing
+    from the baseline are not compared.
+
+    Returns:
+        list[str]: One message per regression; empty when there is none.
+    """
+    regressions = []
+
+    for result in results:
+        expected = baseline.get("scenarios", {}).get(result.name)
+
+        if expected is None:
+            continue
+
+        current = result.to_dict()
+
+        if current["p95_ms"] > expected["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{result.name}: p95 {current['p95_ms']:.2f} ms, baseline {expected['p95_ms']:.2f} ms")
+
+        if current["rps"] < expected["rps"] * (1 - tolerance):
+            regressions.append(f"{result.name}: {current['rps']:.1f} rps, baseline {expected['rps']:.1f} rps")
+
+        if current["errors"] > expected["errors"]:
+            regressions.append(f"{result.name}: {current['errors']} errors, baseline {expected['errors']}")
+
+    return regressions
@@ -0,0 +1,179 @@
+"""Benchmark of the revenue report over a large order services table.
+
+The report runs against a dedicated ``<DATABASE_URL>_revenue_bench`` database, seeded as the API
+benchmark database and then grown in SQL to the requested number of order services, 10M by
+default, spread over orders of the last two years. Growing the database takes a few minutes and
+is done once; run it from the backend directory:
+
+    python -m benchmarks.revenue                  # seed and grow (if needed), then measure
+    python -m benchmarks.revenue --rows 1000000   # a smaller table
+
+The report over the last 12 months, by month and fee type, is measured:
+
+- cold: nothing is cached, every month is computed;
+- warm: the closed months are cached, only the current month is computed;
+- export: the warm report, encoded as CSV.
+
+The copied orders are inserted with the triggers of `orders` disabled, so the search, status
+history and statistics tables of this database only cover the seeded orders.
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api.routes.admin.reports import iter_csv
+from app.config import DATABASE_URL
+from app.database.instrumentation import instrument_engine
+from app.database.repositories.revenue import RevenueRepository
+from app.models import Order, OrderService, Service
+from app.schemas.revenue import RevenueDimensionEnum, RevenueFilterSchema, RevenueRowSchema
+from app.schemas.serializers import get_serializer
+from benchmarks import seed as seeding
+from benchmarks.report import ScenarioResult, format_table
+
+# Services attached to each copied order
+SERVICES_PER_ORDER = 2
+# Orders copied per transaction
+GROW_BATCH_SIZE = 500_000
+
+# Copies of the seeded orders, created over the last two years
+COPY_ORDERS = text("""
+    INSERT INTO orders (status, client_id, country_id, created_by_id, urgency_id, visa_duration_id, visa_type_id,
+                        created_at)
+    SELECT o.status, o.client_id, o.country_id, o.created_by_id, o.urgency_id, o.visa_duration_id, o.visa_type_id,
+           localtimestamp - random() * interval '730 days'
+    FROM generate_series(1, :count) AS g(n)
+    JOIN orders o ON o.id = 1 + g.n % :seeded
+""")
+
+# Services of the copied orders, priced by the active version of the tariff of their client
+ADD_ORDER_SERVICES = text("""
+    INSERT INTO order_services (order_id, service_id, price, tax, tax_amount, total)
+    SELECT o.id, ts.service_id, ts.price, ts.tax, ts.tax_amount, ts.total
+    FROM orders o
+    JOIN clients c ON c.id = o.client_id
+    JOIN tariffs t ON t.id = c.tariff_id
+    CROSS JOIN generate_series(0, :per_order - 1) AS k(n)
+    JOIN tariff_services ts ON ts.version_id = t.active_version_id
+        AND ts.service_id = (CAST(:service_ids AS integer[]))[1 + (o.id + k.n * 7) % :services]
+    WHERE o.id > :after
+""")
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.revenue", description="Benchmark the revenue report.")
+    parser.add_argument(
+        "--db-url", default=f"{DATABASE_URL}_revenue_bench", help="database to seed and benchmark against"
+    )
+    parser.add_argument("--rows", type=int, default=10_000_000, help="order services of the grown database")
+    parser.add_argument("--runs", type=int, default=5, help="measured reports per case")
+    parser.add_argument("--reseed", action="store_true", help="recreate the database even if it is already seeded")
+    return parser.parse_args(argv)
+
+
+async def is_seeded(engine: AsyncEngine, options: seeding.SeedOptions) -> bool:
+    """Tell whether the database holds the seeded orders, which are the ones with a number."""
+    try:
+        async with engine.connect() as conn:
+            return await conn.scalar(
+                select(func.count()).select_from(Order).where(Order.number.is_not(None))
+            ) == options.orders
+    except Exception:
+        return False
+
+
+async def grow(engine: AsyncEngine, options: seeding.SeedOptions, rows: int) -> None:
+    """Copy the seeded orders, with services, until `order_services` has about `rows` rows."""
+    async with engine.connect() as conn:
+        service_ids = list((await conn.execute(
+            select(Service.id)
+            .where(Service.country_id.is_(None), Service.urgency_id.is_(None), Service.visa_type_id.is_(None))
+            .order_by(Service.id)
+        )).scalars())
+        current = await conn.scalar(select(func.count()).select_from(OrderService))
+
+    while current < rows:
+        count = min(GROW_BATCH_SIZE, (rows - current) // SERVICES_PER_ORDER or 1)
+        started = time.perf_counter()
+
+        async with engine.begin() as conn:
+            after = await conn.scalar(select(func.max(Order.id)))
+            await conn.execute(text("ALTER TABLE orders DISABLE TRIGGER USER"))
+            await conn.execute(COPY_ORDERS, {"count": count, "seeded": options.orders})
+            await conn.execute(text("ALTER TABLE orders ENABLE TRIGGER USER"))
+            await conn.execute(ADD_ORDER_SERVICES, {
+                "per_order": SERVICES_PER_ORDER,
+                "service_ids": service_ids,
+                "services": len(service_ids),
+                "after": after,
+            })
+
+        current += count * SERVICES_PER_ORDER
+        print(f"  {current:>12,} order services ({time.perf_counter() - started:.1f} s)", flush=True)
+
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE orders, order_services"))
+
+
+async def measure(name: str, runs: int, report) -> ScenarioResult:
+    result = ScenarioResult(name=name, duration=0.0)
+    started = time.perf_counter()
+
+    for _ in range(runs):
+        run_started = time.perf_counter()
+        await report()
+        result.latencies.append(time.perf_counter() - run_started)
+
+    result.duration = time.perf_counter() - started
+    return result
+
+
+async def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    options = seeding.SeedOptions()
+    engine = create_async_engine(args.db_url)
+    instrument_engine(engine)
+
+    if args.reseed or not await is_seeded(engine, options):
+        print(f"Seeding {args.db_url} with {options}")
+        await engine.dispose()
+        await seeding.create_database(args.db_url)
+        await seeding.seed(engine, options)
+
+    print(f"Growing order_services to {args.rows:,} rows")
+    await grow(engine, options, args.rows)
+
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    query_filters = RevenueFilterSchema(group_by=[RevenueDimensionEnum.MONTH, RevenueDimensionEnum.FEE_TYPE])
+    columns = ["month", "fee_type", "services", "revenue", "tax", "total"]
+
+    async def report() -> dict:
+        async with session_factory() as session:
+            return await RevenueRepository(session).get_revenue(query_filters=query_filters)
+
+    async def cold_report() -> None:
+        await RevenueRepository.cache.clear()
+        await report()
+
+    async def export() -> None:
+        rows = get_serializer(RevenueRowSchema).many((await report())["items"])
+        async for _ in iter_csv(columns, rows):
+            pass
+
+    results = [await measure("revenue-cold", args.runs, cold_report)]
+    await report()
+    results.append(await measure("revenue-warm", args.runs, report))
+    results.append(await measure("revenue-export", args.runs, export))
+
+    await engine.dispose()
+    print()
+    print(format_table(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(sys.argv[1:])))
@@ -0,0 +1,195 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import FastAPI
+from httpx import AsyncClient, Response, TransportError
+
+from benchmarks.report import ScenarioResult
+from benchmarks.seed import ADMIN_EMAIL, ADMIN_PASSWORD, SeedResult
+from app.models import Order
+
+
+@dataclass
+class Context:
+    """State shared by the scenarios of one run."""
+    app: FastAPI
+    client: AsyncClient
+    data: SeedResult
+    rng: random.Random
+    headers: dict[str, str] = field(default_factory=dict)
+    # Tariff service ids available to the orders of the order-services-update scenario
+    available: dict[int, list[int]] = field(default_factory=dict)
+
+
+RequestFactory = Callable[[Context], Awaitable[Response]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One benchmarked endpoint.
+
+    Attributes:
+        name (str): The name the scenario is reported and compared under.
+        request (RequestFactory): Sends one request and returns its response.
+        weight (float): Share of the requested request count this scenario runs, so that slow
+            endpoints such as the bcrypt bound login do not dominate the run time.
+        prepare (Optional[Callable]): Untimed setup run once before the scenario.
+    """
+    name: str
+    request: RequestFactory
+    weight: float = 1.0
+    prepare: Optional[Callable[[Context], Awaitable[None]]] = None
+
+
+async def authenticate(ctx: Context) -> None:
+    """Log in as the seeded admin and keep the token for the other scenarios."""
+    response = await login(ctx)
+    response.raise_for_status()
+    ctx.headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+
+async def login(ctx: Context) -> Response:
+    return await ctx.client.post(
+        url=ctx.app.url_path_for("auth:login"),
+        data={"username": ADMIN_EMAIL, "password": ADMIN_PASSWORD}
+    )
+
+
+async def order_list(ctx: Context) -> Response:
+    rng = ctx.rng
+    params: dict[str, Any] = {"page": rng.randint(1, 5), "size": 25}
+    # Unfiltered, then by status, country and client, the filters the admin list is used with
+    filters = rng.choice(("none", "status", "country", "client"))
+
+    if filters == "status":
+        params["status"] = rng.choice((Order.STATUS_NEW, Order.STATUS_IN_PROGRESS))
+    elif filters == "country":
+        params["country_id"] = rng.choice(ctx.data.country_ids)
+    elif filters == "client":
+        params["client_id"] = rng.choice(ctx.data.client_ids)
+        params["page"] = 1
+
+    return await ctx.client.get(url=ctx.app.url_path_for("admin:order-list"), params=params, headers=ctx.headers)
+
+
+async def order_search(ctx: Context) -> Response:
+    rng = ctx.rng
+    order_id = rng.choice(ctx.data.order_ids)
+    # What operators type in the search box: a number fragment, an applicant email or a client name
+    q = rng.choice((
+        f"{order_id:04d}",
+        f"applicant-{order_id}@",
+        f"Client {rng.randrange(len(ctx.data.client_ids)):05d}",
+    ))
+    return await ctx.client.get(
+        url=ctx.app.url_path_for("admin:order-list"), params={"q": q, "size": 25}, headers=ctx.headers
+    )
+
+
+async def order_detail(ctx: Context) -> Response:
+    order_id = ctx.rng.choice(ctx.data.order_ids)
+    return await ctx.client.get(
+        url=ctx.app.url_path_for("admin:order-detail", order_id=str(order_id)),
+        headers=ctx.headers
+    )
+
+
+async def order_services_list(ctx: Context) -> Response:
+    order_id = ctx.rng.choice(ctx.data.order_ids)
+    return await ctx.client.get(
+        url=ctx.app.url_path_for("admin:order-services-list", order_id=str(order_id)),
+        headers=ctx.headers
+    )
+
+
+async def prepare_order_services_update(ctx: Context) -> None:
+    for order_id in ctx.rng.sample(ctx.data.order_ids, 50):
+        response = await ctx.client.get(
+            url=ctx.app.url_path_for("admin:order-services-list", order_id=str(order_id)),
+            headers=ctx.headers
+        )
+        response.raise_for_status()
+        ctx.available[order_id] = [item["id"] for item in response.json()["available"]]
+
+
+async def order_services_update(ctx: Context) -> Response:
+    order_id, available = ctx.rng.choice(list(ctx.available.items()))
+    return await ctx.client.put(
+        url=ctx.app.url_path_for("admin:order-services-update", order_id=str(order_id)),
+        json={"tariff_services_ids": ctx.rng.sample(available, min(len(available), 3))},
+        headers=ctx.headers
+    )
+
+
+async def reference_countries(ctx: Context) -> Response:
+    return await ctx.client.get(
+        url=ctx.app.url_path_for("reference:country-list"),
+        params={"available_for_order": True},
+        headers=ctx.headers
+    )
+
+
+async def reference_country_visa_types(ctx: Context) -> Response:
+    country_id = ctx.rng.choice(ctx.data.country_ids)
+    return await ctx.client.get(
+        url=ctx.app.url_path_for("reference:country-visa-type-list", country_id=str(country_id)),
+        headers=ctx.headers
+    )
+
+
+async def reference_urgencies(ctx: Context) -> Response:
+    return await ctx.client.get(url=ctx.app.url_path_for("reference:urgency-list"), headers=ctx.headers)
+
+
+SCENARIOS: tuple[Scenario, ...] = (
+    Scenario(name="login", request=login, weight=0.1),
+    Scenario(name="order-list", request=order_list),
+    Scenario(name="order-search", request=order_search),
+    Scenario(name="order-detail", request=order_detail),
+    Scenario(name="order-services-list", request=order_services_list),
+    Scenario(name="order-services-update", request=order_services_update, prepare=prepare_order_services_update),
+    Scenario(name="reference-countries", request=reference_countries),
+    Scenario(name="reference-visa-types", request=reference_country_visa_types),
+    Scenario(name="reference-urgencies", request=reference_urgencies),
+)
+
+
+async def run_scenario(ctx: Context, scenario: Scenario, requests: int, concurrency: int, warmup: int) -> ScenarioResult:
+    """Send `requests` requests of a scenario from `concurrency` concurrent workers.
+
+    The first `warmup` requests are sent before the clock starts and are not reported.
+    Responses with a status code of 400 or above, and requests that fail to get a response, are
+    counted as errors.
+    """
+    if scenario.prepare is not None:
+        await scenario.prepare(ctx)
+
+    for _ in range(warmup):
+        await scenario.request(ctx)
+
+    result = ScenarioResult(name=scenario.name, duration=0.0)
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+
+            try:
+                response = await scenario.request(ctx)
+            except TransportError:
+                # A connection closed or refused by a server under test
+                result.errors += 1
+                continue
+
+            result.latencies.append(time.perf_counter() - started)
+
+            if response.status_code >= 400:
+                result.errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.duration = time.perf_counter() - started
+    return result
@@ -0,0 +1,302 @@
+import json
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import Integer, String, Table, cast, func, insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+
+from app.models import (
+    Applicant,
+    Client,
+    Country,
+    CountryVisa,
+    Order,
+    OrderSearch,
+    OrderService,
+    Service,
+    Tariff,
+    TariffService,
+    TariffVersion,
+    Urgency,
+    User,
+    VisaDuration,
+    VisaType,
+)
+from app.models.base import Base
+from app.models.m2m_country_visa_duration import country_visa_duration
+from app.services import auth_service
+
+COUNTRIES_FIXTURE = Path(__file__).resolve().parent.parent / "fixtures" / "countries.json"
+
+ADMIN_EMAIL = "bench-admin@example.com"
+ADMIN_PASSWORD = "bench-password"
+
+# Rows sent per INSERT statement
+CHUNK_SIZE = 5000
+
+# Names and processing windows in hours
+URGENCIES = (("Standard", 240), ("Express", 72), ("Urgent", 24))
+VISA_TYPES = ("Tourist", "Business", "Private", "Transit")
+VISA_DURATIONS = (
+    (VisaDuration.TERM_1, VisaDuration.SINGLE_ENTRY),
+    (VisaDuration.TERM_3, VisaDuration.DOUBLE_ENTRY),
+    (VisaDuration.TERM_6, VisaDuration.MULTIPLE_ENTRY),
+    (VisaDuration.TERM_12, VisaDuration.MULTIPLE_ENTRY),
+    (VisaDuration.TERM_60, VisaDuration.MULTIPLE_ENTRY),
+)
+ORDER_STATUSES = (
+    Order.STATUS_DRAFT,
+    Order.STATUS_NEW,
+    Order.STATUS_IN_PROGRESS,
+    Order.STATUS_COMPLETED,
+    Order.STATUS_CANCELED,
+)
+
+
+@dataclass(frozen=True)
+class SeedOptions:
+    """Size of the seeded data set. The same options and seed always produce the same data."""
+    orders: int = 20000
+    clients: int = 500
+    tariffs: int = 5
+    services: int = 200
+    seed: int = 42
+
+
+@dataclass
+class SeedResult:
+    """Ids the scenarios pick their request parameters from."""
+    order_ids: list[int]
+    client_ids: list[int]
+    country_ids: list[int]
+    urgency_ids: list[int]
+    visa_type_ids: list[int]
+
+
+async def create_database(db_url: str) -> None:
+    """Drop and create the database of the given URL."""
+    base_url, db_name = db_url.rsplit("/", 1)
+    engine = create_async_engine(f"{base_url}/postgres", isolation_level="AUTOCOMMIT")
+
+    async with engine.connect() as conn:
+        await conn.execute(text(f"DROP DATABASE IF EXISTS {db_name}"))
+        await conn.execute(text(f"CREATE DATABASE {db_name} ENCODING 'utf8' TEMPLATE template1"))
+
+    await engine.dispose()
+
+
+async def _insert(
+        conn: AsyncConnection,
+        table: Table,
+        rows: Sequence[dict[str, Any]],
+        returning: bool = True,
+) -> list[int]:
+    """Insert rows in chunks and return their ids in the order of `rows` (unless `returning` is off)."""
+    ids: list[int] = []
+    statement = insert(table)
+
+    if returning:
+        statement = statement.returning(table.c.id, sort_by_parameter_order=True)
+
+    for start in range(0, len(rows), CHUNK_SIZE):
+        result = await conn.execute(statement, rows[start:start + CHUNK_SIZE])
+
+        if returning:
+            ids.extend(result.scalars().all())
+
+    return ids
+
+
+def _amounts(price: Decimal, tax: Decimal) -> dict[str, Decimal]:
+    tax_amount = (price * tax).quantize(Decimal("0.01"))
+    return {"price": price, "tax": tax, "tax_amount": tax_amount, "total": price + tax_amount}
+
+
+async def seed(engine: AsyncEngine, options: SeedOptions) -> SeedResult:
+    """Create the schema and fill it with the benchmark data set.
+
+    Rows are written with multi-row Core inserts, so seeding tens of thousands of orders takes
+    seconds rather than minutes.
+
+    Args:
+        engine (AsyncEngine): The engine of an empty database.
+        options (SeedOptions): The size of the data set.
+
+    Returns:
+        SeedResult: The ids of the seeded rows.
+    """
+    rng = random.Random(options.seed)
+    now = datetime.now()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+        countries = json.loads(COUNTRIES_FIXTURE.read_text())
+        country_ids = await _insert(conn, Country.__table__, [
+            {**country, "available_for_order": index % 2 == 0} for index, country in enumerate(countries)
+        ])
+        available_country_ids = country_ids[::2]
+        urgency_ids = await _insert(conn, Urgency.__table__, [
+            {"name": name, "processing_hours": hours} for name, hours in URGENCIES
+        ])
+        visa_type_ids = await _insert(conn, VisaType.__table__, [{"name": name} for name in VISA_TYPES])
+        visa_duration_ids = await _insert(conn, VisaDuration.__table__, [
+            {"term": term, "entry": entry} for term, entry in VISA_DURATIONS
+        ])
+
+        country_visa_rows = [
+            {"country_id": country_id, "visa_type_id": visa_type_id}
+            for country_id in available_country_ids
+            for visa_type_id in rng.sample(visa_type_ids, 2)
+        ]
+        country_visa_ids = await _insert(conn, CountryVisa.__table__, country_visa_rows)
+        await conn.execute(insert(country_visa_duration), [
+            {"country_visa_id": country_visa_id, "visa_duration_id": visa_duration_id}
+            for country_visa_id in country_visa_ids
+            for visa_duration_id in rng.sample(visa_duration_ids, 3)
+        ])
+
+        # Every other service is bound to a country, some also to an urgency or a visa type
+        service_rows = []
+
+        for index in range(options.services):
+            bound = index % 2 == 1
+            service_rows.append({
+                "name": f"Service {index:04d}",
+                "fee_type": Service.FEE_TYPE_CONSULAR if bound else Service.FEE_TYPE_GENERAL,
+                "country_id": rng.choice(available_country_ids) if bound else None,
+                "urgency_id": rng.choice(urgency_ids) if index % 5 == 0 else None,
+                "visa_duration_id": None,
+                "visa_type_id": rng.choice(visa_type_ids) if index % 7 == 0 else None,
+            })
+
+        service_ids = await _insert(conn, Service.__table__, service_rows)
+        general_service_ids = [
+            service_id for service_id, row in zip(service_ids, service_rows)
+            if row["country_id"] is None and row["urgency_id"] is None and row["visa_type_id"] is None
+        ]
+
+        tariff_ids = await _insert(conn, Tariff.__table__, [
+            {"name": f"Tariff {index}", "is_default": index == 0} for index in range(options.tariffs)
+        ])
+        version_ids = await _insert(conn, TariffVersion.__table__, [
+            {"tariff_id": tariff_id} for tariff_id in tariff_ids
+        ])
+        prices: dict[tuple[int, int], dict[str, Decimal]] = {}
+        tariff_service_rows = []
+
+        for tariff_id, version_id in zip(tariff_ids, version_ids):
+            for service_id in service_ids:
+                amounts = _amounts(Decimal(rng.randrange(1000, 50000)) / 100, Decimal("0.2"))
+                prices[tariff_id, service_id] = amounts
+                tariff_service_rows.append(
+                    {"tariff_id": tariff_id, "version_id": version_id, "service_id": service_id, **amounts}
+                )
+
+        await _insert(conn, TariffService.__table__, tariff_service_rows)
+
+        for tariff_id, version_id in zip(tariff_ids, version_ids):
+            await conn.execute(
+                update(Tariff).where(Tariff.id == tariff_id).values(active_version_id=version_id)
+            )
+
+        client_tariffs = [rng.choice(tariff_ids) for _ in range(options.clients)]
+        client_ids = await _insert(conn, Client.__table__, [
+            {"name": f"Client {index:05d}", "type": Client.TYPE_LEGAL, "tariff_id": tariff_id}
+            for index, tariff_id in enumerate(client_tariffs)
+        ])
+
+        credentials = auth_service.create_salt_and_hashed_password(plaintext_password=ADMIN_PASSWORD)
+        user_ids = await _insert(conn, User.__table__, [
+            {
+                "first_name": "Bench",
+                "last_name": f"User {index}",
+                "email": ADMIN_EMAIL if index == 0 else f"bench-operator-{index}@example.com",
+                "email_verified": True,
+                "role": User.ROLE_ADMIN if index == 0 else User.ROLE_OPERATOR,
+                "password": credentials.password,
+                "salt": credentials.salt,
+                "is_active": True,
+            }
+            for index in range(10)
+        ])
+
+        order_rows = []
+        order_tariffs = []
+
+        for _ in range(options.orders):
+            client_index = rng.randrange(options.clients)
+            order_tariffs.append(client_tariffs[client_index])
+            order_rows.append({
+                "status": rng.choice(ORDER_STATUSES),
+                "client_id": client_ids[client_index],
+                "country_id": rng.choice(available_country_ids),
+                "created_by_id": rng.choice(user_ids),
+                "urgency_id": rng.choice(urgency_ids),
+                "visa_duration_id": rng.choice(visa_duration_ids),
+                "visa_type_id": rng.choice(visa_type_ids),
+                "created_at": now - timedelta(minutes=rng.randrange(2 * 365 * 24 * 60)),
+            })
+
+        order_ids = await _insert(conn, Order.__table__, order_rows)
+        # Same format as OrdersRepository.create
+        await conn.execute(update(Order).values(number=func.concat(
+            cast(func.extract("year", Order.created_at), Integer), "-", func.lpad(cast(Order.id, String), 4, "0")
+        )))
+        await _insert(conn, Applicant.__table__, returning=False, rows=[
+            {
+                "first_name": f"Applicant {order_id}",
+                "last_name": "Bench",
+                "email": f"applicant-{order_id}@example.com",
+                "gender": rng.choice((Applicant.GENDER_MALE, Applicant.GENDER_FEMALE)),
+                "order_id": order_id,
+            }
+            for order_id in order_ids
+        ])
+        await _insert(conn, OrderService.__table__, returning=False, rows=[
+            {"order_id": order_id, "service_id": service_id, **prices[tariff_id, service_id]}
+            for order_id, tariff_id in zip(order_ids, order_tariffs)
+            for service_id in rng.sample(general_service_ids, 2)
+        ])
+
+    return SeedResult(
+        order_ids=order_ids,
+        client_ids=client_ids,
+        country_ids=available_country_ids,
+        urgency_ids=urgency_ids,
+        visa_type_ids=visa_type_ids,
+    )
+
+
+async def load(engine: AsyncEngine, options: SeedOptions) -> Optional[SeedResult]:
+    """Read the ids of a previously seeded data set.
+
+    Returns:
+        Optional[SeedResult]: None if the database is missing or was seeded with another size.
+    """
+    try:
+        async with engine.connect() as conn:
+            order_ids = (await conn.execute(select(Order.id).order_by(Order.id))).scalars().all()
+
+            if len(order_ids) != options.orders:
+                return None
+
+            # Databases seeded before the order search table are seeded again
+            if await conn.scalar(select(func.count()).select_from(OrderSearch)) != len(order_ids):
+                return None
+
+            return SeedResult(
+                order_ids=list(order_ids),
+                client_ids=list((await conn.execute(select(Client.id).order_by(Client.id))).scalars()),
+                country_ids=list((await conn.execute(
+                    select(Country.id).where(Country.available_for_order.is_(True)).order_by(Country.id)
+                )).scalars()),
+                urgency_ids=list((await conn.execute(select(Urgency.id).order_by(Urgency.id))).scalars()),
+                visa_type_ids=list((await conn.execute(select(VisaType.id).order_by(VisaType.id))).scalars()),
+            )
+    except Exception:
+        return None
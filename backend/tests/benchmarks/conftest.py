@@ -0,0 +1,58 @@
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Protocol
+
+import pytest
+
+from app.database.instrumentation import QueryStats, query_stats
+
+# (test id, label, statements, milliseconds) of every measured block of the session
+timings: list[tuple[str, str, int, float]] = []
+
+
+class QueryBudgetProtocol(Protocol):
+    def __call__(self, max_statements: int, *, label: str = "") -> AsyncIterator[QueryStats]:
+        ...
+
+
+@pytest.fixture
+def query_budget(request: pytest.FixtureRequest, record_property) -> QueryBudgetProtocol:
+    """Measure a block of repository calls and fail if it executes more than `max_statements` statements.
+
+    The statement count is the number of SQL statements sent to the database, so an added lazy load,
+    refresh or per-row query shows up as a failure listing the executed statements. The wall time of
+    the block is recorded as a test property and listed in the terminal summary.
+    """
+
+    @asynccontextmanager
+    async def measure(max_statements: int, *, label: str = "") -> AsyncIterator[QueryStats]:
+        stats = QueryStats(track_shapes=True)
+        token = query_stats.set(stats)
+        started = time.perf_counter()
+
+        try:
+            yield stats
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            query_stats.reset(token)
+
+        timings.append((request.node.nodeid, label, stats.statements, elapsed))
+        record_property(f"{label or 'block'}_ms", round(elapsed, 3))
+        record_property(f"{label or 'block'}_statements", stats.statements)
+        executed = "\n".join(f"  {count}x {shape}" for shape, count in stats.shapes.most_common())
+        assert stats.statements <= max_statements, (
+            f"{stats.statements} statements executed, budget is {max_statements}:\n{executed}"
+        )
+
+    return measure
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    if not timings:
+        return
+
+    terminalreporter.section("repository benchmarks")
+
+    for nodeid, label, statements, elapsed in timings:
+        name = f"{nodeid.rsplit('::', 1)[-1]} {label}".strip()
+        terminalreporter.write_line(f"{name:<70}{statements:>4} statements{elapsed:>10.2f} ms")
@@ -0,0 +1,360 @@
+import tracemalloc
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.loaders import loader_registry
+from app.database.repositories.clients import ClientsRepository
+from app.database.repositories.countries import CountriesRepository
+from app.database.repositories.order_services import OrderServicesRepository
+from app.database.repositories.orders import OrdersRepository
+from app.database.repositories.services import ServicesRepository
+from app.models import Country, Order, Service, Tariff, User, VisaDuration
+from app.schemas.applicant import ApplicantCreateUpdateSchema, ApplicantGenderEnum
+from app.schemas.client import ClientListResponseSchema, ClientTypeEnum
+from app.schemas.country import CountryAdminResponseSchema
+from app.schemas.order.admin import (
+    AdminOrderCreateSchema,
+    AdminOrderDetailSchema,
+    AdminOrderListSchema,
+    AdminOrderPaginatedListSchema,
+    AdminOrderStatusListSchema,
+    AdminOrderStatusTransitionResultSchema,
+    AdminOrderUpdateSchema
+)
+from app.schemas.order.base import OrderStatusEnum
+from app.schemas.order_service import OrderServicesDataSchema, OrderServicesUpdateSchema
+from app.schemas.pagination import PageParamsSchema
+from app.schemas.serializers import get_serializer
+from app.schemas.service import (
+    FeeTypeEnum,
+    ServiceListResponseSchema,
+    ServiceResponseSchema,
+    ServiceUpdateSchema,
+    TariffServiceCreateSchema,
+    TariffServiceUpdateSchema
+)
+from tests.benchmarks.conftest import QueryBudgetProtocol
+from tests.conftest import (
+    CountryMakerProtocol,
+    UrgencyMakerProtocol,
+    VisaDurationMakerProtocol,
+    VisaTypeMakerProtocol
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestRepositoryBenchmarks:
+    """Statement budgets of the repository calls behind the hot API paths.
+
+    Each call is measured against an empty identity map, as in a request, and its result is
+    serialized with the response schema of the route inside the measured block, so a relation
+    that is not eagerly loaded fails the test instead of being answered from the session.
+    """
+
+    @pytest_asyncio.fixture
+    async def criteria(
+            self,
+            country_maker: CountryMakerProtocol,
+            urgency_maker: UrgencyMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+    ) -> dict[str, int]:
+        country: Country = await country_maker(name="Russia", alpha2="RU", alpha3="RUS", available_for_order=True)
+        urgency = await urgency_maker()
+        visa_duration = await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY)
+        visa_type = await visa_type_maker(name="Business")
+        return {
+            "country_id": country.id,
+            "urgency_id": urgency.id,
+            "visa_duration_id": visa_duration.id,
+            "visa_type_id": visa_type.id,
+        }
+
+    @pytest_asyncio.fixture
+    async def services(self, service_maker, test_tariff: Tariff) -> list[Service]:
+        return [
+            await service_maker(
+                fee_type=FeeTypeEnum.GENERAL,
+                tariff_services=[
+                    TariffServiceCreateSchema(price=Decimal(10 * n), tax=Decimal("0.2"), tariff_id=test_tariff.id)
+                ]
+            )
+            for n in range(1, 6)
+        ]
+
+    @pytest_asyncio.fixture
+    async def order(
+            self,
+            async_db: AsyncSession,
+            criteria: dict[str, int],
+            client_maker,
+            test_admin: User,
+            services: list[Service],
+    ) -> Order:
+        client = await client_maker(type=ClientTypeEnum.LEGAL)
+        order = await OrdersRepository(async_db).create(
+            data=AdminOrderCreateSchema(client_id=client.id, created_by_id=test_admin.id, **criteria)
+        )
+        await OrdersRepository(async_db).update(
+            order_id=order.id,
+            data=AdminOrderUpdateSchema(
+                status=OrderStatusEnum.NEW,
+                applicant=ApplicantCreateUpdateSchema(
+                    first_name="John", last_name="Doe", email="john@example.com", gender=ApplicantGenderEnum.MALE
+                ),
+                **criteria
+            )
+        )
+        available = await OrderServicesRepository(async_db).get_for_order(order_id=order.id)
+        await OrderServicesRepository(async_db).update_for_order(
+            order_id=order.id,
+            data=OrderServicesUpdateSchema(tariff_services_ids=[item["id"] for item in available["available"][:2]])
+        )
+        async_db.expunge_all()
+        return order
+
+    async def test_order_get_by_id(
+            self, async_db: AsyncSession, order: Order, query_budget: QueryBudgetProtocol
+    ) -> None:
+        # One joined SELECT
+        async with query_budget(1):
+            result = await OrdersRepository(async_db).get_by_id(order_id=order.id, populate_client=True)
+            AdminOrderDetailSchema.model_validate(result)
+
+    async def test_order_statuses_by_numbers(
+            self, async_db: AsyncSession, order: Order, query_budget: QueryBudgetProtocol
+    ) -> None:
+        numbers = [order.number] + [f"2000-{index:04d}" for index in range(2000)]
+
+        # One projected SELECT, whatever the number of order numbers
+        async with query_budget(1):
+            result = await OrdersRepository(async_db).get_statuses_by_numbers(numbers=numbers)
+            get_serializer(AdminOrderStatusListSchema)({"items": result})
+
+    async def test_order_transition_statuses(
+            self, async_db: AsyncSession, order: Order, query_budget: QueryBudgetProtocol
+    ) -> None:
+        order_ids = [order.id] + list(range(order.id + 1, order.id + 2000))
+
+        # One UPDATE ... RETURNING, whatever the number of orders
+        async with query_budget(1):
+            result = await OrdersRepository(async_db).transition_statuses(
+                order_ids=order_ids, status=Order.STATUS_IN_PROGRESS
+            )
+            get_serializer(AdminOrderStatusTransitionResultSchema)({"items": result, "skipped_ids": []})
+
+    async def test_order_create(
+            self,
+            async_db: AsyncSession,
+            criteria: dict[str, int],
+            client_maker,
+            test_admin: User,
+            query_budget: QueryBudgetProtocol,
+    ) -> None:
+        client = await client_maker(type=ClientTypeEnum.LEGAL)
+        async_db.expunge_all()
+
+        # INSERT, refresh, UPDATE of the number and the joined SELECT of the result
+        async with query_budget(4):
+            result = await OrdersRepository(async_db).create(
+                data=AdminOrderCreateSchema(client_id=client.id, created_by_id=test_admin.id, **criteria),
+                populate_client=True
+            )
+            AdminOrderDetailSchema.model_validate(result)
+
+    async def test_order_update(
+            self,
+            async_db: AsyncSession,
+            order: Order,
+            criteria: dict[str, int],
+            query_budget: QueryBudgetProtocol,
+    ) -> None:
+        data = AdminOrderUpdateSchema(
+            status=OrderStatusEnum.IN_PROGRESS,
+            applicant=ApplicantCreateUpdateSchema(
+                first_name="Jane", last_name="Doe", email="jane@example.com", gender=ApplicantGenderEnum.FEMALE
+            ),
+            **criteria
+        )
+
+        # Joined SELECT, UPDATE of the order and the applicant, refresh and the joined SELECT of the result
+        async with query_budget(5):
+            result = await OrdersRepository(async_db).update(order_id=order.id, data=data, populate_client=True)
+            AdminOrderDetailSchema.model_validate(result)
+
+    async def test_order_list_projection_allocations(
+            self,
+            async_db: AsyncSession,
+            criteria: dict[str, int],
+            client_maker,
+            test_admin: User,
+            query_budget: QueryBudgetProtocol,
+    ) -> None:
+        """A projected 100 row page allocates less than loading the orders with their relations joined."""
+        client = await client_maker(type=ClientTypeEnum.LEGAL)
+        await async_db.execute(insert(Order), [
+            {"client_id": client.id, "created_by_id": test_admin.id, "number": f"2025-{n:04d}", **criteria}
+            for n in range(100)
+        ])
+        await async_db.commit()
+        repo = OrdersRepository(async_db)
+        page_params = PageParamsSchema(page=1, size=100)
+        serializer = get_serializer(AdminOrderPaginatedListSchema)
+        options = loader_registry.options(Order, AdminOrderListSchema)
+
+        async def allocated(load) -> int:
+            # The first run compiles and caches the statement
+            serializer(await load())
+            async_db.expunge_all()
+            tracemalloc.start()
+
+            try:
+                await load()
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        # Count and page, run twice
+        async with query_budget(4, label="entities"):
+            entities = await allocated(lambda: repo.get_paginated_list(page_params=page_params, options=options))
+
+        async with query_budget(4, label="projected"):
+            projected = await allocated(
+                lambda: repo.get_projected_paginated_list(schema=AdminOrderListSchema, page_params=page_params)
+            )
+
+        assert projected < entities * 0.75
+
+    async def test_order_paginated_list(
+            self,
+            async_db: AsyncSession,
+            criteria: dict[str, int],
+            client_maker,
+            test_admin: User,
+            query_budget: QueryBudgetProtocol,
+    ) -> None:
+        clients = [await client_maker(type=ClientTypeEnum.LEGAL) for _ in range(3)]
+        await async_db.execute(insert(Order), [
+            {"client_id": clients[n % 3].id, "created_by_id": test_admin.id, "number": f"2025-{n:04d}", **criteria}
+            for n in range(30)
+        ])
+        await async_db.commit()
+        async_db.expunge_all()
+
+        # Count and the page with its many-to-one relations joined
+        async with query_budget(2):
+            result = await OrdersRepository(async_db).get_paginated_list(page_params=PageParamsSchema(page=1, size=30))
+            data = get_serializer(AdminOrderPaginatedListSchema)(result)
+
+        assert len(data["items"]) == 30
+        assert data["items"][0]["client"]["tariff"]["id"] is not None
+
+    @pytest.mark.parametrize("count", [1, 10])
+    async def test_service_paginated_list(
+            self, async_db: AsyncSession, count: int, service_maker, test_tariff: Tariff, query_budget: QueryBudgetProtocol
+    ) -> None:
+        for n in range(count):
+            await service_maker(
+                fee_type=FeeTypeEnum.GENERAL,
+                tariff_services=[
+                    TariffServiceCreateSchema(price=Decimal(n + 1), tax=Decimal("0.2"), tariff_id=test_tariff.id)
+                ]
+            )
+
+        async_db.expunge_all()
+
+        # Count, the page and its tariff services with their tariffs joined, whatever the page size
+        async with query_budget(3):
+            result = await ServicesRepository(async_db).get_paginated_list(page_params=PageParamsSchema(page=1, size=20))
+            data = get_serializer(ServiceListResponseSchema)(result)
+
+        assert len(data["items"]) == count
+        assert data["items"][0]["tariff_services"][0]["tariff"]["id"] == test_tariff.id
+
+    async def test_client_paginated_list(
+            self, async_db: AsyncSession, client_maker, query_budget: QueryBudgetProtocol
+    ) -> None:
+        for _ in range(5):
+            await client_maker(type=ClientTypeEnum.LEGAL)
+
+        async_db.expunge_all()
+
+        # Count and the page with the tariffs joined
+        async with query_budget(2):
+            result = await ClientsRepository(async_db).get_paginated_list(page_params=PageParamsSchema(page=1, size=20))
+            data = get_serializer(ClientListResponseSchema)(result)
+
+        assert len(data["items"]) == 5
+        assert all(item["tariff"] for item in data["items"])
+
+    async def test_order_services_get_for_order(
+            self, async_db: AsyncSession, order: Order, query_budget: QueryBudgetProtocol
+    ) -> None:
+        # Order criteria, attached services with their services and available services;
+        # the active tariff version is cached
+        async with query_budget(4):
+            result = await OrderServicesRepository(async_db).get_for_order(order_id=order.id)
+            OrderServicesDataSchema.model_validate(result)
+
+        assert len(result["attached"]) == 2
+        assert len(result["available"]) == 3
+
+    async def test_order_services_update_for_order(
+            self, async_db: AsyncSession, order: Order, query_budget: QueryBudgetProtocol
+    ) -> None:
+        available = await OrderServicesRepository(async_db).get_for_order(order_id=order.id)
+        data = OrderServicesUpdateSchema(tariff_services_ids=[item["id"] for item in available["available"]])
+        async_db.expunge_all()
+
+        # Prices of the services of the active tariff version, DELETE and one multi-row INSERT
+        async with query_budget(3):
+            await OrderServicesRepository(async_db).update_for_order(order_id=order.id, data=data)
+
+    async def test_country_get_by_id_with_visa_data(
+            self,
+            async_db: AsyncSession,
+            country_maker: CountryMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            country_visa_maker,
+            query_budget: QueryBudgetProtocol,
+    ) -> None:
+        country = await country_maker(name="Russia", alpha2="RU", alpha3="RUS", available_for_order=True)
+        visa_types = [await visa_type_maker(name=name) for name in ("Business", "Tourist", "Private", "Transit")]
+
+        for visa_type in visa_types[:3]:
+            await country_visa_maker(country_id=country.id, visa_type_id=visa_type.id)
+
+        async_db.expunge_all()
+
+        # Country, its country visas, their visa types and the visa types not attached
+        async with query_budget(4):
+            result = await CountriesRepository(async_db).get_by_id(country_id=country.id, populate_visa_data=True)
+            CountryAdminResponseSchema.model_validate(result)
+
+        assert len(result.visa_data["attached"]) == 3
+        assert len(result.visa_data["available"]) == 1
+
+    async def test_service_update(
+            self,
+            async_db: AsyncSession,
+            services: list[Service],
+            test_tariff: Tariff,
+            query_budget: QueryBudgetProtocol,
+    ) -> None:
+        service_id = services[0].id
+        async_db.expunge_all()
+        data = ServiceUpdateSchema(
+            name="Renamed",
+            tariff_services=[TariffServiceUpdateSchema(price=Decimal("99"), tax=Decimal("0.2"), tariff_id=test_tariff.id)]
+        )
+
+        # Service with its tariff services and tariffs, twice (3 each), UPDATE of the service and
+        # a new tariff version: active version lookup, version, new price, copied prices and pointer
+        async with query_budget(12):
+            result = await ServicesRepository(async_db).update(service_id=service_id, data=data)
+            ServiceResponseSchema.model_validate(result)
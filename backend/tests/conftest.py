@@ -3,6 +3,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Protocol, Optional
 
+import pytest
 import pytest_asyncio
 from fastapi import FastAPI
 from fastapi_mail import FastMail
@@ -15,7 +16,8 @@ from sqlalchemy.pool import NullPool
 
 from app.api.server import get_application
 from app.config import DATABASE_URL, mail_config
-from app.database.db import get_session
+from app.database.db import get_replica_session, get_session
+from app.database.instrumentation import instrument_engine
 from app.database.repositories.clients import ClientsRepository
 from app.database.repositories.country_visas import CountryVisasRepository
 from app.database.repositories.services import ServicesRepository
@@ -46,6 +48,7 @@ from app.schemas.tariff import TariffCreateSchema
 from app.schemas.urgency import UrgencyCreateSchema
 from app.schemas.user import UserCreateSchema
 from app.schemas.visa_type import VisaTypeCreateSchema
+from app.services import cache_service, tariff_version_service
 
 
 @pytest_asyncio.fixture
@@ -86,6 +89,7 @@ async def async_db_engine():
         echo=False,
         poolclass=NullPool,
     )
+    instrument_engine(async_engine)
 
     async with async_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -120,9 +124,19 @@ async def async_client(async_db, app: FastAPI):
         yield async_db
 
     app.dependency_overrides[get_session] = override_get_db
+    # Reads routed to the replica see the uncommitted data of the test too
+    app.dependency_overrides[get_replica_session] = override_get_db
     return AsyncClient(transport=ASGITransport(app=app), base_url="http://localhost")
 
 
+@pytest.fixture(autouse=True)
+def reset_price_quote_cache():
+    """Every test gets a fresh database, so cached tariff prices, versions and reference data must not leak between tests"""
+    tariff_version_service.invalidate()
+    # Also drops the tariff price tables, kept in the cache
+    cache_service.reset_local()
+
+
 @pytest_asyncio.fixture
 async def fastapi_mail():
     mail_config.SUPPRESS_SEND = 1
@@ -265,7 +279,7 @@ async def visa_type_maker(async_db: AsyncSession) -> VisaTypeMakerProtocol:
 
 
 class UrgencyMakerProtocol(Protocol):
-    async def __call__(self, *, name: Optional[str] = None) -> Urgency:
+    async def __call__(self, *, name: Optional[str] = None, processing_hours: Optional[int] = None) -> Urgency:
         ...
 
 
@@ -276,11 +290,12 @@ async def urgency_maker(async_db: AsyncSession):
 
     n = 1
 
-    async def inner(*, name: str | None = None) -> Urgency:
+    async def inner(*, name: str | None = None, processing_hours: int | None = None) -> Urgency:
         nonlocal n
         urgency = await urgencies_repo.create(
             data=UrgencyCreateSchema(
                 name=name or f"Test Urgency {n}",
+                processing_hours=processing_hours,
             )
         )
         created_urgencies.append(urgency)
@@ -0,0 +1,59 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.database.repositories.audit import AuditRepository
+from app.models import LogEntry
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestAuditRepository:
+
+    @pytest.fixture
+    def audit_repo(self, async_db: AsyncSession) -> AuditRepository:
+        return AuditRepository(async_db)
+
+    async def test_rotate_partitions(self, async_db: AsyncSession, audit_repo: AuditRepository) -> None:
+        result = await audit_repo.rotate_partitions(today=date(2025, 3, 1), months_ahead=0, retention_months=12)
+        assert result == {"created": ["log_entries_y2025m03"], "dropped": []}
+
+        async_db.add(LogEntry(action=LogEntry.ACTION_LOGIN, created_at=datetime(2025, 3, 10)))
+        await async_db.commit()
+
+        result = await audit_repo.rotate_partitions(today=date(2025, 6, 15), months_ahead=1, retention_months=3)
+        assert result == {"created": ["log_entries_y2025m06", "log_entries_y2025m07"], "dropped": ["log_entries_y2025m03"]}
+        assert await audit_repo.get_partitions() == [
+            LogEntry.DEFAULT_PARTITION_NAME,
+            "log_entries_y2025m06",
+            "log_entries_y2025m07",
+        ]
+        assert await async_db.scalar(select(func.count()).select_from(LogEntry)) == 0
+
+    async def test_rotate_partitions_conflicting_default_rows(
+            self,
+            async_db: AsyncSession,
+            audit_repo: AuditRepository
+    ) -> None:
+        async_db.add(LogEntry(action=LogEntry.ACTION_LOGIN, created_at=datetime(2025, 3, 10)))
+        await async_db.commit()
+
+        # March entries are already in the default partition, which must not abort the rotation
+        result = await audit_repo.rotate_partitions(today=date(2025, 3, 1), months_ahead=1, retention_months=12)
+
+        assert result == {"created": ["log_entries_y2025m04"], "dropped": []}
+        assert await async_db.scalar(select(func.count()).select_from(LogEntry)) == 1
+
+    async def test_rotate_partitions_locked(self, async_db_engine: AsyncEngine, audit_repo: AuditRepository) -> None:
+        """Test that the rotation is left to the worker already running it"""
+        async with async_db_engine.connect() as connection:
+            async with connection.begin():
+                await connection.execute(select(func.pg_advisory_xact_lock(AuditRepository.PARTITIONS_LOCK_KEY)))
+
+                result = await audit_repo.rotate_partitions(today=date(2025, 3, 1), months_ahead=0, retention_months=12)
+                assert result == {"created": [], "dropped": []}
+
+        result = await audit_repo.rotate_partitions(today=date(2025, 3, 1), months_ahead=0, retention_months=12)
+        assert result == {"created": ["log_entries_y2025m03"], "dropped": []}
@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.repositories.idempotency_keys import IdempotencyKeysRepository
+from app.models import IdempotencyKey, User
+from app.services import cache_service
+
+
+class TestIdempotencyKeysRepository:
+    """Tests for the idempotency keys."""
+
+    @pytest.fixture
+    def idempotency_repo(self, async_db: AsyncSession) -> IdempotencyKeysRepository:
+        return IdempotencyKeysRepository(async_db)
+
+    @pytest.mark.asyncio
+    async def test_claim(self, idempotency_repo: IdempotencyKeysRepository, test_user: User) -> None:
+        key = dict(user_id=test_user.id, key="order-1")
+
+        assert await idempotency_repo.claim(**key, fingerprint=b"first") is None
+        assert await idempotency_repo.claim(**key, fingerprint=b"first") == {
+            "fingerprint": b"first", "status_code": None, "body": None
+        }
+
+        await idempotency_repo.complete(**key, fingerprint=b"first", status_code=201, body=b"{}")
+
+        assert await idempotency_repo.get_cached(**key) == (b"first", 201, b"{}")
+
+        cache_service.reset_local()
+
+        assert await idempotency_repo.claim(**key, fingerprint=b"second") == {
+            "fingerprint": b"first", "status_code": 201, "body": b"{}"
+        }
+        # Cached again by the claim that found the response
+        assert await idempotency_repo.get_cached(**key) == (b"first", 201, b"{}")
+
+    @pytest.mark.asyncio
+    async def test_release(self, idempotency_repo: IdempotencyKeysRepository, test_user: User) -> None:
+        key = dict(user_id=test_user.id, key="order-1")
+        await idempotency_repo.claim(**key, fingerprint=b"first")
+        await idempotency_repo.release(**key)
+
+        assert await idempotency_repo.claim(**key, fingerprint=b"second") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_keys(
+            self,
+            async_db: AsyncSession,
+            idempotency_repo: IdempotencyKeysRepository,
+            test_user: User
+    ) -> None:
+        for key in ("order-1", "order-2", "order-3"):
+            await idempotency_repo.claim(user_id=test_user.id, key=key, fingerprint=b"first")
+
+        await async_db.execute(
+            update(IdempotencyKey)
+            .where(IdempotencyKey.key.in_(["order-1", "order-2"]))
+            .values(expires_at=func.localtimestamp())
+        )
+        await async_db.commit()
+
+        # An expired key is claimed again
+        assert await idempotency_repo.claim(user_id=test_user.id, key="order-1", fingerprint=b"second") is None
+        assert await idempotency_repo.purge_expired(limit=10) == 1
+        assert (await async_db.scalars(select(IdempotencyKey.key).order_by(IdempotencyKey.key))).all() == [
+            "order-1", "order-3"
+        ]
@@ -0,0 +1,136 @@
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.repositories.order_services import OrderServicesRepository
+from app.database.repositories.services import ServicesRepository
+from app.database.repositories.tariffs import TariffsRepository
+from app.exceptions import InvalidTariffServicesException
+from app.models import Order, OrderService, Service, Tariff, User, VisaDuration
+from app.schemas.client import ClientTypeEnum
+from app.schemas.order_service import OrderServicesUpdateSchema
+from app.schemas.service import FeeTypeEnum, ServiceUpdateSchema, TariffServiceCreateSchema, TariffServiceUpdateSchema
+from app.schemas.tariff import TariffCreateSchema
+from tests.conftest import (
+    CountryMakerProtocol,
+    OrderMakerProtocol,
+    UrgencyMakerProtocol,
+    VisaDurationMakerProtocol,
+    VisaTypeMakerProtocol
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestOrderServicesRepository:
+    """Tests for the order services repository."""
+
+    @pytest.fixture
+    def order_services_repo(self, async_db: AsyncSession) -> OrderServicesRepository:
+        return OrderServicesRepository(async_db)
+
+    @pytest_asyncio.fixture
+    async def order(
+            self,
+            client_maker,
+            test_user: User,
+            order_maker: OrderMakerProtocol,
+            country_maker: CountryMakerProtocol,
+            urgency_maker: UrgencyMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+    ) -> Order:
+        return await order_maker(
+            country=await country_maker(name="Russia", alpha2="RU", alpha3="RUS"),
+            client=await client_maker(type=ClientTypeEnum.LEGAL),
+            created_by=test_user,
+            urgency=await urgency_maker(),
+            visa_duration=await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY),
+            visa_type=await visa_type_maker(name="Business"),
+        )
+
+    @pytest_asyncio.fixture
+    async def services(self, test_tariff: Tariff, service_maker) -> list[Service]:
+        return [
+            await service_maker(
+                fee_type=FeeTypeEnum.GENERAL,
+                tariff_services=[TariffServiceCreateSchema(price=price, tax=Decimal(0), tariff_id=test_tariff.id)]
+            )
+            for price in (Decimal(10), Decimal(20))
+        ]
+
+    async def get_attached_prices(self, async_db: AsyncSession, order: Order) -> list[Decimal]:
+        statement = select(OrderService.price).where(OrderService.order_id == order.id).order_by(OrderService.price)
+        return list((await async_db.scalars(statement)).all())
+
+    async def test_update_for_order(
+            self,
+            async_db: AsyncSession,
+            order_services_repo: OrderServicesRepository,
+            order: Order,
+            services: list[Service],
+    ) -> None:
+        available = (await order_services_repo.get_for_order(order_id=order.id))["available"]
+
+        await order_services_repo.update_for_order(
+            order_id=order.id,
+            data=OrderServicesUpdateSchema(tariff_services_ids=[item["id"] for item in available])
+        )
+
+        assert await self.get_attached_prices(async_db, order) == [Decimal(10), Decimal(20)]
+
+    async def test_update_for_order_outdated_tariff_services(
+            self,
+            async_db: AsyncSession,
+            order_services_repo: OrderServicesRepository,
+            order: Order,
+            services: list[Service],
+            test_tariff: Tariff,
+    ) -> None:
+        """Test that the ids of a previous version of the tariff are rejected, not priced with the old prices"""
+        available = (await order_services_repo.get_for_order(order_id=order.id))["available"]
+        await order_services_repo.update_for_order(
+            order_id=order.id,
+            data=OrderServicesUpdateSchema(tariff_services_ids=[available[0]["id"]])
+        )
+
+        await ServicesRepository(async_db).update(
+            service_id=services[0].id,
+            data=ServiceUpdateSchema(
+                tariff_services=[TariffServiceUpdateSchema(price=Decimal(15), tax=Decimal(0), tariff_id=test_tariff.id)]
+            )
+        )
+
+        with pytest.raises(InvalidTariffServicesException):
+            await order_services_repo.update_for_order(
+                order_id=order.id,
+                data=OrderServicesUpdateSchema(tariff_services_ids=[item["id"] for item in available])
+            )
+
+        # The attached services are left as they were
+        assert await self.get_attached_prices(async_db, order) == [Decimal(10)]
+
+    async def test_update_for_order_other_tariff_services(
+            self,
+            async_db: AsyncSession,
+            order_services_repo: OrderServicesRepository,
+            order: Order,
+            service_maker,
+    ) -> None:
+        """Test that the services of another tariff than the client's are rejected"""
+        other_tariff = await TariffsRepository(async_db).create(new_tariff=TariffCreateSchema(name="Other Tariff", is_default=False))
+        service = await service_maker(
+            fee_type=FeeTypeEnum.GENERAL,
+            tariff_services=[TariffServiceCreateSchema(price=Decimal(5), tax=Decimal(0), tariff_id=other_tariff.id)]
+        )
+
+        with pytest.raises(InvalidTariffServicesException):
+            await order_services_repo.update_for_order(
+                order_id=order.id,
+                data=OrderServicesUpdateSchema(tariff_services_ids=[service.tariff_services[0].id])
+            )
+
+        assert await self.get_attached_prices(async_db, order) == []
@@ -0,0 +1,133 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.instrumentation import QueryStats, query_stats
+from app.database.repositories.order_status_events import OrderStatusEventsRepository
+from app.database.repositories.orders import OrdersRepository
+from app.models import Order, OrderStatusEvent, User, VisaDuration
+from app.schemas.order.base import OrderStatusEnum
+from tests.conftest import (
+    OrderMakerProtocol,
+    CountryMakerProtocol,
+    UrgencyMakerProtocol,
+    VisaTypeMakerProtocol,
+    VisaDurationMakerProtocol
+)
+
+
+class TestOrderStatusEventsRepository:
+    """Tests for the order status history."""
+
+    @pytest.fixture
+    def events_repo(self, async_db: AsyncSession) -> OrderStatusEventsRepository:
+        return OrderStatusEventsRepository(async_db)
+
+    @pytest.fixture
+    def make_order(
+            self,
+            order_maker: OrderMakerProtocol,
+            country_maker: CountryMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            test_individual: User,
+            urgency_maker: UrgencyMakerProtocol,
+            test_user: User
+    ):
+        criteria = {}
+
+        async def inner(status: OrderStatusEnum = OrderStatusEnum.NEW) -> Order:
+            if not criteria:
+                criteria.update(
+                    country=await country_maker(name="Russia", alpha2="RU", alpha3="RUS"),
+                    urgency=await urgency_maker(),
+                    visa_duration=await visa_duration_maker(
+                        term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY
+                    ),
+                    visa_type=await visa_type_maker(name="Business"),
+                    client=await test_individual.awaitable_attrs.individual_client,
+                )
+
+            return await order_maker(created_by=test_user, status=status, **criteria)
+
+        return inner
+
+    @pytest.mark.asyncio
+    async def test_timeline(
+            self,
+            async_db: AsyncSession,
+            events_repo: OrderStatusEventsRepository,
+            make_order
+    ) -> None:
+        """Test that inserts and status changes are recorded, whichever path changes the status"""
+        order = await make_order()
+        other = await make_order()
+        await OrdersRepository(async_db).transition_statuses(order_ids=[order.id], status=Order.STATUS_IN_PROGRESS)
+        order.status = Order.STATUS_COMPLETED
+        await async_db.commit()
+        # Not a status change
+        order.number = f"{order.number}-1"
+        await async_db.commit()
+
+        stats = QueryStats()
+        token = query_stats.set(stats)
+
+        try:
+            timeline = await events_repo.get_timeline(order_id=order.id)
+        finally:
+            query_stats.reset(token)
+
+        assert stats.statements == 1
+        assert [(event["old_status"], event["status"]) for event in timeline] == [
+            (None, Order.STATUS_NEW),
+            (Order.STATUS_NEW, Order.STATUS_IN_PROGRESS),
+            (Order.STATUS_IN_PROGRESS, Order.STATUS_COMPLETED),
+        ]
+        assert [event["left_at"] for event in timeline] == [event["created_at"] for event in timeline[1:]] + [None]
+        assert len(await events_repo.get_timeline(order_id=other.id)) == 1
+        assert await events_repo.get_timeline(order_id=10000) == []
+
+    @pytest.mark.asyncio
+    async def test_status_durations(
+            self,
+            async_db: AsyncSession,
+            events_repo: OrderStatusEventsRepository,
+            make_order
+    ) -> None:
+        orders = [await make_order() for _ in range(3)]
+        await OrdersRepository(async_db).transition_statuses(
+            order_ids=[order.id for order in orders[:2]], status=Order.STATUS_IN_PROGRESS
+        )
+        started = datetime.now() - timedelta(days=1)
+
+        # Orders stayed new for 1 and 3 hours, the last one still is
+        for order, hours in zip(orders, (1, 3, None)):
+            await async_db.execute(
+                update(OrderStatusEvent)
+                .where(OrderStatusEvent.order_id == order.id, OrderStatusEvent.status == Order.STATUS_NEW)
+                .values(created_at=started)
+            )
+
+            if hours is not None:
+                await async_db.execute(
+                    update(OrderStatusEvent)
+                    .where(OrderStatusEvent.order_id == order.id, OrderStatusEvent.status == Order.STATUS_IN_PROGRESS)
+                    .values(created_at=started + timedelta(hours=hours))
+                )
+
+        await async_db.commit()
+        result = await events_repo.get_status_durations(status=Order.STATUS_NEW, since=started)
+
+        assert result["status"] == Order.STATUS_NEW
+        assert result["since"] == started
+        assert result["completed"] == 2
+        assert result["open"] == 1
+        assert result["p50"] == 2 * 60 * 60
+        assert 3 * 60 * 60 > result["p90"] > result["p50"]
+
+        result = await events_repo.get_status_durations(status=Order.STATUS_NEW, since=datetime.now())
+
+        assert result["completed"] == result["open"] == 0
+        assert result["p50"] is None
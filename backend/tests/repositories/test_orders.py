@@ -1,15 +1,19 @@
+from datetime import datetime, timedelta
+
 import pytest
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database.instrumentation import QueryStats, query_stats
 from app.database.repositories.orders import OrdersRepository
 from app.models import Order, VisaDuration, Applicant, User
 from app.schemas.applicant import ApplicantCreateUpdateSchema, ApplicantGenderEnum
 from app.schemas.order.admin import AdminOrderCreateSchema, AdminOrderUpdateSchema
 from app.schemas.order.base import OrderStatusEnum
-from app.schemas.order.admin import AdminOrderFilterSchema
+from app.schemas.order.admin import AdminOrderFilterSchema, AdminOrderListSchema
 from app.schemas.pagination import PageParamsSchema, PagedResponseSchema
+from app.schemas.serializers import get_serializer
 from tests.conftest import (
     OrderMakerProtocol,
     CountryMakerProtocol,
@@ -40,13 +44,13 @@ class TestOrdersRepository:
 
     @pytest.mark.parametrize(
         "filter_data, expected_filter_count", [
-            ({"status": "new"}, 1),
-            ({"country_id": 1}, 1),
-            ({"client_id": 1}, 1),
-            ({"created_by_id": 1}, 1),
-            ({"urgency_id": 1}, 1),
-            ({"visa_duration_id": 1}, 1),
-            ({"visa_type_id": 1}, 1),
+            ({"status": "new"}, 2),
+            ({"country_id": 1}, 2),
+            ({"client_id": 1}, 2),
+            ({"created_by_id": 1}, 2),
+            ({"urgency_id": 1}, 2),
+            ({"visa_duration_id": 1}, 2),
+            ({"visa_type_id": 1}, 2),
             ({
                 "status": "draft",
                 "country_id": 1,
@@ -55,7 +59,11 @@ class TestOrdersRepository:
                 "urgency_id": 4,
                 "visa_duration_id": 5,
                 "visa_type_id": 6,
-            }, 7)
+            }, 8),
+            ({"q": "2025-0001"}, 2),
+            ({"q": "--"}, 1),
+            ({"include_archived": True}, 0),
+            ({"status": "new", "include_archived": True}, 1),
         ]
     )
     def test_build_filters(self, orders_repo: OrdersRepository, filter_data, expected_filter_count) -> None:
@@ -175,6 +183,135 @@ class TestOrdersRepository:
             "items": [orders[0]]
         }
 
+    @pytest.mark.asyncio
+    async def test_projected_paginated_list(
+            self,
+            async_db: AsyncSession,
+            orders_repo: OrdersRepository,
+            order_maker: OrderMakerProtocol,
+            country_maker: CountryMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            test_individual: User,
+            urgency_maker: UrgencyMakerProtocol,
+            test_user: User
+    ) -> None:
+        """Test that projected rows serialize exactly like the loaded orders"""
+        country = await country_maker(name="Russia", alpha2="RU", alpha3="RUS")
+        urgency = await urgency_maker()
+        visa_duration = await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY)
+        visa_type = await visa_type_maker(name="Business")
+        client = await test_individual.awaitable_attrs.individual_client
+        orders = [
+            await order_maker(
+                country=country,
+                client=client,
+                created_by=test_user,
+                urgency=urgency,
+                visa_duration=visa_duration,
+                visa_type=visa_type,
+                status=status
+            )
+            for status in (OrderStatusEnum.DRAFT, OrderStatusEnum.NEW, OrderStatusEnum.NEW)
+        ]
+        stats = QueryStats()
+        token = query_stats.set(stats)
+
+        try:
+            result = await orders_repo.get_projected_paginated_list(
+                schema=AdminOrderListSchema,
+                query_filters=AdminOrderFilterSchema(status=OrderStatusEnum.NEW),
+                page_params=PageParamsSchema(page=1, size=1)
+            )
+        finally:
+            query_stats.reset(token)
+
+        # Count and page, the relations are joined
+        assert stats.statements == 2
+        assert {key: value for key, value in result.items() if key != "items"} == PagedResponseSchema(
+            page=1,
+            size=1,
+            total=2,
+            total_pages=2,
+            has_next=True,
+            has_prev=False,
+        ).model_dump()
+        assert isinstance(result["items"][0], dict)
+
+        order = await orders_repo.get_by_id(order_id=orders[1].id, populate_client=True)
+        assert get_serializer(AdminOrderListSchema).many(result["items"]) == [
+            AdminOrderListSchema.model_validate(order).model_dump(mode="json")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search(
+            self,
+            async_db: AsyncSession,
+            orders_repo: OrdersRepository,
+            order_maker: OrderMakerProtocol,
+            country_maker: CountryMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            test_individual: User,
+            urgency_maker: UrgencyMakerProtocol,
+            test_user: User
+    ) -> None:
+        """Test that the search documents follow the orders, applicants and clients"""
+        country = await country_maker(name="Russia", alpha2="RU", alpha3="RUS")
+        urgency = await urgency_maker()
+        visa_duration = await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY)
+        visa_type = await visa_type_maker(name="Business")
+        client = await test_individual.awaitable_attrs.individual_client
+        orders = [
+            await order_maker(
+                country=country,
+                client=client,
+                created_by=test_user,
+                urgency=urgency,
+                visa_duration=visa_duration,
+                visa_type=visa_type,
+            )
+            for _ in range(3)
+        ]
+        applicant = Applicant(
+            order_id=orders[1].id,
+            first_name="Anna",
+            last_name="Petrova",
+            email="anna.petrova@example.com",
+            gender=Applicant.GENDER_FEMALE
+        )
+        async_db.add(applicant)
+        await async_db.commit()
+
+        async def search(q: str) -> list[int]:
+            result = await orders_repo.get_projected_paginated_list(
+                schema=AdminOrderListSchema,
+                query_filters=AdminOrderFilterSchema(q=q),
+                page_params=PageParamsSchema(page=1, size=10)
+            )
+            return [item["id"] for item in result["items"]]
+
+        assert await search("petrov") == [orders[1].id]
+        assert await search("ANNA example") == [orders[1].id]
+        assert await search("anna ivanova") == []
+        assert await search(orders[2].number) == [orders[2].id]
+        # The order whose number matches ranks before the orders only matching by client name
+        assert (await search(f"{orders[0].number.split('-')[1]} {client.name.split()[0]}"))[0] == orders[0].id
+
+        applicant.last_name = "Ivanova"
+        applicant.email = "anna.ivanova@example.com"
+        client.name = "Globetrotters"
+        await async_db.commit()
+
+        assert await search("petrova") == []
+        assert await search("ivanova") == [orders[1].id]
+        assert await search("globetrot") == [order.id for order in orders]
+
+        await async_db.delete(applicant)
+        await async_db.commit()
+
+        assert await search("ivanova") == []
+
     @pytest.mark.asyncio
     async def test_get_by_id(
             self,
@@ -221,6 +358,274 @@ class TestOrdersRepository:
 
         assert order is None
 
+    @pytest.mark.asyncio
+    async def test_get_statuses_by_numbers(
+            self,
+            async_db: AsyncSession,
+            orders_repo: OrdersRepository,
+            order_maker: OrderMakerProtocol,
+            country_maker: CountryMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            test_individual: User,
+            urgency_maker: UrgencyMakerProtocol,
+            test_user: User
+    ) -> None:
+        country = await country_maker(name="Russia", alpha2="RU", alpha3="RUS")
+        urgency = await urgency_maker()
+        visa_duration = await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY)
+        visa_type = await visa_type_maker(name="Business")
+        client = await test_individual.awaitable_attrs.individual_client
+        orders = [
+            await order_maker(
+                country=country,
+                client=client,
+                created_by=test_user,
+                urgency=urgency,
+                visa_duration=visa_duration,
+                visa_type=visa_type,
+                status=status
+            )
+            for status in (OrderStatusEnum.NEW, OrderStatusEnum.COMPLETED, OrderStatusEnum.DRAFT)
+        ]
+        async_db.expunge_all()
+        stats = QueryStats()
+        token = query_stats.set(stats)
+
+        try:
+            result = await orders_repo.get_statuses_by_numbers(
+                numbers=[orders[1].number, "2000-0000", orders[0].number, orders[0].number]
+            )
+        finally:
+            query_stats.reset(token)
+
+        assert stats.statements == 1
+        # Rows, not ORM instances
+        assert len(async_db.identity_map) == 0
+        assert result == [
+            {"number": order.number, "status": order.status, "updated_at": order.updated_at}
+            for order in sorted(orders[:2], key=lambda order: order.number)
+        ]
+
+    def test_statuses_transitioning_to(self) -> None:
+        assert Order.get_statuses_transitioning_to(Order.STATUS_DRAFT) == ()
+        assert Order.get_statuses_transitioning_to(Order.STATUS_COMPLETED) == (Order.STATUS_IN_PROGRESS,)
+        assert Order.get_statuses_transitioning_to(Order.STATUS_CANCELED) == (
+            Order.STATUS_DRAFT, Order.STATUS_NEW, Order.STATUS_IN_PROGRESS
+        )
+
+    @pytest.mark.asyncio
+    async def test_transition_statuses(
+            self,
+            async_db: AsyncSession,
+            orders_repo: OrdersRepository,
+            order_maker: OrderMakerProtocol,
+            country_maker: CountryMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            test_individual: User,
+            urgency_maker: UrgencyMakerProtocol,
+            test_user: User
+    ) -> None:
+        country = await country_maker(name="Russia", alpha2="RU", alpha3="RUS")
+        urgency = await urgency_maker()
+        visa_duration = await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY)
+        visa_type = await visa_type_maker(name="Business")
+        client = await test_individual.awaitable_attrs.individual_client
+        orders = [
+            await order_maker(
+                country=country,
+                client=client,
+                created_by=test_user,
+                urgency=urgency,
+                visa_duration=visa_duration,
+                visa_type=visa_type,
+                status=status
+            )
+            for status in (OrderStatusEnum.DRAFT, OrderStatusEnum.NEW, OrderStatusEnum.CANCELED)
+        ]
+        stats = QueryStats()
+        token = query_stats.set(stats)
+
+        try:
+            result = await orders_repo.transition_statuses(
+                order_ids=[order.id for order in orders], status=Order.STATUS_CANCELED
+            )
+        finally:
+            query_stats.reset(token)
+
+        assert stats.statements == 1
+        assert [(row["id"], row["old_status"], row["status"]) for row in result] == [
+            (orders[0].id, Order.STATUS_DRAFT, Order.STATUS_CANCELED),
+            (orders[1].id, Order.STATUS_NEW, Order.STATUS_CANCELED),
+        ]
+        assert result[0]["number"] == orders[0].number
+        assert result[0]["client_type"] == client.type
+        assert result[0]["client_email"] == client.email
+
+        statuses = await async_db.scalars(
+            select(Order.status).where(Order.id.in_([order.id for order in orders])).order_by(Order.id)
+        )
+        assert statuses.all() == [Order.STATUS_CANCELED] * 3
+        assert await orders_repo.transition_statuses(order_ids=[orders[0].id], status=Order.STATUS_DRAFT) == []
+
+    @pytest.mark.asyncio
+    async def test_due_at(
+            self,
+            async_db: AsyncSession,
+            order_maker: OrderMakerProtocol,
+            country_maker: CountryMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            test_individual: User,
+            urgency_maker: UrgencyMakerProtocol,
+            test_user: User
+    ) -> None:
+        """Test that the due time follows the creation time, the urgency and its processing window"""
+        express = await urgency_maker(processing_hours=24)
+        standard = await urgency_maker()
+        order = await order_maker(
+            country=await country_maker(name="Russia", alpha2="RU", alpha3="RUS"),
+            client=await test_individual.awaitable_attrs.individual_client,
+            created_by=test_user,
+            urgency=express,
+            visa_duration=await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY),
+            visa_type=await visa_type_maker(name="Business"),
+            status=OrderStatusEnum.NEW
+        )
+
+        assert order.due_at == order.created_at + timedelta(hours=24)
+
+        order.urgency_id = standard.id
+        await async_db.commit()
+        await async_db.refresh(order)
+
+        assert order.due_at is None
+
+        standard.processing_hours = 72
+        await async_db.commit()
+        await async_db.refresh(order)
+
+        assert order.due_at == order.created_at + timedelta(hours=72)
+
+    @pytest.mark.asyncio
+    async def test_claim_overdue(
+            self,
+            async_db: AsyncSession,
+            orders_repo: OrdersRepository,
+            order_maker: OrderMakerProtocol,
+            country_maker: CountryMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            test_individual: User,
+            urgency_maker: UrgencyMakerProtocol,
+            test_user: User
+    ) -> None:
+        express = await urgency_maker(processing_hours=24)
+        criteria = dict(
+            country=await country_maker(name="Russia", alpha2="RU", alpha3="RUS"),
+            client=await test_individual.awaitable_attrs.individual_client,
+            created_by=test_user,
+            visa_duration=await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY),
+            visa_type=await visa_type_maker(name="Business"),
+        )
+        overdue, completed, _, without_window = [
+            await order_maker(**criteria, urgency=urgency, status=status)
+            for urgency, status in (
+                (express, OrderStatusEnum.NEW),
+                (express, OrderStatusEnum.COMPLETED),
+                (express, OrderStatusEnum.IN_PROGRESS),
+                (await urgency_maker(), OrderStatusEnum.NEW),
+            )
+        ]
+        # Created two days ago, the due times move with the creation times
+        await async_db.execute(
+            update(Order)
+            .where(Order.id.in_([overdue.id, completed.id, without_window.id]))
+            .values(created_at=Order.created_at - timedelta(days=2))
+        )
+        await async_db.commit()
+        stats = QueryStats()
+        token = query_stats.set(stats)
+
+        try:
+            result = await orders_repo.claim_overdue(limit=10)
+        finally:
+            query_stats.reset(token)
+
+        assert stats.statements == 1
+        assert [(row["id"], row["number"], row["status"]) for row in result] == [
+            (overdue.id, overdue.number, Order.STATUS_NEW)
+        ]
+        assert result[0]["due_at"] < datetime.now()
+        assert await orders_repo.claim_overdue(limit=10) == []
+
+    @pytest.mark.asyncio
+    async def test_archive_finished(
+            self,
+            async_db: AsyncSession,
+            orders_repo: OrdersRepository,
+            order_maker: OrderMakerProtocol,
+            country_maker: CountryMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            test_individual: User,
+            urgency_maker: UrgencyMakerProtocol,
+            test_user: User
+    ) -> None:
+        criteria = dict(
+            country=await country_maker(name="Russia", alpha2="RU", alpha3="RUS"),
+            client=await test_individual.awaitable_attrs.individual_client,
+            created_by=test_user,
+            urgency=await urgency_maker(),
+            visa_duration=await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY),
+            visa_type=await visa_type_maker(name="Business"),
+        )
+        completed, canceled, in_progress, recent = [
+            await order_maker(**criteria, status=status)
+            for status in (
+                OrderStatusEnum.COMPLETED,
+                OrderStatusEnum.CANCELED,
+                OrderStatusEnum.IN_PROGRESS,
+                OrderStatusEnum.COMPLETED,
+            )
+        ]
+        updated_at = datetime.now() - timedelta(days=200)
+        await async_db.execute(
+            update(Order)
+            .where(Order.id.in_([completed.id, canceled.id, in_progress.id]))
+            .values(updated_at=updated_at)
+        )
+        await async_db.commit()
+        stats = QueryStats()
+        token = query_stats.set(stats)
+
+        try:
+            result = await orders_repo.archive_finished(before=datetime.now() - timedelta(days=180), limit=10)
+        finally:
+            query_stats.reset(token)
+
+        assert stats.statements == 1
+        assert result == sorted([completed.id, canceled.id])
+        assert await orders_repo.archive_finished(before=datetime.now() - timedelta(days=180), limit=10) == []
+
+        await async_db.refresh(completed)
+        assert completed.archived_at is not None
+        assert completed.updated_at == updated_at
+
+        page_params = PageParamsSchema(page=1, size=10)
+        result = await orders_repo.get_projected_paginated_list(
+            schema=AdminOrderListSchema, query_filters=AdminOrderFilterSchema(), page_params=page_params
+        )
+        assert [item["id"] for item in result["items"]] == [in_progress.id, recent.id]
+
+        result = await orders_repo.get_projected_paginated_list(
+            schema=AdminOrderListSchema,
+            query_filters=AdminOrderFilterSchema(include_archived=True),
+            page_params=page_params
+        )
+        assert result["total"] == 4
+
     @pytest.mark.asyncio
     async def test_create_order(
             self,
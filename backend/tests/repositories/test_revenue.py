@@ -0,0 +1,158 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.repositories.revenue import RevenueRepository
+from app.helpers import add_months
+from app.models import Order, OrderService, Service, User, VisaDuration
+from app.schemas.order.base import OrderStatusEnum
+from app.schemas.revenue import RevenueDimensionEnum, RevenueFilterSchema
+from app.schemas.service import FeeTypeEnum
+from tests.conftest import (
+    OrderMakerProtocol,
+    CountryMakerProtocol,
+    UrgencyMakerProtocol,
+    VisaTypeMakerProtocol,
+    VisaDurationMakerProtocol
+)
+
+
+class TestRevenueRepository:
+    """Tests for the revenue report."""
+
+    @pytest.fixture
+    def revenue_repo(self, async_db: AsyncSession) -> RevenueRepository:
+        return RevenueRepository(async_db)
+
+    @pytest_asyncio.fixture
+    async def order_services(
+            self,
+            async_db: AsyncSession,
+            order_maker: OrderMakerProtocol,
+            country_maker: CountryMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            test_individual: User,
+            urgency_maker: UrgencyMakerProtocol,
+            service_maker,
+            test_user: User
+    ) -> list[OrderService]:
+        """Services of an order of the current month, an order of the previous month and a
+        canceled order"""
+        criteria = dict(
+            country=await country_maker(name="Russia", alpha2="RU", alpha3="RUS"),
+            client=await test_individual.awaitable_attrs.individual_client,
+            created_by=test_user,
+            urgency=await urgency_maker(),
+            visa_duration=await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY),
+            visa_type=await visa_type_maker(name="Business"),
+        )
+        consular = await service_maker(fee_type=FeeTypeEnum.CONSULAR)
+        general = await service_maker(fee_type=FeeTypeEnum.GENERAL)
+        current, previous, canceled = [
+            await order_maker(**criteria, status=order_status)
+            for order_status in (OrderStatusEnum.NEW, OrderStatusEnum.COMPLETED, OrderStatusEnum.CANCELED)
+        ]
+        previous_month = add_months(date.today().replace(day=1), -1)
+        await async_db.execute(
+            update(Order).where(Order.id == previous.id).values(created_at=datetime(
+                previous_month.year, previous_month.month, 15
+            ))
+        )
+        order_services = [
+            OrderService(price=Decimal(price), tax=Decimal("0.2"), order_id=order.id, service_id=service.id)
+            for order, service, price in (
+                (current, consular, "100"),
+                (current, general, "50"),
+                (previous, consular, "200"),
+                (canceled, general, "1000"),
+            )
+        ]
+        async_db.add_all(order_services)
+        await async_db.commit()
+        return order_services
+
+    @pytest.mark.asyncio
+    async def test_get_revenue(
+            self,
+            revenue_repo: RevenueRepository,
+            order_services: list[OrderService]
+    ) -> None:
+        current_month = date.today().replace(day=1)
+        previous_month = add_months(current_month, -1)
+        result = await revenue_repo.get_revenue(
+            query_filters=RevenueFilterSchema(group_by=[RevenueDimensionEnum.MONTH, RevenueDimensionEnum.FEE_TYPE])
+        )
+
+        assert result["month_from"] == add_months(current_month, -11)
+        assert result["month_to"] == current_month
+        assert (result["revenue"], result["tax"], result["total"]) == (Decimal(350), Decimal(70), Decimal(420))
+        assert result["items"] == [
+            {
+                "month": previous_month,
+                "fee_type": Service.FEE_TYPE_CONSULAR,
+                "services": 1,
+                "revenue": Decimal(200),
+                "tax": Decimal(40),
+                "total": Decimal(240),
+            },
+            {
+                "month": current_month,
+                "fee_type": Service.FEE_TYPE_CONSULAR,
+                "services": 1,
+                "revenue": Decimal(100),
+                "tax": Decimal(20),
+                "total": Decimal(120),
+            },
+            {
+                "month": current_month,
+                "fee_type": Service.FEE_TYPE_GENERAL,
+                "services": 1,
+                "revenue": Decimal(50),
+                "tax": Decimal(10),
+                "total": Decimal(60),
+            },
+        ]
+
+        result = await revenue_repo.get_revenue(
+            query_filters=RevenueFilterSchema(group_by=[], fee_type=FeeTypeEnum.CONSULAR)
+        )
+
+        assert result["items"] == [
+            {"services": 2, "revenue": Decimal(300), "tax": Decimal(60), "total": Decimal(360)}
+        ]
+
+        result = await revenue_repo.get_revenue(
+            query_filters=RevenueFilterSchema(
+                month_from=add_months(current_month, 1), month_to=add_months(current_month, 2)
+            )
+        )
+
+        assert result["total"] == 0
+        assert result["items"] == []
+
+    @pytest.mark.asyncio
+    async def test_closed_months_are_cached(
+            self,
+            async_db: AsyncSession,
+            revenue_repo: RevenueRepository,
+            order_services: list[OrderService]
+    ) -> None:
+        """Test that only the current month is recomputed once the closed months are cached"""
+        query_filters = RevenueFilterSchema(group_by=[RevenueDimensionEnum.MONTH])
+        await revenue_repo.get_revenue(query_filters=query_filters)
+
+        await async_db.execute(update(OrderService).values(total=OrderService.total + 1))
+        await async_db.commit()
+        result = await revenue_repo.get_revenue(query_filters=query_filters)
+
+        assert [item["total"] for item in result["items"]] == [Decimal(240), Decimal(182)]
+
+        await RevenueRepository.cache.clear()
+        result = await revenue_repo.get_revenue(query_filters=query_filters)
+
+        assert [item["total"] for item in result["items"]] == [Decimal(241), Decimal(182)]
@@ -219,3 +219,64 @@ class TestServicesRepository:
         service = await services_repo.update(service_id=1000, data=new_data)
 
         assert service is None
+
+    @pytest.mark.asyncio
+    async def test_update_service_creates_tariff_version(
+            self,
+            async_db: AsyncSession,
+            services_repo: ServicesRepository,
+            test_tariff: Tariff,
+            service_maker
+    ) -> None:
+        """Test that repricing writes a new active version and keeps the previous one"""
+        other = await service_maker(
+            fee_type=FeeTypeEnum.GENERAL,
+            tariff_services=[TariffServiceCreateSchema(price=Decimal(20), tax=Decimal(0), tariff_id=test_tariff.id)]
+        )
+        service = await service_maker(
+            fee_type=FeeTypeEnum.GENERAL,
+            tariff_services=[TariffServiceCreateSchema(price=Decimal(10), tax=Decimal(0), tariff_id=test_tariff.id)]
+        )
+        await async_db.refresh(test_tariff)
+        old_version_id = test_tariff.active_version_id
+        old_rows = await services_repo.tariffs_repo.get_price_rows(version_id=old_version_id)
+
+        await services_repo.update(
+            service_id=service.id,
+            data=ServiceUpdateSchema(
+                tariff_services=[TariffServiceUpdateSchema(price=Decimal(15), tax=Decimal(0), tariff_id=test_tariff.id)]
+            )
+        )
+        await async_db.refresh(test_tariff)
+
+        assert test_tariff.active_version_id != old_version_id
+        # The previous version is left untouched
+        assert await services_repo.tariffs_repo.get_price_rows(version_id=old_version_id) == old_rows
+        # The new version copies the prices of the other services
+        new_rows = await services_repo.tariffs_repo.get_price_rows(version_id=test_tariff.active_version_id)
+        assert {(row.service_id, row.price) for row in new_rows} == {(other.id, Decimal(20)), (service.id, Decimal(15))}
+        assert [ts.price for ts in service.tariff_services] == [Decimal(15)]
+        assert [ts.price for ts in (await services_repo.get_by_id(service_id=other.id)).tariff_services] == [Decimal(20)]
+
+    @pytest.mark.asyncio
+    async def test_update_service_removes_tariff(
+            self,
+            async_db: AsyncSession,
+            services_repo: ServicesRepository,
+            test_tariff: Tariff,
+            service_maker
+    ) -> None:
+        """Test that dropping a tariff from a service removes it from the active version only"""
+        service = await service_maker(
+            fee_type=FeeTypeEnum.GENERAL,
+            tariff_services=[TariffServiceCreateSchema(price=Decimal(10), tax=Decimal(0), tariff_id=test_tariff.id)]
+        )
+        await async_db.refresh(test_tariff)
+        old_version_id = test_tariff.active_version_id
+
+        service = await services_repo.update(service_id=service.id, data=ServiceUpdateSchema(tariff_services=[]))
+        await async_db.refresh(test_tariff)
+
+        assert service.tariff_services == []
+        assert await services_repo.tariffs_repo.get_price_rows(version_id=test_tariff.active_version_id) == []
+        assert len(await services_repo.tariffs_repo.get_price_rows(version_id=old_version_id)) == 1
@@ -0,0 +1,126 @@
+from datetime import date, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.repositories.orders import OrdersRepository
+from app.database.repositories.stats import OrderStatsRepository
+from app.models import Order, OrderStatsDaily, User, VisaDuration
+from app.schemas.order.base import OrderStatusEnum
+from app.schemas.stats import OrderStatsDimensionEnum, OrderStatsFilterSchema
+from tests.conftest import (
+    OrderMakerProtocol,
+    CountryMakerProtocol,
+    UrgencyMakerProtocol,
+    VisaTypeMakerProtocol,
+    VisaDurationMakerProtocol
+)
+
+
+class TestOrderStatsRepository:
+    """Tests for the order statistics rollups."""
+
+    @pytest.fixture
+    def stats_repo(self, async_db: AsyncSession) -> OrderStatsRepository:
+        return OrderStatsRepository(async_db)
+
+    @pytest_asyncio.fixture
+    async def orders(
+            self,
+            order_maker: OrderMakerProtocol,
+            country_maker: CountryMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            test_individual: User,
+            urgency_maker: UrgencyMakerProtocol,
+            test_user: User
+    ) -> list[Order]:
+        countries = [
+            await country_maker(name="Russia", alpha2="RU", alpha3="RUS"),
+            await country_maker(name="Germany", alpha2="DE", alpha3="DEU"),
+        ]
+        urgency = await urgency_maker()
+        visa_duration = await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY)
+        visa_type = await visa_type_maker(name="Business")
+        client = await test_individual.awaitable_attrs.individual_client
+        return [
+            await order_maker(
+                country=country,
+                client=client,
+                created_by=test_user,
+                urgency=urgency,
+                visa_duration=visa_duration,
+                visa_type=visa_type,
+                status=status
+            )
+            for country, status in (
+                (countries[0], OrderStatusEnum.NEW),
+                (countries[0], OrderStatusEnum.NEW),
+                (countries[1], OrderStatusEnum.NEW),
+                (countries[1], OrderStatusEnum.DRAFT),
+            )
+        ]
+
+    @staticmethod
+    async def assert_rollup_matches_orders(async_db: AsyncSession) -> None:
+        dimensions = ("status", "country_id", "visa_type_id", "urgency_id", "client_id")
+        expected = await async_db.execute(
+            select(func.date(Order.created_at), *(getattr(Order, name) for name in dimensions), func.count())
+            .group_by(func.date(Order.created_at), *(getattr(Order, name) for name in dimensions))
+        )
+        rollup = await async_db.execute(
+            select(OrderStatsDaily.day, *(getattr(OrderStatsDaily, name) for name in dimensions), OrderStatsDaily.orders)
+            .where(OrderStatsDaily.orders > 0)
+        )
+        assert sorted(map(tuple, rollup)) == sorted(map(tuple, expected))
+
+    @pytest.mark.asyncio
+    async def test_rollup_maintenance(self, async_db: AsyncSession, orders: list[Order]) -> None:
+        """Test that the rollup follows inserts, status and dimension changes, and deletes"""
+        await self.assert_rollup_matches_orders(async_db)
+
+        await OrdersRepository(async_db).transition_statuses(
+            order_ids=[order.id for order in orders], status=Order.STATUS_IN_PROGRESS
+        )
+        await self.assert_rollup_matches_orders(async_db)
+
+        orders[3].country_id = orders[0].country_id
+        await async_db.commit()
+        await self.assert_rollup_matches_orders(async_db)
+
+        await async_db.delete(orders[0])
+        await async_db.commit()
+        await self.assert_rollup_matches_orders(async_db)
+
+    @pytest.mark.asyncio
+    async def test_get_order_counts(self, stats_repo: OrderStatsRepository, orders: list[Order]) -> None:
+        today = date.today()
+        result = await stats_repo.get_order_counts(
+            query_filters=OrderStatsFilterSchema(
+                group_by=[OrderStatsDimensionEnum.COUNTRY, OrderStatsDimensionEnum.STATUS]
+            )
+        )
+
+        assert result["date_from"] == today - timedelta(days=30)
+        assert result["date_to"] == today
+        assert result["total"] == 4
+        assert result["items"] == sorted([
+            {"country_id": orders[0].country_id, "status": Order.STATUS_NEW, "orders": 2},
+            {"country_id": orders[2].country_id, "status": Order.STATUS_DRAFT, "orders": 1},
+            {"country_id": orders[2].country_id, "status": Order.STATUS_NEW, "orders": 1},
+        ], key=lambda item: (item["country_id"], item["status"]))
+
+        result = await stats_repo.get_order_counts(
+            query_filters=OrderStatsFilterSchema(group_by=[], status=OrderStatusEnum.NEW)
+        )
+
+        assert result["items"] == [{"orders": 3}]
+
+        result = await stats_repo.get_order_counts(
+            query_filters=OrderStatsFilterSchema(date_from=today + timedelta(days=1), date_to=today + timedelta(days=2))
+        )
+
+        assert result["total"] == 0
+        assert result["items"] == []
@@ -71,6 +71,17 @@ class TestUrgenciesRepository:
         assert isinstance(urgency, Urgency)
         assert urgency.name == data.name
 
+    @pytest.mark.asyncio
+    async def test_update_urgency_keeps_unset_fields(self, urgencies_repo: UrgenciesRepository, urgency_maker: UrgencyMakerProtocol) -> None:
+        urgency = await urgency_maker(processing_hours=48)
+
+        await urgencies_repo.update(urgency_id=urgency.id, data=UrgencyUpdateSchema(name="New name"))
+        assert urgency.name == "New name"
+        assert urgency.processing_hours == 48
+
+        await urgencies_repo.update(urgency_id=urgency.id, data=UrgencyUpdateSchema(name="New name", processing_hours=None))
+        assert urgency.processing_hours is None
+
     @pytest.mark.asyncio
     async def test_update_urgency_not_found(self, urgencies_repo: UrgenciesRepository) -> None:
         data = UrgencyUpdateSchema(name="New name")
@@ -0,0 +1,100 @@
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.repositories.audit import AuditRepository
+from app.models.audit import LogEntry
+from app.models.users import User
+from app.schemas.audit import LogEntryCreateSchema
+from app.services import jwt_service
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestAudit:
+
+    @pytest.fixture
+    def access_token(self, test_admin: User) -> str:
+        return jwt_service.create_token_pair(user=test_admin).access
+
+    async def test_list_keyset_pagination(
+            self,
+            app: FastAPI,
+            async_client: AsyncClient,
+            async_db: AsyncSession,
+            test_admin: User,
+            access_token: str,
+    ) -> None:
+        audit_repo = AuditRepository(async_db)
+        entries = [
+            await audit_repo.create(
+                data=LogEntryCreateSchema(
+                    user_id=test_admin.id,
+                    action=LogEntry.ACTION_UPDATE,
+                    model_type="order",
+                    target_id=target_id
+                )
+            )
+            for target_id in range(3)
+        ]
+        await audit_repo.create(data=LogEntryCreateSchema(action=LogEntry.ACTION_LOGIN))
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        response = await async_client.get(
+            url=app.url_path_for("admin:audit-list"),
+            params={"user_id": test_admin.id, "size": 2},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_200_OK
+        first_page = response.json()
+        assert [item["id"] for item in first_page["items"]] == [entries[2].id, entries[1].id]
+        assert first_page["items"][0]["target_id"] == 2
+        assert first_page["next_cursor"] is not None
+
+        response = await async_client.get(
+            url=app.url_path_for("admin:audit-list"),
+            params={"user_id": test_admin.id, "size": 2, "cursor": first_page["next_cursor"]},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_200_OK
+        second_page = response.json()
+        assert [item["id"] for item in second_page["items"]] == [entries[0].id]
+        assert second_page["next_cursor"] is None
+
+    async def test_target_list(
+            self,
+            app: FastAPI,
+            async_client: AsyncClient,
+            async_db: AsyncSession,
+            test_admin: User,
+            access_token: str,
+    ) -> None:
+        audit_repo = AuditRepository(async_db)
+        created = await audit_repo.create(
+            data=LogEntryCreateSchema(user_id=test_admin.id, action=LogEntry.ACTION_CREATE, model_type="order", target_id=1)
+        )
+        await audit_repo.create(
+            data=LogEntryCreateSchema(user_id=test_admin.id, action=LogEntry.ACTION_CREATE, model_type="order", target_id=2)
+        )
+
+        response = await async_client.get(
+            url=app.url_path_for("admin:audit-target-list", model_type="order", target_id=1),
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()["items"]] == [created.id]
+
+    async def test_list_invalid_cursor(
+            self,
+            app: FastAPI,
+            async_client: AsyncClient,
+            access_token: str,
+    ) -> None:
+        response = await async_client.get(
+            url=app.url_path_for("admin:audit-list"),
+            params={"cursor": "not-a-cursor"},
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json() == {"detail": "Invalid cursor"}
@@ -4,6 +4,7 @@ import pytest
 from fastapi import FastAPI, status
 from fastapi_mail import FastMail
 from httpx import AsyncClient
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import mail_config, BACKEND_URL
@@ -14,7 +15,7 @@ from app.schemas.applicant import ApplicantCreateUpdateSchema, ApplicantGenderEn
 from app.schemas.core import STRFTIME_FORMAT
 from app.schemas.order.admin import AdminOrderCreateSchema, AdminOrderUpdateSchema
 from app.schemas.order.base import OrderStatusEnum
-from app.services import jwt_service
+from app.services import cache_service, jwt_service
 from tests.conftest import (
     OrderMakerProtocol,
     CountryMakerProtocol,
@@ -83,6 +84,50 @@ class TestAdminOrdersRoutes:
         assert response.json()["has_prev"] is False
         assert len(response.json()["items"]) == 2
 
+    @pytest.mark.asyncio
+    async def test_list_search(
+            self,
+            app: FastAPI,
+            async_client: AsyncClient,
+            order_maker: OrderMakerProtocol,
+            country_maker: CountryMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            test_individual: User,
+            urgency_maker: UrgencyMakerProtocol,
+            test_admin: User,
+            access_token: str
+    ) -> None:
+        country = await country_maker(name="Russia", alpha2="RU", alpha3="RUS")
+        urgency = await urgency_maker()
+        visa_duration = await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY)
+        visa_type = await visa_type_maker(name="Business")
+        client = await test_individual.awaitable_attrs.individual_client
+        orders = [
+            await order_maker(
+                country=country,
+                client=client,
+                created_by=test_admin,
+                urgency=urgency,
+                visa_duration=visa_duration,
+                visa_type=visa_type,
+                status=OrderStatusEnum.DRAFT
+            )
+            for _ in range(2)
+        ]
+
+        response = await async_client.get(
+            url=app.url_path_for("admin:order-list"),
+            params={"q": orders[1].number},
+            headers={
+                "Authorization": f"Bearer {access_token}"
+            }
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["total"] == 1
+        assert response.json()["items"][0]["number"] == orders[1].number
+
 
     @pytest.mark.asyncio
     async def test_get_by_id(
@@ -169,6 +214,227 @@ class TestAdminOrdersRoutes:
         assert response.json()["completed_at"] is None
         assert response.json()["archived_at"] is None
 
+    @pytest.mark.asyncio
+    async def test_statuses(
+            self,
+            app: FastAPI,
+            async_client: AsyncClient,
+            order_maker: OrderMakerProtocol,
+            country_maker: CountryMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            test_individual: User,
+            urgency_maker: UrgencyMakerProtocol,
+            test_admin: User,
+            access_token: str
+    ) -> None:
+        country = await country_maker(name="Russia", alpha2="RU", alpha3="RUS")
+        urgency = await urgency_maker()
+        visa_duration = await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY)
+        visa_type = await visa_type_maker(name="Business")
+        client = await test_individual.awaitable_attrs.individual_client
+        order = await order_maker(
+            country=country,
+            client=client,
+            created_by=test_admin,
+            urgency=urgency,
+            visa_duration=visa_duration,
+            visa_type=visa_type,
+            status=OrderStatusEnum.IN_PROGRESS
+        )
+
+        response = await async_client.post(
+            url=app.url_path_for("admin:order-statuses"),
+            json={"numbers": [order.number, "2000-0000"]},
+            headers={
+                "Authorization": f"Bearer {access_token}"
+            }
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "items": [
+                {
+                    "number": order.number,
+                    "status": OrderStatusEnum.IN_PROGRESS.value,
+                    "updated_at": order.updated_at.strftime(STRFTIME_FORMAT),
+                }
+            ]
+        }
+
+    @pytest.mark.asyncio
+    async def test_statuses_validation(self, app: FastAPI, async_client: AsyncClient, access_token: str) -> None:
+        for numbers in ([], ["2025-0001"] * 5001):
+            response = await async_client.post(
+                url=app.url_path_for("admin:order-statuses"),
+                json={"numbers": numbers},
+                headers={
+                    "Authorization": f"Bearer {access_token}"
+                }
+            )
+
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.asyncio
+    async def test_status_transition(
+            self,
+            app: FastAPI,
+            async_client: AsyncClient,
+            async_db: AsyncSession,
+            order_maker: OrderMakerProtocol,
+            country_maker: CountryMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            test_individual: User,
+            urgency_maker: UrgencyMakerProtocol,
+            test_admin: User,
+            access_token: str,
+            fastapi_mail: FastMail,
+            audit_rpo: AuditRepository
+    ) -> None:
+        country = await country_maker(name="Russia", alpha2="RU", alpha3="RUS")
+        urgency = await urgency_maker()
+        visa_duration = await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY)
+        visa_type = await visa_type_maker(name="Business")
+        client = await test_individual.awaitable_attrs.individual_client
+        draft, in_progress, completed = [
+            await order_maker(
+                country=country,
+                client=client,
+                created_by=test_admin,
+                urgency=urgency,
+                visa_duration=visa_duration,
+                visa_type=visa_type,
+                status=order_status
+            )
+            for order_status in (OrderStatusEnum.DRAFT, OrderStatusEnum.IN_PROGRESS, OrderStatusEnum.COMPLETED)
+        ]
+
+        with fastapi_mail.record_messages() as outbox:
+            response = await async_client.post(
+                url=app.url_path_for("admin:order-status-transition"),
+                json={"order_ids": [draft.id, in_progress.id, completed.id, 10000], "status": OrderStatusEnum.COMPLETED},
+                headers={
+                    "Authorization": f"Bearer {access_token}"
+                }
+            )
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json()["skipped_ids"] == [draft.id, completed.id, 10000]
+            assert len(response.json()["items"]) == 1
+            assert response.json()["items"][0]["id"] == in_progress.id
+            assert response.json()["items"][0]["number"] == in_progress.number
+            assert response.json()["items"][0]["old_status"] == OrderStatusEnum.IN_PROGRESS
+            assert response.json()["items"][0]["status"] == OrderStatusEnum.COMPLETED
+
+            await async_db.refresh(in_progress)
+            await async_db.refresh(draft)
+            assert in_progress.status == Order.STATUS_COMPLETED
+            assert in_progress.completed_at is not None
+            assert draft.status == Order.STATUS_DRAFT
+
+            logs = await audit_rpo.get_for_user(user_id=test_admin.id)
+            assert len(logs) == 1
+            assert logs[0].action == LogEntry.ACTION_UPDATE
+            assert logs[0].model_type == Order.get_model_type()
+            assert logs[0].target_id == in_progress.id
+
+            assert len(outbox) == 1
+            assert outbox[0]["to"] == client.email
+            assert outbox[0]["subject"] == f"Order #{in_progress.number} status updated"
+
+    @pytest.mark.asyncio
+    async def test_status_transition_to_draft(
+            self, app: FastAPI, async_client: AsyncClient, access_token: str
+    ) -> None:
+        response = await async_client.post(
+            url=app.url_path_for("admin:order-status-transition"),
+            json={"order_ids": [1], "status": OrderStatusEnum.DRAFT},
+            headers={
+                "Authorization": f"Bearer {access_token}"
+            }
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == "Orders cannot be moved to draft"
+
+    @pytest.mark.asyncio
+    async def test_status_history(
+            self,
+            app: FastAPI,
+            async_client: AsyncClient,
+            order_maker: OrderMakerProtocol,
+            country_maker: CountryMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            test_individual: User,
+            urgency_maker: UrgencyMakerProtocol,
+            test_admin: User,
+            access_token: str
+    ) -> None:
+        country = await country_maker(name="Russia", alpha2="RU", alpha3="RUS")
+        urgency = await urgency_maker()
+        visa_duration = await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY)
+        visa_type = await visa_type_maker(name="Business")
+        client = await test_individual.awaitable_attrs.individual_client
+        order = await order_maker(
+            country=country,
+            client=client,
+            created_by=test_admin,
+            urgency=urgency,
+            visa_duration=visa_duration,
+            visa_type=visa_type,
+            status=OrderStatusEnum.NEW
+        )
+        headers = {
+            "Authorization": f"Bearer {access_token}"
+        }
+
+        response = await async_client.post(
+            url=app.url_path_for("admin:order-status-transition"),
+            json={"order_ids": [order.id], "status": OrderStatusEnum.CANCELED},
+            headers=headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await async_client.get(
+            url=app.url_path_for("admin:order-status-history", order_id=order.id),
+            headers=headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        items = response.json()["items"]
+        assert [(item["old_status"], item["status"]) for item in items] == [
+            (None, OrderStatusEnum.NEW),
+            (OrderStatusEnum.NEW, OrderStatusEnum.CANCELED),
+        ]
+        assert items[0]["left_at"] == items[1]["created_at"]
+        assert items[1]["left_at"] is None
+
+        response = await async_client.get(
+            url=app.url_path_for("admin:order-status-durations"),
+            params={"status": OrderStatusEnum.NEW.value},
+            headers=headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["status"] == OrderStatusEnum.NEW
+        assert response.json()["completed"] == 1
+        assert response.json()["open"] == 0
+        assert response.json()["p50"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_status_history_not_found(self, app: FastAPI, async_client: AsyncClient, access_token: str) -> None:
+        response = await async_client.get(
+            url=app.url_path_for("admin:order-status-history", order_id=10000),
+            headers={
+                "Authorization": f"Bearer {access_token}"
+            }
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json()["detail"] == "Order not found"
+
     @pytest.mark.asyncio
     async def test_get_by_id_not_found(
             self,
@@ -301,6 +567,91 @@ class TestAdminOrdersRoutes:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert response.json()["detail"] == "Failed to create order"
 
+    @pytest.mark.asyncio
+    async def test_create_order_idempotency(
+            self,
+            app: FastAPI,
+            async_db: AsyncSession,
+            async_client: AsyncClient,
+            country_maker: CountryMakerProtocol,
+            urgency_maker: UrgencyMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            test_individual: User,
+            access_token: str
+    ) -> None:
+        country = await country_maker(name="Russia", alpha2="RU", alpha3="RUS", available_for_order=True)
+        visa_duration = await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY)
+        data = AdminOrderCreateSchema(
+            country_id=country.id,
+            client_id=test_individual.individual_client_id,
+            urgency_id=(await urgency_maker()).id,
+            visa_duration_id=visa_duration.id,
+            visa_type_id=(await visa_type_maker(name="Tourist")).id,
+        )
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Idempotency-Key": "order-1",
+        }
+        response = await async_client.post(
+            url=app.url_path_for("admin:order-create"), json=data.model_dump(), headers=headers
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert "idempotent-replayed" not in response.headers
+
+        # Replayed from the cache, then from the table
+        for reset_cache in (False, True):
+            if reset_cache:
+                cache_service.reset_local()
+
+            retry = await async_client.post(
+                url=app.url_path_for("admin:order-create"), json=data.model_dump(), headers=headers
+            )
+
+            assert retry.status_code == status.HTTP_201_CREATED
+            assert retry.headers["idempotent-replayed"] == "true"
+            assert retry.json() == response.json()
+
+        assert await async_db.scalar(select(func.count()).select_from(Order)) == 1
+
+        response = await async_client.post(
+            url=app.url_path_for("admin:order-create"),
+            json=data.model_dump() | {"visa_type_id": 1000},
+            headers=headers
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.asyncio
+    async def test_create_order_idempotency_with_exception(
+            self,
+            app: FastAPI,
+            async_client: AsyncClient,
+            access_token: str
+    ) -> None:
+        """Test that a failed request releases its key, so that its retries are handled again"""
+        data = AdminOrderCreateSchema(
+            country_id=1000,
+            client_id=1000,
+            urgency_id=1000,
+            visa_duration_id=1000,
+            visa_type_id=1000,
+        )
+
+        for _ in range(2):
+            response = await async_client.post(
+                url=app.url_path_for("admin:order-create"),
+                json=data.model_dump(),
+                headers={
+                    "Authorization": f"Bearer {access_token}",
+                    "Idempotency-Key": "order-1",
+                }
+            )
+
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert response.json()["detail"] == "Failed to create order"
+
     @pytest.mark.asyncio
     async def test_update_order(
             self,
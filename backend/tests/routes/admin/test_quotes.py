@@ -0,0 +1,163 @@
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.repositories.services import ServicesRepository
+from app.models import Client, Country, Tariff, TariffService, User, VisaDuration
+from app.schemas.client import ClientTypeEnum
+from app.schemas.service import (
+    FeeTypeEnum,
+    ServiceCreateSchema,
+    ServiceUpdateSchema,
+    TariffServiceCreateSchema,
+    TariffServiceUpdateSchema
+)
+from app.services import jwt_service, price_quote_service
+from tests.conftest import CountryMakerProtocol, UrgencyMakerProtocol, VisaDurationMakerProtocol, VisaTypeMakerProtocol
+
+
+class TestQuotesRoutes:
+
+    @pytest.fixture
+    def access_token(self, test_admin: User) -> str:
+        return jwt_service.create_token_pair(user=test_admin).access
+
+    @pytest.fixture
+    def services_repo(self, async_db: AsyncSession) -> ServicesRepository:
+        return ServicesRepository(async_db)
+
+    @pytest_asyncio.fixture
+    async def order_criteria(
+            self,
+            country_maker: CountryMakerProtocol,
+            urgency_maker: UrgencyMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+    ) -> dict[str, int]:
+        country: Country = await country_maker(name="Russia", alpha2="RU", alpha3="RUS", available_for_order=True)
+        urgency = await urgency_maker()
+        visa_duration = await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY)
+        visa_type = await visa_type_maker(name="Business")
+        return {
+            "country_id": country.id,
+            "urgency_id": urgency.id,
+            "visa_duration_id": visa_duration.id,
+            "visa_type_id": visa_type.id,
+        }
+
+    @pytest.mark.asyncio
+    async def test_quote(
+            self,
+            app: FastAPI,
+            async_client: AsyncClient,
+            access_token: str,
+            client_maker,
+            services_repo: ServicesRepository,
+            test_tariff: Tariff,
+            order_criteria: dict[str, int],
+            urgency_maker: UrgencyMakerProtocol,
+    ) -> None:
+        client: Client = await client_maker(type=ClientTypeEnum.LEGAL)
+        other_urgency = await urgency_maker()
+        generic = await services_repo.create(
+            data=ServiceCreateSchema(
+                name="A Generic",
+                fee_type=FeeTypeEnum.GENERAL,
+                tariff_services=[TariffServiceCreateSchema(price=Decimal("10"), tax=Decimal("0.2"), tariff_id=test_tariff.id)]
+            )
+        )
+        matching = await services_repo.create(
+            data=ServiceCreateSchema(
+                name="B Consular",
+                fee_type=FeeTypeEnum.CONSULAR,
+                country_id=order_criteria["country_id"],
+                visa_type_id=order_criteria["visa_type_id"],
+                tariff_services=[TariffServiceCreateSchema(price=Decimal("30"), tax=Decimal("0"), tariff_id=test_tariff.id)]
+            )
+        )
+        # Bound to another urgency, so it is not applicable
+        await services_repo.create(
+            data=ServiceCreateSchema(
+                name="C Urgent",
+                fee_type=FeeTypeEnum.GENERAL,
+                urgency_id=other_urgency.id,
+                tariff_services=[TariffServiceCreateSchema(price=Decimal("50"), tax=Decimal("0"), tariff_id=test_tariff.id)]
+            )
+        )
+
+        response = await async_client.get(
+            url=app.url_path_for("admin:quote"),
+            params={"client_id": client.id, **order_criteria},
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["client_id"] == client.id
+        assert data["tariff_id"] == test_tariff.id
+        assert [item["service"]["id"] for item in data["services"]] == [generic.id, matching.id]
+        active_rows = await services_repo.tariffs_repo.get_price_rows(tariff_id=test_tariff.id)
+        assert [item["id"] for item in data["services"]] == [row.id for row in active_rows[:2]]
+        assert data["services"][0]["MODEL_TYPE"] == TariffService.get_model_type()
+        assert Decimal(data["services"][0]["tax_amount"]) == Decimal("2")
+        assert Decimal(data["price"]) == Decimal("40")
+        assert Decimal(data["tax_amount"]) == Decimal("2")
+        assert Decimal(data["total"]) == Decimal("42")
+
+    @pytest.mark.asyncio
+    async def test_quote_invalidated_on_service_update(
+            self,
+            app: FastAPI,
+            async_client: AsyncClient,
+            access_token: str,
+            client_maker,
+            services_repo: ServicesRepository,
+            test_tariff: Tariff,
+            order_criteria: dict[str, int],
+    ) -> None:
+        client: Client = await client_maker(type=ClientTypeEnum.LEGAL)
+        service = await services_repo.create(
+            data=ServiceCreateSchema(
+                name="Generic",
+                fee_type=FeeTypeEnum.GENERAL,
+                tariff_services=[TariffServiceCreateSchema(price=Decimal("10"), tax=Decimal("0"), tariff_id=test_tariff.id)]
+            )
+        )
+        params = {"client_id": client.id, **order_criteria}
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        response = await async_client.get(url=app.url_path_for("admin:quote"), params=params, headers=headers)
+        assert Decimal(response.json()["total"]) == Decimal("10")
+        assert await price_quote_service.cache.get(test_tariff.id) is not None
+
+        await services_repo.update(
+            service_id=service.id,
+            data=ServiceUpdateSchema(
+                tariff_services=[TariffServiceUpdateSchema(price=Decimal("15"), tax=Decimal("0"), tariff_id=test_tariff.id)]
+            )
+        )
+        assert await price_quote_service.cache.get(test_tariff.id) is None
+
+        response = await async_client.get(url=app.url_path_for("admin:quote"), params=params, headers=headers)
+        assert Decimal(response.json()["total"]) == Decimal("15")
+
+    @pytest.mark.asyncio
+    async def test_quote_client_not_found(
+            self,
+            app: FastAPI,
+            async_client: AsyncClient,
+            access_token: str,
+            order_criteria: dict[str, int],
+    ) -> None:
+        response = await async_client.get(
+            url=app.url_path_for("admin:quote"),
+            params={"client_id": 1000, **order_criteria},
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json() == {"detail": "Client not found"}
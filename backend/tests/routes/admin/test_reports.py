@@ -0,0 +1,112 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import OrderService, User, VisaDuration
+from app.schemas.order.base import OrderStatusEnum
+from app.schemas.service import FeeTypeEnum
+from app.services import jwt_service
+from tests.conftest import (
+    OrderMakerProtocol,
+    CountryMakerProtocol,
+    UrgencyMakerProtocol,
+    VisaTypeMakerProtocol,
+    VisaDurationMakerProtocol
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestAdminReportsRoutes:
+
+    @pytest.fixture
+    def access_token(self, test_admin: User) -> str:
+        return jwt_service.create_token_pair(user=test_admin).access
+
+    @pytest.fixture
+    def make_order_services(
+            self,
+            async_db: AsyncSession,
+            order_maker: OrderMakerProtocol,
+            country_maker: CountryMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            test_individual: User,
+            urgency_maker: UrgencyMakerProtocol,
+            service_maker,
+            test_admin: User
+    ):
+        async def inner() -> None:
+            order = await order_maker(
+                country=await country_maker(name="Russia", alpha2="RU", alpha3="RUS"),
+                client=await test_individual.awaitable_attrs.individual_client,
+                created_by=test_admin,
+                urgency=await urgency_maker(),
+                visa_duration=await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY),
+                visa_type=await visa_type_maker(name="Business"),
+                status=OrderStatusEnum.NEW
+            )
+
+            for fee_type, price in ((FeeTypeEnum.CONSULAR, "100"), (FeeTypeEnum.GENERAL, "50")):
+                service = await service_maker(fee_type=fee_type)
+                async_db.add(
+                    OrderService(price=Decimal(price), tax=Decimal("0.2"), order_id=order.id, service_id=service.id)
+                )
+
+            await async_db.commit()
+
+        return inner
+
+    async def test_revenue_report(
+            self,
+            app: FastAPI,
+            async_client: AsyncClient,
+            make_order_services,
+            access_token: str
+    ) -> None:
+        await make_order_services()
+        response = await async_client.get(
+            url=app.url_path_for("admin:reports-revenue"),
+            params={"group_by": ["month", "fee_type"]},
+            headers={
+                "Authorization": f"Bearer {access_token}"
+            }
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["month_to"] == date.today().replace(day=1).isoformat()
+        assert response.json()["total"] == "180.00"
+        assert [(item["fee_type"], item["total"]) for item in response.json()["items"]] == [
+            (FeeTypeEnum.CONSULAR.value, "120.00"),
+            (FeeTypeEnum.GENERAL.value, "60.00"),
+        ]
+
+    async def test_revenue_report_export(
+            self,
+            app: FastAPI,
+            async_client: AsyncClient,
+            make_order_services,
+            access_token: str
+    ) -> None:
+        await make_order_services()
+        month = date.today().replace(day=1)
+        response = await async_client.get(
+            url=app.url_path_for("admin:reports-revenue-export"),
+            params={"group_by": ["month", "fee_type"]},
+            headers={
+                "Authorization": f"Bearer {access_token}"
+            }
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "attachment" in response.headers["content-disposition"]
+        assert response.text.splitlines() == [
+            "month,fee_type,services,revenue,tax,total",
+            f"{month.isoformat()},consular,1,100.00,20.00,120.00",
+            f"{month.isoformat()},general,1,50.00,10.00,60.00",
+        ]
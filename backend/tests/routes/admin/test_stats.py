@@ -0,0 +1,80 @@
+from datetime import date
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+
+from app.models import User, VisaDuration
+from app.schemas.order.base import OrderStatusEnum
+from app.services import jwt_service
+from tests.conftest import (
+    OrderMakerProtocol,
+    CountryMakerProtocol,
+    UrgencyMakerProtocol,
+    VisaTypeMakerProtocol,
+    VisaDurationMakerProtocol
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestAdminStatsRoutes:
+
+    @pytest.fixture
+    def access_token(self, test_admin: User) -> str:
+        return jwt_service.create_token_pair(user=test_admin).access
+
+    async def test_order_stats(
+            self,
+            app: FastAPI,
+            async_client: AsyncClient,
+            order_maker: OrderMakerProtocol,
+            country_maker: CountryMakerProtocol,
+            visa_duration_maker: VisaDurationMakerProtocol,
+            visa_type_maker: VisaTypeMakerProtocol,
+            test_individual: User,
+            urgency_maker: UrgencyMakerProtocol,
+            test_admin: User,
+            access_token: str
+    ) -> None:
+        country = await country_maker(name="Russia", alpha2="RU", alpha3="RUS")
+        urgency = await urgency_maker()
+        visa_duration = await visa_duration_maker(term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY)
+        visa_type = await visa_type_maker(name="Business")
+        client = await test_individual.awaitable_attrs.individual_client
+
+        for order_status in (OrderStatusEnum.NEW, OrderStatusEnum.NEW, OrderStatusEnum.COMPLETED):
+            await order_maker(
+                country=country,
+                client=client,
+                created_by=test_admin,
+                urgency=urgency,
+                visa_duration=visa_duration,
+                visa_type=visa_type,
+                status=order_status
+            )
+
+        response = await async_client.get(
+            url=app.url_path_for("admin:stats-orders"),
+            params={"group_by": ["day", "status"], "country_id": country.id},
+            headers={
+                "Authorization": f"Bearer {access_token}"
+            }
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["total"] == 3
+        assert response.json()["date_to"] == date.today().isoformat()
+        assert response.json()["items"] == [
+            {
+                "day": date.today().isoformat(),
+                "status": status_value,
+                "country_id": None,
+                "visa_type_id": None,
+                "urgency_id": None,
+                "client_id": None,
+                "orders": orders,
+            }
+            for status_value, orders in ((OrderStatusEnum.COMPLETED.value, 1), (OrderStatusEnum.NEW.value, 2))
+        ]
+
@@ -91,12 +91,15 @@ class TestUrgencies:
             headers={"Authorization": f"Bearer {token_pair.access}"},
             json={
                 "name": "Express 3 days",
+                "processing_hours": 72,
             }
         )
         assert response.status_code == status.HTTP_201_CREATED
         assert response.json()["name"] == "Express 3 days"
+        assert response.json()["processing_hours"] == 72
         urgency_in_db = await urgencies_repo.get_by_id(urgency_id=response.json().get("id"))
         assert urgency_in_db.name == "Express 3 days"
+        assert urgency_in_db.processing_hours == 72
 
         audit_repo = AuditRepository(async_db)
         log_entries = await audit_repo.get_for_user(user_id=test_admin.id)
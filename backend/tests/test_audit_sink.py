@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app import config
+from app.database.repositories.audit import AuditRepository
+from app.models import LogEntry
+from app.schemas.audit import LogEntryCreateSchema
+from app.services import audit_sink
+from app.services.audit import AuditSink
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestAuditSink:
+
+    @pytest.fixture
+    def session_factory(self, async_db_engine) -> async_sessionmaker:
+        return async_sessionmaker(bind=async_db_engine, class_=AsyncSession, expire_on_commit=False)
+
+    @staticmethod
+    async def count_entries(session_factory: async_sessionmaker) -> int:
+        async with session_factory() as session:
+            return await session.scalar(select(func.count()).select_from(LogEntry))
+
+    async def test_flush_on_batch_size_and_stop(self, session_factory: async_sessionmaker) -> None:
+        sink = AuditSink(batch_size=2, flush_interval=60)
+        sink.start(session_factory=session_factory)
+
+        for target_id in range(2):
+            sink.enqueue(LogEntryCreateSchema(action=LogEntry.ACTION_CREATE, model_type="order", target_id=target_id))
+
+        # The first full batch is written without waiting for the interval
+        for _ in range(50):
+            if await self.count_entries(session_factory) == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        assert await self.count_entries(session_factory) == 2
+
+        sink.enqueue(LogEntryCreateSchema(action=LogEntry.ACTION_CREATE, model_type="order", target_id=2))
+        await asyncio.sleep(0.05)
+        assert await self.count_entries(session_factory) == 2
+
+        await sink.stop()
+
+        assert not sink.is_running
+        assert await self.count_entries(session_factory) == 3
+
+    async def test_entries_wait_for_start(self, session_factory: async_sessionmaker) -> None:
+        sink = AuditSink(batch_size=1, flush_interval=60)
+        sink.enqueue(LogEntryCreateSchema(action=LogEntry.ACTION_CREATE, model_type="order", target_id=1))
+
+        assert await sink.flush() == 0
+        assert sink.buffer_size == 1
+
+        sink.start(session_factory=session_factory)
+        await sink.stop()
+
+        assert await self.count_entries(session_factory) == 1
+
+    async def test_create_enqueues_when_sink_running(
+            self,
+            async_db: AsyncSession,
+            session_factory: async_sessionmaker
+    ) -> None:
+        audit_sink.start(session_factory=session_factory)
+
+        try:
+            entry = await AuditRepository(async_db).create(data=LogEntryCreateSchema(action=LogEntry.ACTION_LOGIN))
+            assert entry is None
+            assert await self.count_entries(session_factory) == 0
+        finally:
+            await audit_sink.stop()
+
+        assert await self.count_entries(session_factory) == 1
+
+    async def test_create_strict_mode(
+            self,
+            async_db: AsyncSession,
+            session_factory: async_sessionmaker,
+            monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(config, "AUDIT_STRICT_MODE", True)
+        audit_sink.start(session_factory=session_factory)
+
+        try:
+            entry = await AuditRepository(async_db).create(data=LogEntryCreateSchema(action=LogEntry.ACTION_LOGIN))
+            # Written in the caller's transaction, not committed yet
+            assert entry.id is not None
+            assert await self.count_entries(session_factory) == 0
+        finally:
+            await audit_sink.stop()
+
+        await async_db.commit()
+        assert await self.count_entries(session_factory) == 1
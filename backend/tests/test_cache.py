@@ -0,0 +1,280 @@
+import asyncio
+import fnmatch
+import time
+from decimal import Decimal
+from typing import Any, Optional
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.instrumentation import QueryStats, query_stats
+from app.database.repositories.urgencies import UrgenciesRepository
+from app.schemas.urgency import UrgencyUpdateSchema
+from app.services.cache import MISSING, CacheService, LocalCache, RedisBackend
+from app.services.price_quote import PriceQuoteService
+from app.services.tariff_version import TariffVersionService
+from tests.conftest import UrgencyMakerProtocol
+
+
+class FakeRedisServer:
+    """In-memory stand-in of a Redis server, shared by the clients of several workers."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, tuple[bytes, Optional[float]]] = {}
+        self.subscribers: dict[str, list[asyncio.Queue]] = {}
+        self.available = True
+
+    def client(self) -> "FakeRedis":
+        return FakeRedis(self)
+
+
+class FakeRedis:
+    """The subset of `redis.asyncio.Redis` used by `RedisBackend`."""
+
+    def __init__(self, server: FakeRedisServer) -> None:
+        self.server = server
+
+    def _check(self) -> None:
+        if not self.server.available:
+            raise ConnectionError("Connection refused")
+
+    async def get(self, key: str) -> Optional[bytes]:
+        self._check()
+        value, expires_at = self.server.values.get(key, (None, None))
+
+        if expires_at is not None and expires_at <= time.monotonic():
+            return None
+
+        return value
+
+    async def set(self, key: str, value: bytes, px: Optional[int] = None) -> None:
+        self._check()
+        self.server.values[key] = (value, time.monotonic() + px / 1000 if px is not None else None)
+
+    async def delete(self, *keys: str) -> None:
+        self._check()
+
+        for key in keys:
+            self.server.values.pop(key, None)
+
+    async def scan_iter(self, match: str):
+        self._check()
+
+        for key in list(self.server.values):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    async def publish(self, channel: str, message: str) -> None:
+        self._check()
+
+        for queue in self.server.subscribers.get(channel, []):
+            queue.put_nowait({"type": "message", "channel": channel, "data": message.encode()})
+
+    def pubsub(self) -> "FakePubSub":
+        return FakePubSub(self.server)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class FakePubSub:
+
+    def __init__(self, server: FakeRedisServer) -> None:
+        self.server = server
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.channels: list[str] = []
+
+    async def subscribe(self, channel: str) -> None:
+        self.server.subscribers.setdefault(channel, []).append(self.queue)
+        self.channels.append(channel)
+
+    async def get_message(self, ignore_subscribe_messages: bool, timeout: float) -> Optional[dict[str, Any]]:
+        try:
+            async with asyncio.timeout(timeout):
+                return await self.queue.get()
+        except TimeoutError:
+            return None
+
+    async def aclose(self) -> None:
+        for channel in self.channels:
+            self.server.subscribers[channel].remove(self.queue)
+
+
+async def delivered() -> None:
+    """Let the invalidation listeners handle the published messages."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+class TestLocalCache:
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        cache = LocalCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is MISSING
+        assert cache.get("c") == 3
+
+    def test_entries_expire(self) -> None:
+        cache = LocalCache(ttl=0.05)
+        cache.set("a", None)
+        cache.set("b", 2, ttl=60)
+
+        assert cache.get("a") is None
+
+        time.sleep(0.1)
+
+        assert cache.get("a") is MISSING
+        assert cache.get("b") == 2
+        assert len(cache) == 1
+
+    def test_delete_prefix(self) -> None:
+        cache = LocalCache()
+        cache.set("urgencies:list", [])
+        cache.set("urgencies:1", {})
+        cache.set("countries:list", [])
+        cache.delete_prefix("urgencies:")
+
+        assert cache.get("countries:list") == []
+        assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+class TestRedisBackend:
+
+    @pytest.fixture
+    def server(self) -> FakeRedisServer:
+        return FakeRedisServer()
+
+    async def workers(self, server: FakeRedisServer, count: int = 2) -> list[CacheService]:
+        services = [CacheService(RedisBackend(server.client(), near_ttl=60)) for _ in range(count)]
+
+        for service in services:
+            await service.backend.start()
+
+        return services
+
+    async def test_values_are_shared(self, server: FakeRedisServer) -> None:
+        first, second = await self.workers(server)
+        await first.namespace("quotes").set(1, {"total": "10.00"})
+
+        assert await second.namespace("quotes").get(1) == {"total": "10.00"}
+        assert await second.namespace("quotes").get(2) is None
+
+        await first.close()
+        await second.close()
+
+    async def test_writes_invalidate_near_caches(self, server: FakeRedisServer) -> None:
+        first, second = await self.workers(server)
+        namespace = first.namespace("urgencies")
+        await namespace.set("list", ["Standard"])
+        # Kept in the near cache of the second worker
+        assert await second.namespace("urgencies").get("list") == ["Standard"]
+
+        await namespace.set("list", ["Standard", "Express"])
+        await delivered()
+
+        assert await second.namespace("urgencies").get("list") == ["Standard", "Express"]
+
+        await namespace.clear()
+        await delivered()
+
+        assert await second.namespace("urgencies").get("list") is None
+        assert server.values == {}
+
+        await first.close()
+        await second.close()
+
+    async def test_unavailable_server(self, server: FakeRedisServer) -> None:
+        (service,) = await self.workers(server, count=1)
+        namespace = service.namespace("urgencies")
+        server.available = False
+        calls = []
+
+        async def load() -> list[str]:
+            calls.append(1)
+            return ["Standard"]
+
+        assert await namespace.get_or_set("list", load) == ["Standard"]
+        service.reset_local()
+        assert await namespace.get_or_set("list", load) == ["Standard"]
+        assert len(calls) == 2
+
+        await service.close()
+
+
+class FakeTariffsRepository:
+    """The price rows of one version of a tariff, as read by `PriceQuoteService`."""
+
+    def __init__(self, rows: list[tuple]) -> None:
+        self.rows = rows
+        self.loads = 0
+
+    async def get_active_version_id(self, *, tariff_id: int) -> Optional[int]:
+        return 1
+
+    async def get_price_rows(self, *, version_id: Optional[int] = None) -> list[tuple]:
+        self.loads += 1
+        return self.rows
+
+
+def price_row(service_name: str) -> tuple:
+    return 1, 1, 1, Decimal(10), Decimal(0), Decimal(0), Decimal(10), 1, service_name, "general", None, None, None, None
+
+
+@pytest.mark.asyncio
+class TestSharedPriceTables:
+
+    async def test_invalidate_drops_the_tables_of_every_worker(self) -> None:
+        server = FakeRedisServer()
+        caches = [CacheService(RedisBackend(server.client(), near_ttl=60)) for _ in range(2)]
+
+        for cache in caches:
+            await cache.backend.start()
+
+        first, second = (PriceQuoteService(TariffVersionService(), cache) for cache in caches)
+        tariffs_repo = FakeTariffsRepository([price_row("Consular fee")])
+        criteria: dict[str, Any] = {"country_id": None, "urgency_id": None, "visa_duration_id": None, "visa_type_id": None}
+
+        await first.get_table(tariffs_repo=tariffs_repo, tariff_id=1)  # type: ignore[arg-type]
+        table = await second.get_table(tariffs_repo=tariffs_repo, tariff_id=1)  # type: ignore[arg-type]
+        assert [row.service_name for row in table.match(**criteria)] == ["Consular fee"]
+        assert tariffs_repo.loads == 1
+
+        # Renaming a service keeps the tariff version
+        tariffs_repo.rows = [price_row("Embassy fee")]
+        await first.invalidate(tariff_id=1)
+        await delivered()
+
+        table = await second.get_table(tariffs_repo=tariffs_repo, tariff_id=1)  # type: ignore[arg-type]
+        assert [row.service_name for row in table.match(**criteria)] == ["Embassy fee"]
+        assert tariffs_repo.loads == 2
+
+        for cache in caches:
+            await cache.close()
+
+
+@pytest.mark.asyncio
+class TestCachedRepository:
+
+    async def test_urgency_list(self, async_db: AsyncSession, urgency_maker: UrgencyMakerProtocol) -> None:
+        urgency = await urgency_maker(name="Standard", processing_hours=48)
+        repo = UrgenciesRepository(async_db)
+        stats = QueryStats()
+        token = query_stats.set(stats)
+
+        try:
+            assert await repo.get_cached_list() == [{"id": urgency.id, "name": "Standard", "processing_hours": 48}]
+            assert await repo.get_cached_list() == [{"id": urgency.id, "name": "Standard", "processing_hours": 48}]
+        finally:
+            query_stats.reset(token)
+
+        assert stats.statements == 1
+
+        await repo.update(urgency_id=urgency.id, data=UrgencyUpdateSchema(name="Express"))
+
+        assert await repo.get_cached_list() == [{"id": urgency.id, "name": "Express", "processing_hours": 48}]
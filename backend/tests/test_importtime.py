@@ -0,0 +1,50 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+# Imported on first use only: mail, password hashing and token signing stacks, and tooling
+LAZY_MODULES = {"fastapi_mail", "aiosmtplib", "jinja2", "passlib", "jwt", "cryptography", "mypy", "mypyc"}
+
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| +(\S+)")
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Import `module` in a fresh interpreter and return the cumulative import time of each module (µs)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=Path(__file__).parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {
+        match.group(3): int(match.group(2))
+        for match in map(IMPORT_TIME_LINE.match, result.stderr.splitlines())
+        if match
+    }
+
+
+class TestImportTime:
+
+    def test_application_cold_start(self) -> None:
+        times = import_times("app.api.server")
+
+        eager = sorted({name for name in times if name.split(".")[0] in LAZY_MODULES})
+        # Wall-clock import time depends on the load of the machine, so only what is imported is checked
+        assert eager == []
+
+    def test_mail_is_configured_on_first_use(self) -> None:
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                "import sys; from app import config; assert 'fastapi_mail' not in sys.modules; "
+                "assert config.fm_mail.config is config.mail_config; print(config.mail_config.MAIL_FROM)"
+            ],
+            cwd=Path(__file__).parents[1],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip()
@@ -0,0 +1,61 @@
+import pytest
+from sqlalchemy.orm import Load
+
+from app.database.loaders import JOINED, SELECTIN, LoaderRegistry
+from app.models import Client, Order, Service
+from app.schemas.client import ClientPublicSchema
+from app.schemas.order.admin import AdminOrderListSchema
+from app.schemas.service import ServiceResponseSchema
+
+
+def paths(options: list[Load]) -> list[str]:
+    """Describe each option as its chain of `strategy:relationship` steps."""
+    described = []
+
+    for option in options:
+        steps = [
+            f"{dict(load.strategy)['lazy']}:{load.path[-2].key}"
+            for load in option.context
+        ]
+        described.append(" > ".join(steps))
+
+    return described
+
+
+class TestLoaderRegistry:
+
+    def test_scalar_relations_are_joined(self) -> None:
+        options = LoaderRegistry().options(Order, AdminOrderListSchema)
+
+        assert sorted(paths(options)) == [
+            "joined:client > joined:tariff",
+            "joined:country",
+            "joined:created_by",
+            "joined:urgency",
+            "joined:visa_duration",
+            "joined:visa_type",
+        ]
+
+    def test_collections_are_selectin_loaded(self) -> None:
+        options = LoaderRegistry().options(Service, ServiceResponseSchema)
+
+        assert paths(options) == ["selectin:tariff_services > joined:tariff"]
+
+    def test_registered_strategies_override_defaults(self) -> None:
+        registry = LoaderRegistry()
+        registry.register(Client, ClientPublicSchema, strategies={"tariff": SELECTIN})
+
+        assert paths(registry.options(Client, ClientPublicSchema)) == ["selectin:tariff"]
+
+        registry.register(Client, ClientPublicSchema, strategies={"tariff": JOINED})
+
+        assert paths(registry.options(Client, ClientPublicSchema)) == ["joined:tariff"]
+
+    def test_options_are_cached(self) -> None:
+        registry = LoaderRegistry()
+
+        assert registry.options(Order, AdminOrderListSchema) is registry.options(Order, AdminOrderListSchema)
+
+    def test_unknown_strategy(self) -> None:
+        with pytest.raises(ValueError, match="subquery"):
+            LoaderRegistry().register(Client, ClientPublicSchema, strategies={"tariff": "subquery"})
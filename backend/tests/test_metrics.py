@@ -0,0 +1,100 @@
+import re
+import threading
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app import metrics
+from app.database.instrumentation import InstrumentedQueuePool, instrument_pool
+from app.metrics import Counter, Gauge, Histogram, Registry
+from app.models import User
+from app.services import jwt_service
+
+
+class TestMetrics:
+
+    def test_histogram_render(self) -> None:
+        registry = Registry()
+        histogram = Histogram("latency_seconds", "Latency", labelnames=("route",), buckets=(0.1, 1), registry=registry)
+        histogram.observe(0.05, route="/a")
+        histogram.observe(0.1, route="/a")
+        histogram.observe(5, route="/a")
+
+        assert registry.render().splitlines() == [
+            "# HELP latency_seconds Latency",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{route="/a",le="0.1"} 2',
+            'latency_seconds_bucket{route="/a",le="1"} 2',
+            'latency_seconds_bucket{route="/a",le="+Inf"} 3',
+            'latency_seconds_sum{route="/a"} 5.15',
+            'latency_seconds_count{route="/a"} 3',
+        ]
+
+    def test_values_summed_over_threads(self) -> None:
+        registry = Registry()
+        counter = Counter("jobs_total", "Jobs", registry=registry)
+        threads = [threading.Thread(target=lambda: [counter.inc() for _ in range(1000)]) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.inc()
+
+        assert counter.collect() == {(): [4001.0]}
+
+    def test_gauge_function(self) -> None:
+        gauge = Gauge("pool_size", "Pool size", registry=Registry())
+        gauge.set_function(lambda: 5)
+
+        assert list(gauge.render())[-1] == "pool_size 5"
+
+    def test_gauge_functions_by_labels(self) -> None:
+        gauge = Gauge("pool_size", "Pool size", labelnames=("pool",), registry=Registry())
+        gauge.set_function(lambda: 5, pool="primary")
+        gauge.set_function(lambda: 2, pool="replica")
+
+        assert list(gauge.render())[2:] == ['pool_size{pool="primary"} 5', 'pool_size{pool="replica"} 2']
+
+    def test_pools_reported_apart(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Fresh gauges, so the pools of the application are still reported by the others
+        for name in ("db_pool_size", "db_pool_checked_out", "db_pool_overflow"):
+            monkeypatch.setattr(metrics, name, Gauge(name, "Pool", labelnames=("pool",), registry=Registry()))
+
+        primary = create_async_engine(
+            "postgresql+asyncpg://localhost/primary", poolclass=InstrumentedQueuePool, pool_size=3, pool_logging_name="primary"
+        )
+        replica = create_async_engine(
+            "postgresql+asyncpg://localhost/replica", poolclass=InstrumentedQueuePool, pool_size=7, pool_logging_name="replica"
+        )
+        instrument_pool(primary)
+        instrument_pool(replica)
+
+        sizes = metrics.db_pool_size.collect()
+        assert sizes[("primary",)] == [3.0]
+        assert sizes[("replica",)] == [7.0]
+
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint(self, app: FastAPI, async_client: AsyncClient, test_admin: User) -> None:
+        response = await async_client.get(
+            url=app.url_path_for("admin:user-detail", user_id=test_admin.id),
+            headers={"Authorization": f"Bearer {jwt_service.create_token_pair(user=test_admin).access}"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await async_client.get(url=app.url_path_for("metrics"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/plain")
+        body = response.text
+        assert re.search(
+            r'^http_request_duration_seconds_count\{method="GET",route="/api/admin/users/\{user_id\}",status="200"\} [1-9]',
+            body,
+            re.MULTILINE
+        )
+        # test_admin is created with a password hashed in the bcrypt pool
+        assert re.search(r'^bcrypt_duration_seconds_count\{operation="hash"\} [1-9]', body, re.MULTILINE)
+        assert "http_requests_in_flight 1" in body
+        assert 'db_pool_checked_out{pool="primary"}' in body
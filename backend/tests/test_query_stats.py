@@ -0,0 +1,53 @@
+import re
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.instrumentation import QueryStats, query_stats
+from app.models import User
+from app.services import jwt_service
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestQueryStats:
+
+    async def test_server_timing_header(
+            self,
+            app: FastAPI,
+            async_client: AsyncClient,
+            test_admin: User,
+    ) -> None:
+        response = await async_client.get(
+            url=app.url_path_for("admin:user-list"),
+            headers={"Authorization": f"Bearer {jwt_service.create_token_pair(user=test_admin).access}"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        match = re.search(r'db;dur=[\d.]+;desc="(\d+) queries, (\d+) rows"', response.headers["Server-Timing"])
+        assert match is not None
+        # Token blacklist, current user, count and page
+        assert int(match.group(1)) >= 4
+        assert int(match.group(2)) >= 1
+        assert "app;dur=" in response.headers["Server-Timing"]
+
+    async def test_repeated_shapes(self, async_db: AsyncSession, test_admin: User) -> None:
+        stats = QueryStats(track_shapes=True)
+        token = query_stats.set(stats)
+
+        try:
+            for _ in range(3):
+                await async_db.execute(select(User.email).where(User.id == test_admin.id))
+            await async_db.execute(select(User.id))
+        finally:
+            query_stats.reset(token)
+
+        assert stats.statements == 4
+        assert stats.rows == 4
+        repeated = stats.repeated_shapes(threshold=3)
+        assert len(repeated) == 1
+        assert repeated[0][1] == 3
+        assert "users.email" in repeated[0][0]
@@ -0,0 +1,124 @@
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy import event, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.config import DATABASE_URL
+from app.database.db import ReadOnlySession, get_replica_session, get_shared_replica_session
+from app.models import Urgency
+from app.models.users import User
+from app.services import jwt_service
+from tests.conftest import CountryMakerProtocol
+
+pytestmark = pytest.mark.asyncio
+
+
+class Replica:
+    """The test database reached through a second engine, under another host name, standing in
+    for a streaming replica."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+        self.statements: list[str] = []
+        self.Session = sessionmaker(
+            bind=engine, class_=AsyncSession, sync_session_class=ReadOnlySession, expire_on_commit=False
+        )
+        event.listen(engine.sync_engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append(statement)
+
+
+@pytest_asyncio.fixture
+async def replica(async_client: AsyncClient, app: FastAPI) -> AsyncGenerator[Replica, None]:
+    url = make_url(f"{DATABASE_URL}_test")
+    url = url.set(host="localhost" if url.host == "127.0.0.1" else "127.0.0.1")
+    replica = Replica(create_async_engine(url, poolclass=NullPool))
+
+    async def override_get_replica_session():
+        async with replica.Session() as session:
+            yield session
+
+    app.dependency_overrides[get_replica_session] = override_get_replica_session
+    yield replica
+    await replica.engine.dispose()
+
+
+class TestReplicaRouting:
+
+    async def test_reads_use_the_replica(
+            self,
+            app: FastAPI,
+            async_client: AsyncClient,
+            replica: Replica,
+            test_user: User,
+            country_maker: CountryMakerProtocol,
+    ) -> None:
+        await country_maker(name="Germany", alpha2="DE", alpha3="DEU", available_for_order=True)
+        token_pair = jwt_service.create_token_pair(user=test_user)
+
+        response = await async_client.get(
+            url=app.url_path_for("reference:country-list"),
+            headers={"Authorization": f"Bearer {token_pair.access}"},
+        )
+
+        assert response.status_code == 200
+        assert [country["name"] for country in response.json()] == ["Germany"]
+        assert any("FROM countries" in statement for statement in replica.statements)
+
+    async def test_writes_use_the_primary(
+            self,
+            app: FastAPI,
+            async_client: AsyncClient,
+            replica: Replica,
+            test_admin: User,
+    ) -> None:
+        token_pair = jwt_service.create_token_pair(user=test_admin)
+        headers = {"Authorization": f"Bearer {token_pair.access}"}
+
+        response = await async_client.post(
+            url=app.url_path_for("admin:urgency-create"), headers=headers, json={"name": "Express 3 days"}
+        )
+
+        assert response.status_code == 201
+        assert replica.statements == []
+
+        response = await async_client.get(
+            url=app.url_path_for("admin:urgency-detail", urgency_id=response.json()["id"]), headers=headers
+        )
+
+        assert response.status_code == 200
+        assert response.json()["name"] == "Express 3 days"
+        assert replica.statements != []
+
+    async def test_replica_session_is_read_only(self, replica: Replica) -> None:
+        async with replica.Session() as session:
+            session.add(Urgency(name="Standard"))
+
+            with pytest.raises(RuntimeError, match="read-only"):
+                await session.flush()
+
+    async def test_replica_session_without_replica_is_read_only(self, async_db: AsyncSession) -> None:
+        """Test that sharing the connection of the request session keeps replica reads read-only"""
+        sessions = get_shared_replica_session(db=async_db)
+        session = await anext(sessions)
+
+        assert session is not async_db
+        connection = await session.connection()
+        assert connection.sync_connection is (await async_db.connection()).sync_connection
+
+        session.add(Urgency(name="Standard"))
+
+        with pytest.raises(RuntimeError, match="read-only"):
+            await session.flush()
+
+        # Closed with the request, leaving the connection to the request session
+        await sessions.aclose()
+        assert (await async_db.scalars(select(Urgency))).all() == []
@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import config
+from app.database.repositories.countries import CountriesRepository
+from app.database.repositories.users import UsersRepository
+from app.database.search import escape_like, name_search
+from app.models import Country, User
+from app.schemas.country import CountryFilterSchema
+from app.schemas.pagination import PageParamsSchema
+from app.schemas.user import UserFilterSchema
+from tests.conftest import CountryMakerProtocol
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_escape_like() -> None:
+    assert escape_like("100%_off\\") == "100\\%\\_off\\\\"
+
+
+def test_ranked_search() -> None:
+    sql = compile_sql(select(Country.id).where(name_search(Country.name, "germny", ranked=True)))
+
+    assert "countries.name ILIKE" in sql
+    assert "<%% countries.name" in sql
+
+
+def test_ranked_ordering(monkeypatch: pytest.MonkeyPatch) -> None:
+    repo = CountriesRepository(db=None)  # type: ignore[arg-type]
+
+    assert repo.default_order_by(query_filters=CountryFilterSchema(name="germny")) == [Country.id]
+
+    monkeypatch.setattr(config, "SEARCH_SIMILARITY", True)
+    ordering = repo.default_order_by(query_filters=CountryFilterSchema(name="germny"))
+
+    assert "word_similarity" in compile_sql(ordering[0])
+    assert ordering[1] is Country.id
+    assert repo.default_order_by(query_filters=CountryFilterSchema()) == [Country.id]
+
+
+@pytest.mark.asyncio
+class TestNameSearch:
+
+    async def test_wildcards_match_themselves(self, async_db: AsyncSession, country_maker: CountryMakerProtocol) -> None:
+        await country_maker(name="Germany", alpha2="DE", alpha3="DEU")
+        await country_maker(name="Guinea_Bissau", alpha2="GW", alpha3="GNB")
+        repo = CountriesRepository(async_db)
+
+        countries = await repo.get_full_list(query_filters=CountryFilterSchema(name="_"))
+
+        assert [country.name for country in countries] == ["Guinea_Bissau"]
+
+    async def test_user_full_name(self, async_db: AsyncSession, test_admin: User) -> None:
+        repo = UsersRepository(async_db)
+
+        for name, total in (("max smith", 1), ("Smi", 1), ("Smith Max", 0)):
+            result = await repo.get_paginated_list(
+                query_filters=UserFilterSchema(name=name), page_params=PageParamsSchema(page=1, size=10)
+            )
+
+            assert result["total"] == total, name
+
+    async def test_similar_names_are_ranked(
+            self,
+            async_db: AsyncSession,
+            country_maker: CountryMakerProtocol,
+            monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        if not await async_db.scalar(text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")):
+            pytest.skip("pg_trgm is not available")
+
+        await async_db.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await country_maker(name="Germany", alpha2="DE", alpha3="DEU")
+        await country_maker(name="German East Africa", alpha2="GE", alpha3="GEA")
+        await country_maker(name="France", alpha2="FR", alpha3="FRA")
+        monkeypatch.setattr(config, "SEARCH_SIMILARITY", True)
+        repo = CountriesRepository(async_db)
+
+        countries = await repo.get_full_list(query_filters=CountryFilterSchema(name="germny"))
+
+        assert [country.name for country in countries][0] == "Germany"
+        assert "France" not in [country.name for country in countries]
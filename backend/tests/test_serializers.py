@@ -0,0 +1,153 @@
+import json
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from app.models import (
+    Applicant,
+    Client,
+    Country,
+    Order,
+    Service,
+    Tariff,
+    TariffService,
+    Urgency,
+    User,
+    VisaDuration,
+    VisaType,
+)
+from app.schemas.country import CountryListResponseSchema
+from app.schemas.order.admin import AdminOrderDetailSchema, AdminOrderPaginatedListSchema
+from app.schemas.serializers import get_serializer
+from app.schemas.service import ServiceListResponseSchema
+
+NOW = datetime(2025, 3, 4, 5, 6, 7, 890123)
+
+
+def page(items: list) -> dict:
+    return {
+        "page": 1,
+        "size": len(items),
+        "total": len(items),
+        "total_pages": 1,
+        "has_next": False,
+        "has_prev": False,
+        "items": items,
+    }
+
+
+def make_orders(count: int) -> list[Order]:
+    """Build transient orders with every relation of the admin order schemas set."""
+    country = Country(id=1, name="Russia", alpha2="RU", alpha3="RUS", available_for_order=True)
+    user = User(
+        id=1,
+        first_name="Admin",
+        last_name="User",
+        email="admin@example.com",
+        role=User.ROLE_ADMIN,
+        is_active=True,
+        email_verified=True,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+    client = Client(id=1, name="Client", type=Client.TYPE_LEGAL, email="client@example.com", tariff_id=1)
+    urgency = Urgency(id=1, name="Standard")
+    visa_duration = VisaDuration(id=1, name="1 month", term=VisaDuration.TERM_1, entry=VisaDuration.SINGLE_ENTRY)
+    visa_type = VisaType(id=1, name="Business")
+    orders = []
+
+    for index in range(1, count + 1):
+        order = Order(
+            id=index,
+            status=Order.STATUS_NEW,
+            number=f"2025-{index:04d}",
+            country=country,
+            client=client,
+            created_by=user,
+            urgency=urgency,
+            visa_duration=visa_duration,
+            visa_type=visa_type,
+            created_at=NOW + timedelta(minutes=index),
+            updated_at=NOW + timedelta(minutes=index),
+            completed_at=NOW if index % 2 else None,
+        )
+        order.applicant = Applicant(
+            id=index,
+            first_name="John", last_name="Doe", email="john@example.com", gender=Applicant.GENDER_MALE
+        )
+        orders.append(order)
+
+    return orders
+
+
+class TestFastSerializer:
+
+    def test_order_page_matches_schema(self) -> None:
+        result = page(make_orders(3))
+
+        expected = AdminOrderPaginatedListSchema.model_validate(result).model_dump(mode="json")
+
+        assert get_serializer(AdminOrderPaginatedListSchema)(result) == expected
+        assert expected["items"][0]["created_at"] == "2025-03-04 05:07:07"
+        assert expected["items"][1]["completed_at"] is None
+
+    def test_order_detail_matches_schema(self) -> None:
+        order = make_orders(1)[0]
+
+        expected = AdminOrderDetailSchema.model_validate(order).model_dump(mode="json")
+
+        assert get_serializer(AdminOrderDetailSchema)(order) == expected
+        assert expected["applicant"]["first_name"] == "John"
+
+    def test_service_page_matches_schema(self) -> None:
+        tariff = Tariff(id=1, name="Default", is_default=True)
+        service = Service(id=1, name="Consular fee", fee_type=Service.FEE_TYPE_CONSULAR, created_at=NOW, updated_at=NOW)
+        tariff_service = TariffService(price=Decimal("10.50"), tax=Decimal("0.2"), tariff_id=1, service_id=1)
+        tariff_service.id = 1
+        tariff_service.tariff = tariff
+        service.tariff_services = [tariff_service]
+        result = page([service])
+
+        expected = ServiceListResponseSchema.model_validate(result).model_dump(mode="json")
+
+        assert get_serializer(ServiceListResponseSchema)(result) == expected
+        assert expected["items"][0]["tariff_services"][0]["price"] == "10.50"
+
+    def test_country_page_matches_schema(self) -> None:
+        result = page([Country(id=1, name="Russia", alpha2="RU", alpha3="RUS", available_for_order=False)])
+
+        expected = CountryListResponseSchema.model_validate(result).model_dump(mode="json")
+
+        assert get_serializer(CountryListResponseSchema)(result) == expected
+
+    def test_order_page_speedup(self) -> None:
+        """A 100 row order page renders at least twice as fast as with validation and json.dumps."""
+        result = page(make_orders(100))
+        serializer = get_serializer(AdminOrderPaginatedListSchema)
+
+        def validated() -> bytes:
+            data = AdminOrderPaginatedListSchema.model_validate(result).model_dump(mode="json")
+            return json.dumps(jsonable_encoder(data)).encode()
+
+        def fast() -> bytes:
+            return orjson.dumps(serializer(result))
+
+        assert json.loads(validated()) == json.loads(fast())
+
+        def best_of(function, rounds: int = 5, runs: int = 10) -> float:
+            timings = []
+
+            for _ in range(rounds):
+                started = time.perf_counter()
+
+                for _ in range(runs):
+                    function()
+
+                timings.append(time.perf_counter() - started)
+
+            return min(timings)
+
+        assert best_of(validated) / best_of(fast) >= 2
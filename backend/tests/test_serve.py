@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from app import metrics, serve
+from app.api.server import drain_background_tasks
+
+
+class TestServe:
+
+    def test_defaults(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(serve.config, "WEB_CONCURRENCY", 0)
+        monkeypatch.setattr(serve, "default_workers", lambda: 6)
+
+        options = serve.server_options(serve.parse_args([]))
+
+        assert options["workers"] == 6
+        assert options["backlog"] == serve.config.SERVER_BACKLOG
+        assert options["timeout_keep_alive"] == serve.config.SERVER_KEEP_ALIVE_SECONDS
+        assert options["timeout_graceful_shutdown"] == serve.config.SERVER_GRACEFUL_SHUTDOWN_SECONDS
+        assert options["limit_concurrency"] is None
+        assert options["access_log"] is False
+
+    def test_arguments(self) -> None:
+        options = serve.server_options(serve.parse_args([
+            "--workers", "2", "--port", "9000", "--keep-alive", "120", "--limit-concurrency", "500"
+        ]))
+
+        assert options["workers"] == 2
+        assert options["port"] == 9000
+        assert options["timeout_keep_alive"] == 120
+        assert options["limit_concurrency"] == 500
+
+    def test_optional_event_loop_and_parser(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(serve, "_installed", lambda module: False)
+
+        options = serve.server_options(serve.parse_args([]))
+
+        assert (options["loop"], options["http"]) == ("asyncio", "h11")
+
+        monkeypatch.setattr(serve, "_installed", lambda module: True)
+
+        options = serve.server_options(serve.parse_args([]))
+
+        assert (options["loop"], options["http"]) == ("uvloop", "httptools")
+
+    def test_main_imports_the_application_before_starting(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls = []
+        monkeypatch.setattr(serve.uvicorn, "run", lambda app, **options: calls.append((app, options["workers"])))
+
+        assert serve.main(["--workers", "3"]) == 0
+        assert calls == [(serve.APP, 3)]
+
+
+@pytest.mark.asyncio
+class TestDrainBackgroundTasks:
+
+    async def test_waits_for_pending_tasks(self) -> None:
+        metrics.background_tasks_pending.inc()
+
+        async def finish() -> None:
+            await asyncio.sleep(0.1)
+            metrics.background_tasks_pending.dec()
+
+        task = asyncio.create_task(finish())
+
+        assert await drain_background_tasks(timeout=5, interval=0.01) is True
+        assert task.done()
+
+    async def test_timeout(self) -> None:
+        metrics.background_tasks_pending.inc()
+
+        try:
+            assert await drain_background_tasks(timeout=0.05, interval=0.01) is False
+        finally:
+            metrics.background_tasks_pending.dec()